@@ -1,4 +1,6 @@
 import copy
+import math
+from collections import deque
 
 from osil_parser.osil_var import OSILVariable
 from osil_parser.osil_obj import OSILObjective
@@ -6,7 +8,7 @@ from osil_parser.osil_expressions import *
 from osil_parser.osil_parser import *
 
 
-def reformulate_osil_parser_to_1d(orig_parser):
+def reformulate_osil_parser_to_1d(orig_parser: OSILParser) -> tuple[int, OSILParser]:
     """
     This method is dedicated to take an osil parser object and reformulate all its nonlinear constraints
     into linear constraints or one-dimensional reformulations
@@ -16,133 +18,538 @@ def reformulate_osil_parser_to_1d(orig_parser):
     """
     # check for suitable input
     assert check_reformulate_input(orig_parser)
-    parser = copy.deepcopy(orig_parser)
-
-    # initialize necessary parameters
-    n_new_variables = 0
-    # extract the initial indices of the non-linear functions
-    nl_indices = list(parser.nl_constraints.keys())
-
-    # iterate over nonlinear constraints, reformulate nonlinear constraints as long as there are some
-    for index in nl_indices:
-        # extract current non-linearity
-        nl = parser.nl_constraints[index]
-
-        # sanity check for already handled objects
-        assert isinstance(nl, (OSILSum, OSILProduct, OSILSquare, OSILPower, OSILCosine, OSILSine, OSILNegate,
-                               OSILDivide, OSILSquareroot, OSILExp, OSILAbs, OSILLn, OSILLog10, OSILSignPower)), \
-            f"non-linearity was not implemented yet"
-
-        if isinstance(nl, (OSILSquare, OSILCosine, OSILSine, OSILNegate, OSILSquareroot, OSILExp, OSILAbs, OSILLn,
-                           OSILLog10)):
-            # check if its argument expression is a variable or a coefficient; TODO: make it dependent on type of nl
-            if isinstance(nl.expression, (float, int, OSILVariable)):
-                # if argument is coefficient or variable -> nothing needs to be re-formulated
-                continue
-            else:
-                new_variable_index, n_new_variables, nl_indices = single_reformulation(parser, n_new_variables,
-                                                                                       nl.expression, nl_indices)
-                # manipulate the current non-linearity such that it is non-linearity(new variable)
-                nl.expression = new_variable_index
-
-        elif isinstance(nl, (OSILSum,)):
-            # iterate through every summand and apply above
-            for entity_index, entity in enumerate(nl.sum_entities):
-                # if entity is Summand, it is variable and/or coefficient, so nothing to do
-                if isinstance(entity, (OSILSummand,)):
-                    continue
-                else:
-                    new_variable_index, n_new_variables, nl_indices = single_reformulation(parser, n_new_variables,
-                                                                                           entity, nl_indices)
-                    new_summand = OSILSummand(new_variable_index, 1.0, 1)
-                    new_summand.compute_bounds(parser.variables)
-                    nl.sum_entities[entity_index] = new_summand
-
-        elif isinstance(nl, (OSILProduct,)):
-            # first substitute all general non-linear expressions with variables
-            variable_factor_indices = []
-            for factor_index, factor in enumerate(nl.factors):
-                # if factor is OSILFactor, it is variable and/or coefficient, so just count variable here
-                if isinstance(factor, (OSILFactor,)):
-                    if factor.variable_index is not None:
-                        variable_factor_indices.append(factor_index)
-                else:
-                    # create a new variable for the expression and add it to parser as well as to product as OSILFactor
-                    new_variable_index, n_new_variables, nl_indices = single_reformulation(parser, n_new_variables,
-                                                                                           factor, nl_indices)
-                    new_factor = OSILFactor(new_variable_index, 1.0, 1)
-                    new_factor.compute_bounds(parser.variables)
-                    nl.factors[factor_index] = new_factor
-                    variable_factor_indices.append(factor_index)
-
-            # second create a new variable for each pair such that we only end up with z = x * y constraints
-            while len(variable_factor_indices) > 2:
-                # take the last two indices and extract factor elements
-                factor_1_index = variable_factor_indices.pop()#[-1]
-                factor_2_index = variable_factor_indices.pop()#[-2]
-                factor_1 = nl.factors[factor_1_index]
-                factor_2 = nl.factors[factor_2_index]
-                # create a new product element
-                sub_product = OSILProduct([factor_1, factor_2], 2)
-                sub_product.compute_bounds(parser.variables)
-                # create the new constraint
-                new_variable_index, n_new_variables, nl_indices = single_reformulation(parser, n_new_variables,
-                                                                                       sub_product, nl_indices)
-                # create a factor object for the newly created variable
-                new_factor = OSILFactor(new_variable_index, 1.0, 1)
-                new_factor.compute_bounds(parser.variables)
-                # delete the old factors
-                del nl.factors[factor_1_index]
-                del nl.factors[factor_2_index]
-                # add new factor and respective index
-                new_factor_index = len(nl.factors)
-                nl.factors.append(new_factor)
-                variable_factor_indices.append(new_factor_index)
-
-        elif isinstance(nl, (OSILPower,)):
-            # check if base is a variable or a coefficient
-            if not isinstance(nl.expression, (float, int)):
-                new_variable_index, n_new_variables, nl_indices = single_reformulation(parser, n_new_variables,
-                                                                                       nl.expression, nl_indices)
-                # manipulate the current non-linearity such that it is non-linearity(new variable); TODO:check!!
-                nl.expression = new_variable_index
-
-            # check if the exponent is a variable or a coefficient
-            if not isinstance(nl.exponent, (float, int)):
-                new_variable_index, n_new_variables, nl_indices = single_reformulation(parser, n_new_variables,
-                                                                                       nl.exponent, nl_indices)
-                # manipulate the current non-linearity such that it is non-linearity(new variable); TODO: check!!
-                nl.exponent = new_variable_index
-
-        elif isinstance(nl, (OSILDivide,)):
-            # replace numerator with variable if not a variable or a coefficient
-            if not isinstance(nl.numerator, (float, int)):
-                new_variable_index, n_new_variables, nl_indices = single_reformulation(parser, n_new_variables,
-                                                                                       nl.numerator, nl_indices)
-                # manipulate the current non-linearity such that it is non-linearity(new variable)
-                nl.numerator = new_variable_index
-
-            # replace denominator with variable if not a variable or a coefficient
-            if not isinstance(nl.denominator, (float, int)):
-                new_variable_index, n_new_variables, nl_indices = single_reformulation(parser, n_new_variables,
-                                                                                       nl.denominator, nl_indices)
-                # manipulate the current non-linearity such that it is non-linearity(new variable)
-                nl.denominator = new_variable_index
-
-            # if the denominator is not just a coefficient, replace the fraction x/y by a variable z and re-arrange to
-            # a new non-linearity z * y == x
-            n_new_variables = reformulate_fraction(parser, n_new_variables, index, nl)
-
-        elif isinstance(nl, (OSILSignPower,)):
-            # signpower is only implemented for variables and coefficients
+    # shallow structural clone instead of a full deepcopy; mutated nl nodes are copied on demand below
+    parser = orig_parser.clone()
+
+    # initialize the counters and the worklist of non-linear constraint indices
+    state = _ReformulationState(parser)
+    first_new_variable = state.next_variable_index
+    first_new_constraint = state.next_constraint_index
+
+    # process the worklist of nonlinear constraints, reformulate nonlinear constraints as long as there are some
+    worklist = state.worklist
+    while worklist:
+        index, nl = worklist.popleft()
+        # copy the node before mutation such that the original tree stays intact
+        nl = copy.copy(nl)
+        # flatten nested sums/products, fold double negations and constants before dispatching
+        nl = _normalize_nl(nl)
+        if type(nl) is float:
+            # the whole non-linearity folded to a constant; absorb it into the constraint bounds
+            name, lower, upper = parser.constraint_infos[index]
+            parser.constraint_infos[index] = (name,
+                                              None if lower is None else lower - nl,
+                                              None if upper is None else upper - nl)
+            del parser.nl_constraints[index]
             continue
-        else:
-            assert f"UNKNOWN OSIL EXPRESSION"
+        parser.nl_constraints[index] = nl
+
+        # dispatch via the per-class handler table; unknown classes were not implemented yet
+        handler = _REFORMULATION_HANDLERS.get(type(nl))
+        assert handler is not None, f"non-linearity was not implemented yet"
+        handler(parser, state, index, nl)
+
+    # drop the unused tail of the preallocated variable and constraint slots
+    del parser.variables[state.next_variable_index:]
+    del parser.constraint_infos[state.next_constraint_index:]
+
+    # batch-generate the auxiliary names in one pass instead of formatting two strings per reformulation;
+    # both name families are determined by position alone
+    for aux_number, variable in enumerate(parser.variables[first_new_variable:], start=1):
+        variable.name = "aux" + str(aux_number)
+    for constraint_index in range(first_new_constraint, state.next_constraint_index):
+        info = parser.constraint_infos[constraint_index]
+        parser.constraint_infos[constraint_index] = ("e" + str(constraint_index + 1), info[1], info[2])
+
+    # compact the remaining purely linear sums into arrays; they are final at this point
+    original_nl_constraints = orig_parser.nl_constraints
+    for index, nl in parser.nl_constraints.items():
+        if type(nl) is OSILSum:
+            if nl is original_nl_constraints.get(index):
+                # purely linear sums are filtered out of the worklist and thus never copied; copy before
+                # packing so the original tree keeps its summand objects
+                nl = copy.copy(nl)
+                parser.nl_constraints[index] = nl
+            nl.pack()
+
+    return state.n_new_variables, parser
+
+
+# shared placeholder info for the y == expression constraints; tuples are immutable, so one instance suffices
+_EQUALITY_CONSTRAINT_INFO = ("", 0.0, 0.0)
 
-    return n_new_variables, parser
+# union of the non-linear expression node classes handled by this pass; annotating against it keeps the module
+# statically typed enough for ahead-of-time compilers such as mypyc or cython
+OSILNode = (OSILSum | OSILProduct | OSILSquare | OSILPower | OSILCosine | OSILSine | OSILNegate | OSILDivide
+            | OSILSquareroot | OSILExp | OSILAbs | OSILLn | OSILLog10 | OSILSignPower)
+
+
+class _ReformulationState(object):
+    """
+    small mutable container for the counters and the worklist of the 1d reformulation pass
+
+    The variable and constraint counters are hoisted out of single_reformulation such that the hot path increments
+    integers instead of re-computing len(parser.variables) and len(parser.constraint_infos) per created variable
+    """
+
+    def __init__(self, parser: OSILParser) -> None:
+        self.n_new_variables = 0
+        # explicit fifo worklist of (constraint index, non-linearity) pairs still to process;
+        # single_reformulation pushes newly created pairs while the main loop pops from the front;
+        # already-atomic non-linearities are filtered out up front so the loop only does real work
+        self.worklist = deque(item for item in parser.nl_constraints.items() if _needs_reformulation(item[1]))
+        # bind the parser containers once; every reformulation then reads a state slot instead of going
+        # through parser attribute lookups
+        self.variables = parser.variables
+        self.constraint_infos = parser.constraint_infos
+        self.lin_coeffs = parser.lin_coeffs
+        self.quad_coeffs = parser.quad_coeffs
+        self.nl_constraints = parser.nl_constraints
+        self.next_variable_index = len(parser.variables)
+        self.next_constraint_index = len(parser.constraint_infos)
+        # cache of structural subtree keys to auxiliary variable indices for common subexpression elimination
+        self.cse_cache = {}
+        # grow the variable and constraint lists once up front instead of append-doubling them in the hot loop;
+        # the estimate is an upper bound on the auxiliary entities, the unused tail is dropped after the pass
+        estimated_entities = sum(_count_new_entities(nl) for nl in parser.nl_constraints.values())
+        if estimated_entities > 0:
+            parser.variables.extend([None] * estimated_entities)
+            parser.constraint_infos.extend([None] * estimated_entities)
+
+
+def _needs_reformulation(nl: OSILNode) -> bool:
+    """
+    decide whether a non-linearity requires any reformulation work at all; atomic nodes (signpowers, unary
+    non-linearities over a variable or coefficient, powers with atomic base and exponent, sums and small products
+    of plain summands/factors) are skipped by the worklist entirely
+
+    :param nl: the non-linear expression node to inspect
+    :return: True if the node has to be processed, else False
+    """
+    node_class = type(nl)
+    if node_class is OSILSignPower:
+        return False
+    if node_class is OSILSum:
+        return any(entity.KIND == KIND_EXPR for entity in nl.sum_entities)
+    if node_class is OSILProduct:
+        n_variable_factors = 0
+        for factor in nl.factors:
+            if factor.KIND == KIND_EXPR:
+                return True
+            if factor.variable_index is not None:
+                n_variable_factors += 1
+        return n_variable_factors > 2
+    if node_class is OSILPower:
+        return (getattr(nl.expression, "KIND", KIND_CONST) != KIND_CONST
+                or getattr(nl.exponent, "KIND", KIND_CONST) != KIND_CONST)
+    if node_class is OSILDivide:
+        # a fraction is always re-arranged to z * denominator == numerator
+        return True
+    # remaining classes are the unary non-linearities with a single argument expression
+    return getattr(nl.expression, "KIND", KIND_CONST) == KIND_EXPR
+
+
+def _count_new_entities(nl: OSILNode) -> int:
+    """
+    estimate an upper bound on the number of auxiliary variables (each coming with one equality constraint)
+    the reformulation of a single non-linearity creates
 
+    :param nl: the non-linear expression node to inspect
+    :return: the estimated number of new variables as integer
+    """
+    node_class = type(nl)
+    if node_class is OSILSum:
+        return sum(1 + _count_new_entities(entity) for entity in nl.sum_entities if entity.KIND == KIND_EXPR)
+    if node_class is OSILProduct:
+        count = sum(1 + _count_new_entities(factor) for factor in nl.factors if factor.KIND == KIND_EXPR)
+        # the pairing cascade creates one additional variable per reduction step
+        return count + max(len(nl.factors) - 2, 0)
+    if node_class in (OSILPower, OSILDivide):
+        children = (nl.expression, nl.exponent) if node_class is OSILPower else (nl.numerator, nl.denominator)
+        # a divide additionally introduces the fraction variable z with z * denominator == numerator
+        count = 0 if node_class is OSILPower else 1
+        for child in children:
+            child_kind = getattr(child, "KIND", KIND_CONST)
+            if child_kind != KIND_CONST:
+                count += 1
+            if child_kind == KIND_EXPR:
+                count += _count_new_entities(child)
+        return count
+    if node_class is OSILSignPower:
+        return 0
+    # remaining classes are the unary non-linearities with a single argument expression
+    if getattr(nl.expression, "KIND", KIND_CONST) == KIND_EXPR:
+        return 1 + _count_new_entities(nl.expression)
+    return 0
+
+
+def _normalize_nl(nl: OSILNode) -> OSILNode | float:
+    """
+    normalize a non-linearity before its reformulation: splice the entities of nested sums into the parent sum,
+    the factors of nested products into the parent product, fold double negations, and partially evaluate
+    fully-constant subtrees down to plain floats. This avoids reifying redundant auxiliary variables for
+    sub-expressions the parent node can absorb directly.
+    Nodes are shallow-copied before mutation such that the original tree stays intact.
+
+    :param nl: the non-linear expression node to normalize
+    :return: the normalized node, or a plain float if the whole subtree is constant
+    """
+    node_class = type(nl)
+    if node_class is OSILSum:
+        if nl.packed:
+            # a packed sum carries no summand objects anymore; it is purely linear, treat it as opaque
+            return nl
+        flattened = []
+        changed = False
+        for entity in nl.sum_entities:
+            normalized = _normalize_nl(entity) if entity.KIND == KIND_EXPR else entity
+            if type(normalized) is float:
+                # the child folded to a constant; keep it as a constant summand
+                constant = OSILSummand(None, normalized, 1)
+                constant.lower_bound = constant.upper_bound = normalized
+                flattened.append(constant)
+                changed = True
+            elif type(normalized) is OSILSum and not normalized.packed:
+                # splice the nested sum into the parent instead of reifying it to an aux variable
+                flattened.extend(normalized.sum_entities)
+                changed = True
+            else:
+                changed = changed or normalized is not entity
+                flattened.append(normalized)
+        if all(type(entity) is OSILSummand and entity.variable_index is None for entity in flattened):
+            # every summand is a plain constant, fold the whole sum
+            return float(sum(entity.coefficient for entity in flattened))
+        if changed:
+            nl = copy.copy(nl)
+            nl.sum_entities = flattened
+    elif node_class is OSILProduct:
+        flattened = []
+        changed = False
+        for factor in nl.factors:
+            normalized = _normalize_nl(factor) if factor.KIND == KIND_EXPR else factor
+            if type(normalized) is float:
+                # the child folded to a constant; keep it as a constant factor
+                constant = OSILFactor(None, normalized, 1)
+                constant.lower_bound = constant.upper_bound = normalized
+                flattened.append(constant)
+                changed = True
+            elif type(normalized) is OSILProduct:
+                # splice the nested product into the parent instead of reifying it to an aux variable
+                flattened.extend(normalized.factors)
+                changed = True
+            else:
+                changed = changed or normalized is not factor
+                flattened.append(normalized)
+        if all(type(factor) is OSILFactor and factor.variable_index is None for factor in flattened):
+            # every factor is a plain constant, fold the whole product
+            folded = 1.0
+            for factor in flattened:
+                folded *= factor.coefficient
+            return folded
+        if changed:
+            nl = copy.copy(nl)
+            nl.factors = flattened
+    elif node_class is OSILNegate:
+        expression = nl.expression
+        if getattr(expression, "KIND", KIND_CONST) == KIND_EXPR:
+            normalized = _normalize_nl(expression)
+            if type(normalized) is float:
+                # fold the negation of a constant
+                return -normalized
+            if type(normalized) is OSILNegate and getattr(normalized.expression, "KIND", KIND_CONST) == KIND_EXPR:
+                # fold the double negation -(-x) down to x
+                return normalized.expression
+            if normalized is not expression:
+                nl = copy.copy(nl)
+                nl.expression = normalized
+    elif node_class is OSILPower:
+        base = nl.expression
+        exponent = nl.exponent
+        if getattr(base, "KIND", KIND_CONST) == KIND_EXPR:
+            normalized = _normalize_nl(base)
+            if normalized is not base:
+                # a power accepts a plain float base, so a folded constant can be stored directly
+                nl = copy.copy(nl)
+                nl.expression = normalized
+                nl.expression_kind = KIND_CONST if type(normalized) is float else KIND_EXPR
+                base = normalized
+        if getattr(exponent, "KIND", KIND_CONST) == KIND_EXPR:
+            normalized = _normalize_nl(exponent)
+            if normalized is not exponent:
+                nl = copy.copy(nl)
+                nl.exponent = normalized
+                nl.exponent_kind = KIND_CONST if type(normalized) is float else KIND_EXPR
+                exponent = normalized
+        if type(base) is float and type(exponent) is float:
+            # both children constant (an int would be a variable index), fold along the eval semantics
+            return float((nl.base_coefficient * base) ** (nl.exponent_coefficient * exponent))
+    elif node_class is OSILDivide:
+        numerator = nl.numerator
+        denominator = nl.denominator
+        if getattr(numerator, "KIND", KIND_CONST) == KIND_EXPR:
+            normalized = _normalize_nl(numerator)
+            if normalized is not numerator:
+                # a divide accepts a plain float child, so a folded constant can be stored directly
+                nl = copy.copy(nl)
+                nl.numerator = normalized
+                nl.numerator_kind = KIND_CONST if type(normalized) is float else KIND_EXPR
+                numerator = normalized
+        if getattr(denominator, "KIND", KIND_CONST) == KIND_EXPR:
+            normalized = _normalize_nl(denominator)
+            if normalized is not denominator:
+                nl = copy.copy(nl)
+                nl.denominator = normalized
+                nl.denominator_kind = KIND_CONST if type(normalized) is float else KIND_EXPR
+                denominator = normalized
+        if type(numerator) is float and type(denominator) is float:
+            # both children constant (an int would be a variable index), fold along the eval semantics
+            return float((nl.numerator_coefficient * numerator) / (nl.denominator_coefficient * denominator))
+    elif node_class in _UNARY_CONSTANT_FOLDS:
+        expression = nl.expression
+        if nl.expression_kind == KIND_EXPR:
+            normalized = _normalize_nl(expression)
+            if type(normalized) is float:
+                # the argument folded to a constant, fold the unary node along its eval semantics
+                return float(_UNARY_CONSTANT_FOLDS[node_class](nl, normalized))
+            if (node_class is OSILLn and type(normalized) is OSILExp and nl.coefficient == 1.0
+                    and normalized.coefficient == 1.0 and normalized.expression_kind == KIND_EXPR):
+                # ln(exp(x)) collapses to x when neither node scales its argument
+                return normalized.expression
+            if (node_class is OSILExp and type(normalized) is OSILLn and nl.coefficient == 1.0
+                    and normalized.coefficient == 1.0 and normalized.expression_kind == KIND_EXPR):
+                # exp(ln(x)) collapses to x when neither node scales its argument
+                return normalized.expression
+            if node_class is OSILSquareroot and type(normalized) is OSILSquare:
+                # sqrt((c*x)^2) collapses to |c*x|; an expression-shaped abs argument carries no
+                # coefficient in eval, so that form is only taken for a sign-free inner coefficient
+                if normalized.expression_kind == KIND_VAR:
+                    return OSILAbs(normalized.expression, nl.get_level(), abs(normalized.coefficient))
+                if normalized.coefficient in (1.0, -1.0):
+                    return OSILAbs(normalized.expression, nl.get_level())
+            if (node_class is OSILLog10 and type(normalized) is OSILPower
+                    and normalized.expression_kind == KIND_CONST and normalized.expression == 10.0
+                    and normalized.base_coefficient == 1.0 and normalized.exponent_coefficient == 1.0
+                    and normalized.exponent_kind == KIND_EXPR):
+                # log10(10**x) collapses to x when the power scales neither base nor exponent
+                return normalized.exponent
+            if normalized is not expression:
+                nl = copy.copy(nl)
+                nl.expression = normalized
+    return nl
+
+
+# constant folding of the unary non-linearities, mirroring the eval semantics for an expression-shaped
+# argument (abs, log10 and sqrt apply no coefficient there, exactly like their eval)
+_UNARY_CONSTANT_FOLDS = {
+    OSILSquare: lambda nl, value: (nl.coefficient * value) ** 2,
+    OSILCosine: lambda nl, value: math.cos(nl.coefficient * value),
+    OSILSine: lambda nl, value: math.sin(nl.coefficient * value),
+    OSILExp: lambda nl, value: math.exp(nl.coefficient * value),
+    OSILAbs: lambda nl, value: abs(value),
+    OSILLn: lambda nl, value: math.log(nl.coefficient * value),
+    OSILLog10: lambda nl, value: math.log10(value),
+    OSILSquareroot: lambda nl, value: math.sqrt(value),
+}
+
+
+def _structural_key(nl: OSILNode | OSILLinearTerm | int | float) -> tuple | float | None:
+    """
+    build a hashable key describing a non-linearity structurally (class, coefficients and variable indices of the
+    whole subtree) via a post-order walk; structurally identical subtrees yield equal keys, which lets
+    single_reformulation share one auxiliary variable between them. Returns None for nodes that cannot be keyed
 
-def check_reformulate_input(parser):
+    :param nl: the non-linear expression node (or an atomic int/float child) to describe
+    :return: a hashable key, or None if the node shall not be shared
+    """
+    # atomic children: a variable index is tagged to keep it distinct from an equal-valued coefficient
+    if isinstance(nl, (int,)) and not isinstance(nl, bool):
+        return "v", nl
+    if isinstance(nl, (float,)):
+        return nl
+    node_class = type(nl)
+    if node_class is OSILLinearTerm:
+        return node_class.__name__, nl.variable_index, nl.coefficient
+    if node_class is OSILSum:
+        if nl.packed:
+            # packed sums describe their summands through the arrays
+            coefs, vidx = nl._linear_terms
+            return ("OSILSum",) + tuple(("OSILLinearTerm", int(index), float(coefficient))
+                                        for index, coefficient in zip(vidx, coefs))
+        child_keys = tuple(_structural_key(entity) for entity in nl.sum_entities)
+        return ("OSILSum",) + child_keys if None not in child_keys else None
+    if node_class is OSILProduct:
+        child_keys = tuple(_structural_key(factor) for factor in nl.factors)
+        return ("OSILProduct",) + child_keys if None not in child_keys else None
+    if node_class is OSILPower:
+        base_key = _structural_key(nl.expression)
+        exponent_key = _structural_key(nl.exponent)
+        if base_key is None or exponent_key is None:
+            return None
+        return "OSILPower", nl.base_coefficient, nl.exponent_coefficient, base_key, exponent_key
+    if node_class is OSILDivide:
+        numerator_key = _structural_key(nl.numerator)
+        denominator_key = _structural_key(nl.denominator)
+        if numerator_key is None or denominator_key is None:
+            return None
+        return ("OSILDivide", nl.numerator_constant, nl.numerator_coefficient, nl.denominator_coefficient,
+                numerator_key, denominator_key)
+    if node_class is OSILSignPower:
+        return "OSILSignPower", nl.base, nl.exponent
+    if node_class in (OSILSquare, OSILCosine, OSILSine, OSILExp, OSILAbs, OSILLn):
+        child_key = _structural_key(nl.expression)
+        if child_key is None:
+            return None
+        return node_class.__name__, nl.coefficient, child_key
+    if node_class in (OSILNegate, OSILSquareroot, OSILLog10):
+        child_key = _structural_key(nl.expression)
+        if child_key is None:
+            return None
+        return node_class.__name__, child_key
+    return None
+
+
+def _reformulate_unary(parser: OSILParser, state: _ReformulationState, index: int, nl: OSILNode) -> None:
+    """reformulate a non-linearity with a single argument expression (square, trig, negate, sqrt, exp, abs, logs)"""
+    # check if its argument expression is a variable or a coefficient; TODO: make it dependent on type of nl
+    if getattr(nl.expression, "KIND", KIND_CONST) != KIND_EXPR:
+        # if argument is coefficient or variable -> nothing needs to be re-formulated
+        return
+
+    # manipulate the current non-linearity such that it is non-linearity(new variable)
+    nl.expression = single_reformulation(parser, state, nl.expression)
+    nl.expression_kind = KIND_VAR
+
+
+def _reformulate_sum(parser: OSILParser, state: _ReformulationState, index: int, nl: OSILSum) -> None:
+    """reformulate a sum by substituting every non-summand entity with a new variable"""
+    # copy the entity list as it is mutated in place
+    nl.sum_entities = list(nl.sum_entities)
+    # iterate through every summand and apply above
+    for entity_index, entity in enumerate(nl.sum_entities):
+        # if entity is Summand, it is variable and/or coefficient, so nothing to do
+        if entity.KIND != KIND_EXPR:
+            continue
+        else:
+            new_variable_index = single_reformulation(parser, state, entity)
+            # the aux variable carries exactly the entity's bounds, so hand them over without a list lookup
+            new_summand = OSILSummand.from_aux_variable(new_variable_index, entity.lower_bound, entity.upper_bound)
+            nl.sum_entities[entity_index] = new_summand
+
+
+def _reformulate_product(parser: OSILParser, state: _ReformulationState, index: int, nl: OSILProduct) -> None:
+    """reformulate a product down to pairwise z = x * y constraints"""
+    # copy the factor list as it is mutated in place
+    nl.factors = list(nl.factors)
+    # first substitute all general non-linear expressions with variables
+    variable_factor_indices = []
+    for factor_index, factor in enumerate(nl.factors):
+        # if factor is OSILFactor, it is variable and/or coefficient, so just count variable here
+        if factor.KIND != KIND_EXPR:
+            if factor.variable_index is not None:
+                variable_factor_indices.append(factor_index)
+        else:
+            # create a new variable for the expression and add it to parser as well as to product as OSILFactor
+            new_variable_index = single_reformulation(parser, state, factor)
+            new_factor = OSILFactor.from_aux_variable(new_variable_index, factor.lower_bound, factor.upper_bound)
+            nl.factors[factor_index] = new_factor
+            variable_factor_indices.append(factor_index)
+
+    # second create a new variable for each pair such that we only end up with z = x * y constraints
+    if len(variable_factor_indices) > 2:
+        # reduce the variable factors on a separate stack instead of deleting from nl.factors in place,
+        # as every del on the factor list shifts all trailing elements
+        pair_stack = [nl.factors[factor_index] for factor_index in variable_factor_indices]
+        while len(pair_stack) > 2:
+            # take the last two factors from the stack
+            factor_1 = pair_stack.pop()
+            factor_2 = pair_stack.pop()
+            # create a new product element
+            sub_product = OSILProduct([factor_1, factor_2], 2)
+            # fuse the interval arithmetic for the pair instead of re-descending via compute_bounds;
+            # both factors already carry bounds (computed at parse time or right after creation)
+            lb_1 = -np.inf if factor_1.lower_bound is None else factor_1.lower_bound
+            ub_1 = np.inf if factor_1.upper_bound is None else factor_1.upper_bound
+            lb_2 = -np.inf if factor_2.lower_bound is None else factor_2.lower_bound
+            ub_2 = np.inf if factor_2.upper_bound is None else factor_2.upper_bound
+            corners = (lb_1 * lb_2, lb_1 * ub_2, ub_1 * lb_2, ub_1 * ub_2)
+            current_lb = min(corners)
+            current_ub = max(corners)
+            if current_lb > -np.inf:
+                sub_product.lower_bound = current_lb
+            if current_ub < np.inf:
+                sub_product.upper_bound = current_ub
+            # create the new constraint
+            new_variable_index = single_reformulation(parser, state, sub_product)
+            # create a factor object for the newly created variable and put it back on the stack
+            new_factor = OSILFactor.from_aux_variable(new_variable_index,
+                                                      sub_product.lower_bound, sub_product.upper_bound)
+            pair_stack.append(new_factor)
+
+        # rebuild the factor list from the untouched (constant) factors and the reduced stack
+        variable_factor_set = set(variable_factor_indices)
+        nl.factors = [factor for factor_index, factor in enumerate(nl.factors)
+                      if factor_index not in variable_factor_set] + pair_stack
+
+
+def _reformulate_power(parser: OSILParser, state: _ReformulationState, index: int, nl: OSILPower) -> None:
+    """reformulate a power by substituting non-atomic base and exponent with new variables"""
+    # check if base is a variable or a coefficient
+    if getattr(nl.expression, "KIND", KIND_CONST) != KIND_CONST:
+        # manipulate the current non-linearity such that it is non-linearity(new variable); TODO:check!!
+        nl.expression = single_reformulation(parser, state, nl.expression)
+        nl.expression_kind = KIND_VAR
+
+    # check if the exponent is a variable or a coefficient
+    if getattr(nl.exponent, "KIND", KIND_CONST) != KIND_CONST:
+        # manipulate the current non-linearity such that it is non-linearity(new variable); TODO: check!!
+        nl.exponent = single_reformulation(parser, state, nl.exponent)
+        nl.exponent_kind = KIND_VAR
+
+
+def _reformulate_divide(parser: OSILParser, state: _ReformulationState, index: int, nl: OSILDivide) -> None:
+    """reformulate a fraction x/y via a variable z and a new non-linearity z * y == x"""
+    # replace numerator with variable if not a variable or a coefficient
+    if getattr(nl.numerator, "KIND", KIND_CONST) != KIND_CONST:
+        # manipulate the current non-linearity such that it is non-linearity(new variable)
+        nl.numerator = single_reformulation(parser, state, nl.numerator)
+        nl.numerator_kind = KIND_VAR
+
+    # replace denominator with variable if not a variable or a coefficient
+    if getattr(nl.denominator, "KIND", KIND_CONST) != KIND_CONST:
+        # manipulate the current non-linearity such that it is non-linearity(new variable)
+        nl.denominator = single_reformulation(parser, state, nl.denominator)
+        nl.denominator_kind = KIND_VAR
+
+    # if the denominator is not just a coefficient, replace the fraction x/y by a variable z and re-arrange to
+    # a new non-linearity z * y == x
+    reformulate_fraction(parser, state, index, nl)
+
+
+def _reformulate_signpower(parser: OSILParser, state: _ReformulationState, index: int, nl: OSILSignPower) -> None:
+    """signpower is only implemented for variables and coefficients, so nothing needs to be re-formulated"""
+    return
+
+
+# handler table mapping each non-linearity class to its reformulation; gives constant-time dispatch in the main loop
+_REFORMULATION_HANDLERS = {
+    OSILSquare: _reformulate_unary,
+    OSILCosine: _reformulate_unary,
+    OSILSine: _reformulate_unary,
+    OSILNegate: _reformulate_unary,
+    OSILSquareroot: _reformulate_unary,
+    OSILExp: _reformulate_unary,
+    OSILAbs: _reformulate_unary,
+    OSILLn: _reformulate_unary,
+    OSILLog10: _reformulate_unary,
+    OSILSum: _reformulate_sum,
+    OSILProduct: _reformulate_product,
+    OSILPower: _reformulate_power,
+    OSILDivide: _reformulate_divide,
+    OSILSignPower: _reformulate_signpower,
+}
+
+
+def check_reformulate_input(parser: OSILParser) -> bool:
     """
     Checking if the argument is indeed an osil parser object and certain parameters are given
 
@@ -156,88 +563,112 @@ def check_reformulate_input(parser):
     return True
 
 
-def single_reformulation(parser, n_new_variables, argument, nl_indices):
+def single_reformulation(parser: OSILParser, state: _ReformulationState, argument: OSILNode) -> int:
     """
     creates a variable, say y, and adds it to the parser alongside a constraint saying y == argument, where 'argument'
     is the argument of the current non-linearity
 
     :param parser: osil parser element to operate on
-    :param n_new_variables: current number of newly added variables
+    :param state: the mutable reformulation state carrying the counters and the worklist
     :param argument: the argument of the non-linearity to re-model
-    :param nl_indices: current indices of non-linear constraints
-    :return: the index of the newly added variable, and the total amount of new variables
+    :return: the index of the newly added variable
     """
-    # create a new variable and add it to the parser
-    n_new_variables += 1
-    new_variable_name = f"aux{n_new_variables}"
-    new_variable = OSILVariable(new_variable_name, argument.lower_bound, argument.upper_bound)
-    new_variable_index = len(parser.variables)
-    parser.variables.append(new_variable)
+    # share one auxiliary variable between structurally identical subtrees
+    key = _structural_key(argument)
+    if key is not None:
+        cached_index = state.cse_cache.get(key)
+        if cached_index is not None:
+            return cached_index
+
+    # create a new variable and add it to the parser; the name stays a placeholder until the pass is done
+    state.n_new_variables += 1
+    new_variable = OSILVariable("", argument.lower_bound, argument.upper_bound)
+    new_variable_index = state.next_variable_index
+    state.next_variable_index += 1
+    # fill a preallocated slot if available, otherwise the estimate was too small and we fall back to append
+    variables = state.variables
+    if new_variable_index < len(variables):
+        variables[new_variable_index] = new_variable
+    else:
+        variables.append(new_variable)
 
     # add the new constraint of new_variable == expression
-    n_constraints = len(parser.constraint_infos)
-    new_constraint_name = f"e{n_constraints + 1}"
-    # constraint info consists of name, lower bound, upper bound
-    new_constraint_info = (new_constraint_name, 0.0, 0.0)
-    parser.constraint_infos.append(new_constraint_info)
+    n_constraints = state.next_constraint_index
+    state.next_constraint_index += 1
+    # constraint info consists of name, lower bound, upper bound; the name is batch-generated after the pass
+    new_constraint_info = _EQUALITY_CONSTRAINT_INFO
+    constraint_infos = state.constraint_infos
+    if n_constraints < len(constraint_infos):
+        constraint_infos[n_constraints] = new_constraint_info
+    else:
+        constraint_infos.append(new_constraint_info)
     # add new variable with coefficient -1, such that -new_variable + expression == 0
     new_lin_coef = (new_variable_index, -1.0)
-    parser.lin_coeffs[n_constraints] = [new_lin_coef]
-    parser.quad_coeffs[n_constraints] = []
+    state.lin_coeffs[n_constraints] = [new_lin_coef]
+    state.quad_coeffs[n_constraints] = []
     # add the remaining expression of the current nl as a new nl
-    parser.nl_constraints[n_constraints] = argument
-    nl_indices.append(n_constraints)
+    state.nl_constraints[n_constraints] = argument
+    if _needs_reformulation(argument):
+        state.worklist.append((n_constraints, argument))
+
+    if key is not None:
+        state.cse_cache[key] = new_variable_index
 
-    return new_variable_index, n_new_variables, nl_indices
+    return new_variable_index
 
 
-def reformulate_fraction(parser, n_new_variables, nl_index, divide_nl):
+def reformulate_fraction(parser: OSILParser, state: _ReformulationState, nl_index: int, divide_nl: OSILDivide) -> None:
     """
         creates a variable, say z, and adds it to the parser, where the divide non-linearity x/y has been.
         Additionally, a constraint z * y == x is added.
 
         :param parser: osil parser element to operate on -> OSILparser
-        :param n_new_variables: current number of newly added variables -> integer
+        :param state: the mutable reformulation state carrying the counters and the worklist
         :param nl_index: the index of the divide non-linearity -> integer
         :param divide_nl: the OSILdivide expression to re-model
-        :return: the total amount of new variables
+        :return: None
         """
-    # create a new variable, say z, and add it to the parser
-    n_new_variables += 1
-    new_variable_name = f"aux{n_new_variables}"
-    new_variable = OSILVariable(new_variable_name, divide_nl.lower_bound, divide_nl.upper_bound)
-    new_variable_index = len(parser.variables)
-    parser.variables.append(new_variable)
+    # create a new variable, say z, and add it to the parser; the name stays a placeholder until the pass is done
+    state.n_new_variables += 1
+    new_variable = OSILVariable("", divide_nl.lower_bound, divide_nl.upper_bound)
+    new_variable_index = state.next_variable_index
+    state.next_variable_index += 1
+    # fill a preallocated slot if available, otherwise the estimate was too small and we fall back to append
+    variables = state.variables
+    if new_variable_index < len(variables):
+        variables[new_variable_index] = new_variable
+    else:
+        variables.append(new_variable)
 
     # add the newly created variable linearly in the current constraint
     replacement_lin_coef = (new_variable_index, 1.0)
-    parser.lin_coeffs[nl_index].append(replacement_lin_coef)
+    state.lin_coeffs[nl_index].append(replacement_lin_coef)
     # delete the non-linearity from the current constraint index
-    del parser.nl_constraints[nl_index]
+    del state.nl_constraints[nl_index]
 
     # add the new constraint of [new_variable z] * [denominator y]  == [numerator x]]
     # add respective constraint infos
-    n_constraints = len(parser.constraint_infos)
-    new_constraint_name = f"e{n_constraints + 1}"
-    # constraint info consists of name, lower bound, upper bound
+    n_constraints = state.next_constraint_index
+    state.next_constraint_index += 1
+    # constraint info consists of name, lower bound, upper bound; the name is batch-generated after the pass.
+    # a constant numerator moves to the constraint bound, otherwise it enters with coefficient -1 * old
+    # coefficient such that -[numerator] + [z * denominator] == 0; decided in one branch so the flag is
+    # tested once and each row is written once
     if divide_nl.numerator_constant:
         bound = divide_nl.numerator
         assert divide_nl.numerator_coefficient == 1.0, f"If numerator is constant, coefficient must equal 1.0"
+        new_lin_coeffs = []
     else:
         bound = 0
-    new_constraint_info = (new_constraint_name, bound, bound)
-    parser.constraint_infos.append(new_constraint_info)
-
-    # if numerator not constant,
-    # add the numerator with coefficient -1 * old coefficient, such that -[numerator] + [z * denominator] == 0
-    if divide_nl.numerator_constant:
-        parser.lin_coeffs[n_constraints] = []
+        new_lin_coeffs = [(divide_nl.numerator, -1.0 * divide_nl.numerator_coefficient)]  # TODO: add assertions
+    new_constraint_info = ("", bound, bound)
+    constraint_infos = state.constraint_infos
+    if n_constraints < len(constraint_infos):
+        constraint_infos[n_constraints] = new_constraint_info
     else:
-        new_lin_coef = (divide_nl.numerator, -1.0 * divide_nl.numerator_coefficient) #TODO: add assertions
-        parser.lin_coeffs[n_constraints] = [new_lin_coef]
+        constraint_infos.append(new_constraint_info)
+    state.lin_coeffs[n_constraints] = new_lin_coeffs
 
     # add the [new variable z] * [denominator] as quadratic coefficients
     new_quad_coef = (new_variable_index, divide_nl.denominator, divide_nl.denominator_coefficient) #TODO: add assertions
-    parser.quad_coeffs[n_constraints] = [new_quad_coef]
-
-    return n_new_variables
+    state.quad_coeffs[n_constraints] = [new_quad_coef]
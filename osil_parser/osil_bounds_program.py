@@ -0,0 +1,791 @@
+import math
+
+import numpy as np
+
+from osil_parser.osil_var import OSILVariable, OSILVariableStore, KIND_VAR, bounds_version
+from osil_parser.osil_expressions import (OSILLinearTerm, OSILSum, OSILProduct, OSILSquare, OSILPower,
+                                          OSILCosine, OSILSine, OSILNegate, OSILDivide, OSILSquareroot, OSILExp,
+                                          OSILAbs, OSILLn, OSILLog10, OSILSignPower, _power_interval,
+                                          _expression_children)
+
+"""
+Flat postorder bounds evaluator
+
+An expression tree is compiled once into parallel arrays (structure of arrays): one opcode, two argument slots
+and two coefficient slots per node, in postorder. Evaluating the bounds is then a single linear sweep over the
+arrays instead of a recursive tree traversal, which avoids the per-node call overhead and keeps the working set
+contiguous. The per-opcode handlers below mirror the compute_bounds implementations in osil_expressions one to
+one (including their corner cases), with None bounds encoded as +- infinity inside the sweep.
+"""
+
+_TWO_PI = 2 * math.pi
+
+# opcodes of the bounds program; postorder guarantees that argument entries precede their parent entry
+OP_CONST = 0
+OP_VAR = 1
+OP_TERM = 2
+OP_SUM = 3
+OP_PROD = 4
+OP_SQUARE = 5
+OP_POW = 6
+OP_COS = 7
+OP_SIN = 8
+OP_NEG = 9
+OP_DIV = 10
+OP_SQRT = 11
+OP_EXP = 12
+OP_ABS = 13
+OP_LN = 14
+OP_LOG10 = 15
+OP_SIGNPOWER = 16
+
+
+def _multiply_bounds(lb, ub, coefficient):
+    """multiply an interval (already encoded with +- infinity) by a coefficient and re-order the endpoints"""
+    return min(coefficient * lb, coefficient * ub), max(coefficient * lb, coefficient * ub)
+
+
+def _variable_bounds(variables, index):
+    """read the bounds of a variable from the store arrays (None already encoded as +- infinity)"""
+    return variables.lb[index], variables.ub[index]
+
+
+def _run_const(program, i, variables):
+    value = program.coeffs[i]
+    return value, value
+
+
+def _run_var(program, i, variables):
+    return _variable_bounds(variables, program.arg0[i])
+
+
+def _run_term(program, i, variables):
+    # summand/factor semantics: a None variable bound stays infinite regardless of the coefficient sign
+    index = program.arg0[i]
+    if index < 0:
+        value = program.coeffs[i]
+        return value, value
+    var_lb = variables.lb[index]
+    var_ub = variables.ub[index]
+    coefficient = program.coeffs[i]
+    # an unbounded variable side stays infinite regardless of the coefficient sign
+    lb = -np.inf if math.isinf(var_lb) else coefficient * var_lb
+    ub = np.inf if math.isinf(var_ub) else coefficient * var_ub
+    return min(lb, ub), max(lb, ub)
+
+
+def _run_sum(program, i, variables):
+    start = program.arg0[i]
+    count = program.arg1[i]
+    lb_out = program.lb_out
+    ub_out = program.ub_out
+    children = program.children
+    lower, upper = 0.0, 0.0
+    for k in range(start, start + count):
+        child = children[k]
+        lower += lb_out[child]
+        upper += ub_out[child]
+    return lower, upper
+
+
+def _run_prod(program, i, variables):
+    start = program.arg0[i]
+    count = program.arg1[i]
+    lb_out = program.lb_out
+    ub_out = program.ub_out
+    children = program.children
+    # first pass: fold constant children into one scalar and short-circuit on an exact zero factor,
+    # matching OSILProduct.compute_bounds; plain floats also keep the 0 * inf corner a silent nan
+    # (re-encoded as unbounded by run) instead of a numpy runtime warning per multiplication
+    constant = 1.0
+    interval_bounds = []
+    for k in range(start, start + count):
+        child = children[k]
+        lb = float(lb_out[child])
+        ub = float(ub_out[child])
+        if lb == ub and not math.isinf(lb):
+            constant *= lb
+            if constant == 0:
+                return 0, 0
+        else:
+            interval_bounds.append((lb, ub))
+
+    current_lb = current_ub = constant
+    for lb, ub in interval_bounds:
+        # branchless four-corner interval product, matching OSILProduct.compute_bounds
+        corners = (current_lb * lb, current_lb * ub, current_ub * lb, current_ub * ub)
+        current_lb = min(corners)
+        current_ub = max(corners)
+    return current_lb, current_ub
+
+
+def _run_square(program, i, variables):
+    child = program.arg0[i]
+    lb, ub = _multiply_bounds(program.lb_out[child], program.ub_out[child], program.coeffs[i])
+    # mirror OSILSquare.compute_bounds, including the reassignment of lb before the upper bound is taken
+    if lb <= 0 <= ub:
+        lower = 0
+    else:
+        lb = min(lb ** 2, ub ** 2)
+        lower = lb
+    return lower, max(lb ** 2, ub ** 2)
+
+
+def _run_pow(program, i, variables):
+    lb_base, ub_base = _multiply_bounds(program.lb_out[program.arg0[i]], program.ub_out[program.arg0[i]],
+                                        program.coeffs[i])
+    lb_exponent, ub_exponent = _multiply_bounds(program.lb_out[program.arg1[i]], program.ub_out[program.arg1[i]],
+                                                program.coeffs2[i])
+    lower, upper = _power_interval(lb_base, ub_base, lb_exponent, ub_exponent)
+    if lower is None:
+        # negative base with a varying exponent, no bounds derived
+        return -np.inf, np.inf
+    return lower, upper
+
+
+def _run_cos(program, i, variables):
+    child = program.arg0[i]
+    lb, ub = _multiply_bounds(program.lb_out[child], program.ub_out[child], program.coeffs[i])
+    # an unbounded argument always covers both extrema, matching OSILCosine.compute_bounds
+    if math.isinf(lb) or math.isinf(ub):
+        return -1, 1
+    if math.ceil((lb + math.pi) / _TWO_PI) <= (ub + math.pi) / _TWO_PI:
+        lower = -1
+    else:
+        lower = min(math.cos(lb), math.cos(ub))
+    if math.ceil(lb / _TWO_PI) <= ub / _TWO_PI:
+        upper = 1
+    else:
+        upper = max(math.cos(lb), math.cos(ub))
+    return lower, upper
+
+
+def _run_sin(program, i, variables):
+    child = program.arg0[i]
+    lb, ub = _multiply_bounds(program.lb_out[child], program.ub_out[child], program.coeffs[i])
+    # an unbounded argument always covers both extrema, matching OSILSine.compute_bounds
+    if math.isinf(lb) or math.isinf(ub):
+        return -1, 1
+    if math.ceil((lb + math.pi / 2) / _TWO_PI) <= (ub + math.pi / 2) / _TWO_PI:
+        lower = -1
+    else:
+        lower = min(math.sin(lb), math.sin(ub))
+    if math.ceil((lb + 3 * math.pi / 2) / _TWO_PI) <= (ub + 3 * math.pi / 2) / _TWO_PI:
+        upper = 1
+    else:
+        upper = max(math.sin(lb), math.sin(ub))
+    return lower, upper
+
+
+def _run_neg(program, i, variables):
+    child = program.arg0[i]
+    return _multiply_bounds(program.lb_out[child], program.ub_out[child], -1.0)
+
+
+def _run_div(program, i, variables):
+    lb_num, ub_num = _multiply_bounds(program.lb_out[program.arg0[i]], program.ub_out[program.arg0[i]],
+                                      program.coeffs[i])
+    lb_den, ub_den = _multiply_bounds(program.lb_out[program.arg1[i]], program.ub_out[program.arg1[i]],
+                                      program.coeffs2[i])
+    # if denominator contains zero in bounds, no bounds are derived
+    if lb_den <= 0 <= ub_den:
+        return -np.inf, np.inf
+    possible_bounds = [lb_num / lb_den, lb_num / ub_den, ub_num / lb_den, ub_num / ub_den]
+    return min(possible_bounds), max(possible_bounds)
+
+
+def _run_sqrt(program, i, variables):
+    child = program.arg0[i]
+    lb = program.lb_out[child]
+    return np.sqrt(lb) if lb > 0 else 0, np.sqrt(program.ub_out[child])
+
+
+def _run_exp(program, i, variables):
+    child = program.arg0[i]
+    lb, ub = _multiply_bounds(program.lb_out[child], program.ub_out[child], program.coeffs[i])
+    lower = 0 if math.isinf(lb) or math.isinf(ub) else np.exp(min(lb, ub))
+    upper = np.inf if math.isinf(lb) or math.isinf(ub) else np.exp(max(lb, ub))
+    return lower, upper
+
+
+def _run_abs(program, i, variables):
+    child = program.arg0[i]
+    lb, ub = _multiply_bounds(program.lb_out[child], program.ub_out[child], program.coeffs[i])
+    lower = 0 if lb <= 0 <= ub else min(np.abs(lb), np.abs(ub))
+    return lower, max(np.abs(lb), np.abs(ub))
+
+
+def _run_ln(program, i, variables):
+    child = program.arg0[i]
+    lb, ub = _multiply_bounds(program.lb_out[child], program.ub_out[child], program.coeffs[i])
+    return np.log(lb) if lb > 0 else -np.inf, np.log(ub) if ub < np.inf else np.inf
+
+
+def _run_log10(program, i, variables):
+    child = program.arg0[i]
+    lb = program.lb_out[child]
+    ub = program.ub_out[child]
+    return np.log10(lb) if lb > 0 else -np.inf, np.log10(ub) if ub < np.inf else np.inf
+
+
+def _run_signpower(program, i, variables):
+    lb, ub = _variable_bounds(variables, program.arg0[i])
+    exponent = program.coeffs[i]
+    lower = lb * np.abs(lb) ** (exponent - 1) if lb > -np.inf else -np.inf
+    upper = ub * np.abs(ub) ** (exponent - 1) if ub < np.inf else np.inf
+    return lower, upper
+
+
+# dispatch table indexed by opcode; precomputed once at import time
+_OP_HANDLERS = [_run_const, _run_var, _run_term, _run_sum, _run_prod, _run_square, _run_pow, _run_cos, _run_sin,
+                _run_neg, _run_div, _run_sqrt, _run_exp, _run_abs, _run_ln, _run_log10, _run_signpower]
+
+
+def _val_const(program, i, values):
+    return program.coeffs[i]
+
+
+def _val_var(program, i, values):
+    return values[program.arg0[i]]
+
+
+def _val_term(program, i, values):
+    index = program.arg0[i]
+    if index < 0:
+        return program.coeffs[i]
+    return program.coeffs[i] * values[index]
+
+
+def _val_sum(program, i, values):
+    start = program.arg0[i]
+    val_out = program.val_out
+    children = program.children
+    summing = 0.0
+    for k in range(start, start + program.arg1[i]):
+        summing += val_out[children[k]]
+    return summing
+
+
+def _val_prod(program, i, values):
+    start = program.arg0[i]
+    val_out = program.val_out
+    children = program.children
+    product = 1.0
+    for k in range(start, start + program.arg1[i]):
+        product *= val_out[children[k]]
+    return product
+
+
+def _val_square(program, i, values):
+    return (program.coeffs[i] * program.val_out[program.arg0[i]]) ** 2
+
+
+def _val_pow(program, i, values):
+    base = program.coeffs[i] * program.val_out[program.arg0[i]]
+    exponent = program.coeffs2[i] * program.val_out[program.arg1[i]]
+    return base ** exponent
+
+
+def _val_cos(program, i, values):
+    return math.cos(program.coeffs[i] * program.val_out[program.arg0[i]])
+
+
+def _val_sin(program, i, values):
+    return math.sin(program.coeffs[i] * program.val_out[program.arg0[i]])
+
+
+def _val_neg(program, i, values):
+    return -program.val_out[program.arg0[i]]
+
+
+def _val_div(program, i, values):
+    numerator = program.coeffs[i] * program.val_out[program.arg0[i]]
+    denominator = program.coeffs2[i] * program.val_out[program.arg1[i]]
+    return numerator / denominator
+
+
+def _val_sqrt(program, i, values):
+    return math.sqrt(program.val_out[program.arg0[i]])
+
+
+def _val_exp(program, i, values):
+    return math.exp(program.coeffs[i] * program.val_out[program.arg0[i]])
+
+
+def _val_abs(program, i, values):
+    # the coefficient only applies to a plain variable argument, as in OSILAbs.eval
+    child = program.arg0[i]
+    if program.op_codes[child] == OP_VAR:
+        return abs(program.coeffs[i] * program.val_out[child])
+    return abs(program.val_out[child])
+
+
+def _val_ln(program, i, values):
+    return math.log(program.coeffs[i] * program.val_out[program.arg0[i]])
+
+
+def _val_log10(program, i, values):
+    return math.log10(program.val_out[program.arg0[i]])
+
+
+def _val_signpower(program, i, values):
+    value = values[program.arg0[i]]
+    return value * abs(value) ** (program.coeffs[i] - 1)
+
+
+# numeric twins of the bound handlers, indexed by the same opcodes
+_VAL_HANDLERS = [_val_const, _val_var, _val_term, _val_sum, _val_prod, _val_square, _val_pow, _val_cos,
+                 _val_sin, _val_neg, _val_div, _val_sqrt, _val_exp, _val_abs, _val_ln, _val_log10,
+                 _val_signpower]
+
+
+class OSILBoundsProgram(object):
+    """
+    bounds-propagation program compiled from one expression tree
+
+    The tree is walked once in postorder and flattened into parallel arrays; run() then evaluates the bounds
+    with a linear sweep over those arrays and without touching the tree again
+    """
+
+    __slots__ = ('op_codes', 'arg0', 'arg1', 'coeffs', 'coeffs2', 'children', 'lb_out', 'ub_out', 'val_out')
+
+    def __init__(self, op_codes, arg0, arg1, coeffs, coeffs2, children):
+        self.op_codes = np.asarray(op_codes, dtype=np.int8)
+        self.arg0 = np.asarray(arg0, dtype=np.int32)
+        self.arg1 = np.asarray(arg1, dtype=np.int32)
+        self.coeffs = np.asarray(coeffs, dtype=np.float64)
+        self.coeffs2 = np.asarray(coeffs2, dtype=np.float64)
+        self.children = np.asarray(children, dtype=np.int32)
+        # output stacks, one slot per program entry
+        n_entries = len(op_codes)
+        self.lb_out = np.empty(n_entries, dtype=np.float64)
+        self.ub_out = np.empty(n_entries, dtype=np.float64)
+        # numeric output slots, allocated on the first evaluate call
+        self.val_out = None
+
+    @classmethod
+    def compile(cls, root):
+        """
+        flatten an expression tree into a bounds program
+
+        :param root: the root expression node (or variable index/constant) to compile
+        :return: an OSILBoundsProgram evaluating the bounds of the tree
+        """
+        op_codes, arg0, arg1, coeffs, coeffs2, children = [], [], [], [], [], []
+
+        def emit(op, a0, a1, c0, c1):
+            op_codes.append(op)
+            arg0.append(a0)
+            arg1.append(a1)
+            coeffs.append(c0)
+            coeffs2.append(c1)
+            return len(op_codes) - 1
+
+        def walk(node):
+            # children are emitted first so every entry only refers to smaller entry indices
+            if isinstance(node, (int,)):
+                return emit(OP_VAR, node, 0, 0.0, 0.0)
+            if isinstance(node, (float,)):
+                return emit(OP_CONST, 0, 0, node, 0.0)
+            node_class = type(node)
+            if node_class is OSILLinearTerm:
+                index = -1 if node.variable_index is None else node.variable_index
+                return emit(OP_TERM, index, 0, node.coefficient, 0.0)
+            if node_class is OSILSum and node.packed:
+                # packed sums carry no summand objects; emit one term entry per array element
+                coefs, vidx = node._linear_terms
+                child_entries = [emit(OP_TERM, int(index), 0, float(coefficient), 0.0)
+                                 for index, coefficient in zip(vidx, coefs)]
+                start = len(children)
+                children.extend(child_entries)
+                return emit(OP_SUM, start, len(child_entries), 0.0, 0.0)
+            if node_class is OSILSum or node_class is OSILProduct:
+                entities = node.sum_entities if node_class is OSILSum else node.factors
+                child_entries = [walk(entity) for entity in entities]
+                start = len(children)
+                children.extend(child_entries)
+                return emit(OP_SUM if node_class is OSILSum else OP_PROD, start, len(child_entries), 0.0, 0.0)
+            if node_class is OSILPower:
+                return emit(OP_POW, walk(node.expression), walk(node.exponent),
+                            node.base_coefficient, node.exponent_coefficient)
+            if node_class is OSILDivide:
+                return emit(OP_DIV, walk(node.numerator), walk(node.denominator),
+                            node.numerator_coefficient, node.denominator_coefficient)
+            if node_class is OSILSignPower:
+                return emit(OP_SIGNPOWER, node.base, 0, node.exponent, 0.0)
+            coefficient = getattr(node, 'coefficient', 1.0)
+            unary_op = _UNARY_OPS.get(node_class)
+            assert unary_op is not None, f"non-linearity was not implemented yet"
+            return emit(unary_op, walk(node.expression), 0, coefficient, 0.0)
+
+        walk(root)
+        return cls(op_codes, arg0, arg1, coeffs, coeffs2, children)
+
+    def run(self, variables):
+        """
+        evaluate the program bottom-up in one pass
+
+        :param variables: list of OSILVariable objects or an OSILVariableStore the variable entries refer to
+        :return: tuple of lower and upper bound of the root expression (None where unbounded)
+        """
+        # read variable bounds through the contiguous store arrays; wrapping a plain list is a one-off cost,
+        # repeated evaluations should pass the store itself
+        if type(variables) is not OSILVariableStore:
+            variables = OSILVariableStore(variables)
+        else:
+            variables.refresh()
+        op_codes = self.op_codes
+        lb_out = self.lb_out
+        ub_out = self.ub_out
+        handlers = _OP_HANDLERS
+        for i in range(len(op_codes)):
+            lb, ub = handlers[op_codes[i]](self, i, variables)
+            # re-encode any overflowing bound as unbounded, as the tree evaluation does via None; the
+            # product corners can yield nan from 0 * inf, which the tree path also treats as unbounded
+            lb_out[i] = -np.inf if (math.isinf(lb) or lb != lb) else lb
+            ub_out[i] = np.inf if (math.isinf(ub) or ub != ub) else ub
+
+        root_lb = lb_out[-1]
+        root_ub = ub_out[-1]
+        return (None if math.isinf(root_lb) else float(root_lb),
+                None if math.isinf(root_ub) else float(root_ub))
+
+    def evaluate(self, values):
+        """
+        evaluate the compiled expression numerically in one bottom-up pass
+
+        :param values: indexable of numeric variable values the variable entries refer to
+        :return: the value of the root expression as a float
+        """
+        if self.val_out is None:
+            self.val_out = np.empty(len(self.op_codes), dtype=np.float64)
+        op_codes = self.op_codes
+        val_out = self.val_out
+        handlers = _VAL_HANDLERS
+        for i in range(len(op_codes)):
+            val_out[i] = handlers[op_codes[i]](self, i, values)
+        return float(val_out[-1])
+
+    def structural_signature(self):
+        """
+        hashable key describing the program shape without its parameters
+
+        Variable indices and coefficients are masked out, so programs of constraints that share a non-linear
+        shape but bind different variables or scalars yield equal signatures; only the leaf-constant flag of
+        term entries stays in, because it changes the generated source
+        """
+        leaf_mask = ((self.op_codes == OP_VAR) | (self.op_codes == OP_TERM)
+                     | (self.op_codes == OP_SIGNPOWER))
+        masked_arg0 = np.where(leaf_mask, np.minimum(self.arg0, 0), self.arg0)
+        return (self.op_codes.tobytes(), masked_arg0.tobytes(), self.arg1.tobytes(), self.children.tobytes())
+
+    def compile_function(self):
+        """
+        generate a plain python function computing the expression and compile it to bytecode
+
+        Each tape entry becomes one assignment in the generated source; variable indices and coefficients
+        are read from per-program parameter lists, so the compiled code object only depends on the program
+        shape and is shared (via a module-level cache) between all structurally equal constraints. Repeated
+        numeric evaluations pay neither the tree walk nor the per-entry handler dispatch of evaluate.
+
+        :return: a callable mapping an indexable of numeric variable values to the float expression value
+        """
+        op_codes = self.op_codes
+        arg0 = self.arg0
+        arg1 = self.arg1
+        children = self.children
+        # per-program parameters the generated source indexes into; signpowers store their pre-subtracted
+        # exponent in the second slot so the hot path pays no subtraction
+        c0 = self.coeffs.tolist()
+        c1 = self.coeffs2.tolist()
+        vi = [int(index) for index in arg0]
+
+        signature = self.structural_signature()
+        code = _CODE_CACHE.get(signature)
+        if code is None:
+            lines = ["def _compiled(v):"]
+            for i in range(len(op_codes)):
+                op = op_codes[i]
+                if op == OP_CONST:
+                    expr = f"_c0[{i}]"
+                elif op == OP_VAR:
+                    expr = f"v[_vi[{i}]]"
+                elif op == OP_TERM:
+                    expr = f"_c0[{i}]" if arg0[i] < 0 else f"_c0[{i}] * v[_vi[{i}]]"
+                elif op == OP_SUM:
+                    terms = [f"t{children[k]}" for k in range(arg0[i], arg0[i] + arg1[i])]
+                    expr = " + ".join(terms) if terms else "0.0"
+                elif op == OP_PROD:
+                    expr = " * ".join(f"t{children[k]}" for k in range(arg0[i], arg0[i] + arg1[i]))
+                elif op == OP_SQUARE:
+                    expr = f"(_c0[{i}] * t{arg0[i]}) ** 2"
+                elif op == OP_POW:
+                    expr = f"(_c0[{i}] * t{arg0[i]}) ** (_c1[{i}] * t{arg1[i]})"
+                elif op == OP_COS:
+                    expr = f"cos(_c0[{i}] * t{arg0[i]})"
+                elif op == OP_SIN:
+                    expr = f"sin(_c0[{i}] * t{arg0[i]})"
+                elif op == OP_NEG:
+                    expr = f"-t{arg0[i]}"
+                elif op == OP_DIV:
+                    expr = f"(_c0[{i}] * t{arg0[i]}) / (_c1[{i}] * t{arg1[i]})"
+                elif op == OP_SQRT:
+                    expr = f"sqrt(t{arg0[i]})"
+                elif op == OP_EXP:
+                    expr = f"exp(_c0[{i}] * t{arg0[i]})"
+                elif op == OP_ABS:
+                    # the coefficient only applies to a plain variable argument, as in OSILAbs.eval
+                    if op_codes[arg0[i]] == OP_VAR:
+                        expr = f"abs(_c0[{i}] * t{arg0[i]})"
+                    else:
+                        expr = f"abs(t{arg0[i]})"
+                elif op == OP_LN:
+                    expr = f"log(_c0[{i}] * t{arg0[i]})"
+                elif op == OP_LOG10:
+                    expr = f"log10(t{arg0[i]})"
+                else:
+                    assert op == OP_SIGNPOWER, f"non-linearity was not implemented yet"
+                    expr = f"v[_vi[{i}]] * abs(v[_vi[{i}]]) ** _c1[{i}]"
+                lines.append(f"    t{i} = {expr}")
+            lines.append(f"    return t{len(op_codes) - 1}")
+            code = compile("\n".join(lines), "<osil bounds program>", "exec")
+            _CODE_CACHE[signature] = code
+
+        for i in range(len(op_codes)):
+            if op_codes[i] == OP_SIGNPOWER:
+                c1[i] = c0[i] - 1.0
+        namespace = {'cos': math.cos, 'sin': math.sin, 'sqrt': math.sqrt, 'exp': math.exp, 'log': math.log,
+                     'log10': math.log10, '_c0': c0, '_c1': c1, '_vi': vi}
+        exec(code, namespace)
+        return namespace['_compiled']
+
+
+# unary expression classes sharing the single-argument layout, mapped to their opcode
+_UNARY_OPS = {OSILSquare: OP_SQUARE, OSILCosine: OP_COS, OSILSine: OP_SIN, OSILNegate: OP_NEG,
+              OSILSquareroot: OP_SQRT, OSILExp: OP_EXP, OSILAbs: OP_ABS, OSILLn: OP_LN, OSILLog10: OP_LOG10}
+
+# compiled code objects keyed by structural program signature; constraints reusing one non-linear shape with
+# different variables or coefficients share a single compile() pass
+_CODE_CACHE = {}
+
+
+class OSILTrigBatch(object):
+    """
+    vectorized bound computation for a batch of cosine/sine nodes over plain variable arguments
+
+    Collects all cosine and sine nodes whose argument is a variable index, packs their variable indices and
+    coefficients into arrays and computes the bounds of the whole batch with a handful of numpy operations
+    instead of one ceil/cos/sin call chain per node. The results are written back into the nodes and tagged
+    with the current bounds version, so the memoized per-node compute_bounds calls afterwards are pure cache
+    hits. Nodes with general expression arguments are left to the per-node path.
+    """
+
+    __slots__ = ('nodes', 'vidx', 'coefs', 'offset_lower', 'offset_upper', 'is_sine')
+
+    def __init__(self, nodes):
+        for node in nodes:
+            assert type(node) is OSILCosine or type(node) is OSILSine
+            assert node.expression_kind == KIND_VAR
+        self.nodes = nodes
+        n_nodes = len(nodes)
+        self.vidx = np.fromiter((node.expression for node in nodes), dtype=np.int32, count=n_nodes)
+        self.coefs = np.fromiter((node.coefficient for node in nodes), dtype=np.float64, count=n_nodes)
+        self.is_sine = np.fromiter((type(node) is OSILSine for node in nodes), dtype=bool, count=n_nodes)
+        # phase offsets of the extrema: cosine takes its minimum at -pi + k*2pi and its maximum at k*2pi,
+        # sine at -pi/2 + k*2pi and -3pi/2 + k*2pi respectively
+        self.offset_lower = np.where(self.is_sine, math.pi / 2, math.pi)
+        self.offset_upper = np.where(self.is_sine, 3 * math.pi / 2, 0.0)
+
+    @classmethod
+    def collect(cls, roots):
+        """
+        gather all cosine/sine nodes with a plain variable argument from a collection of expression trees
+
+        :param roots: iterable of root expression nodes
+        :return: an OSILTrigBatch over the collected nodes
+        """
+        nodes = []
+        seen = set()
+        stack = [root for root in roots if not isinstance(root, (int, float))]
+        while stack:
+            node = stack.pop()
+            if id(node) in seen:
+                # shared sub-expressions appear under several roots, bound them once
+                continue
+            seen.add(id(node))
+            if (type(node) is OSILCosine or type(node) is OSILSine) and node.expression_kind == KIND_VAR:
+                nodes.append(node)
+            stack.extend(child for child in _expression_children(node) if not isinstance(child, (int, float)))
+        return cls(nodes)
+
+    def compute_bounds(self, variables):
+        """
+        compute the bounds of all batched nodes in one vectorized pass and store them on the nodes
+
+        :param variables: list of OSILVariable objects or an OSILVariableStore the variable indices refer to
+        :return: tuple of the lower and upper bound arrays, one entry per batched node
+        """
+        if type(variables) is not OSILVariableStore:
+            variables = OSILVariableStore(variables)
+        else:
+            variables.refresh()
+        # argument intervals, coefficient applied with re-ordered endpoints
+        scaled_lb = self.coefs * variables.lb[self.vidx]
+        scaled_ub = self.coefs * variables.ub[self.vidx]
+        arg_lb = np.minimum(scaled_lb, scaled_ub)
+        arg_ub = np.maximum(scaled_lb, scaled_ub)
+        # an unbounded argument always covers both extrema; evaluate the bounded formulas on zeroed stand-ins
+        # to keep cos/sin/ceil off the infinities
+        unbounded = np.isinf(arg_lb) | np.isinf(arg_ub)
+        lb = np.where(unbounded, 0.0, arg_lb)
+        ub = np.where(unbounded, 0.0, arg_ub)
+        value_lb = np.where(self.is_sine, np.sin(lb), np.cos(lb))
+        value_ub = np.where(self.is_sine, np.sin(ub), np.cos(ub))
+        # the extremum is attained iff a suitably shifted multiple of 2pi falls into the argument interval,
+        # same test as the scalar compute_bounds implementations
+        hits_minimum = np.ceil((lb + self.offset_lower) / _TWO_PI) <= (ub + self.offset_lower) / _TWO_PI
+        hits_maximum = np.ceil((lb + self.offset_upper) / _TWO_PI) <= (ub + self.offset_upper) / _TWO_PI
+        lower = np.where(unbounded | hits_minimum, -1.0, np.minimum(value_lb, value_ub))
+        upper = np.where(unbounded | hits_maximum, 1.0, np.maximum(value_lb, value_ub))
+        # write the results back and mark the per-node caches current for this bounds version
+        version = bounds_version()
+        nodes = self.nodes
+        for k in range(len(nodes)):
+            node = nodes[k]
+            node.arg_lb = arg_lb[k]
+            node.arg_ub = arg_ub[k]
+            node.lower_bound = float(lower[k])
+            node.upper_bound = float(upper[k])
+            node._cached_version = version
+        return lower, upper
+
+
+def _batch_square(nodes, lb, ub):
+    crosses = (lb <= 0) & (0 <= ub)
+    # mirror OSILSquare.compute_bounds, including the reassignment of lb before the upper bound is taken
+    squared_min = np.minimum(lb * lb, ub * ub)
+    lower = np.where(crosses, 0.0, squared_min)
+    upper = np.where(crosses, np.maximum(lb * lb, ub * ub), np.maximum(squared_min * squared_min, ub * ub))
+    return np.ones(len(lb), dtype=bool), lower, upper
+
+
+def _batch_sqrt(nodes, lb, ub):
+    # the scalar path keeps its previous lower bound for lb <= 0, so those nodes fall back to it
+    eligible = lb > 0
+    safe_lb = np.where(eligible, lb, 1.0)
+    return eligible, np.sqrt(safe_lb), np.sqrt(np.where(ub > 0, ub, 1.0))
+
+
+def _batch_exp(nodes, lb, ub):
+    return np.ones(len(lb), dtype=bool), np.exp(lb), np.exp(ub)
+
+
+def _batch_abs(nodes, lb, ub):
+    # the scalar path keeps its previous lower bound for a zero-crossing argument, fall back there
+    eligible = ~((lb <= 0) & (0 <= ub))
+    return eligible, np.minimum(np.abs(lb), np.abs(ub)), np.maximum(np.abs(lb), np.abs(ub))
+
+
+def _batch_log(nodes, lb, ub):
+    eligible = lb > 0
+    safe = np.where(eligible, lb, 1.0)
+    return eligible, np.log(safe), np.log(np.where(ub > 0, ub, 1.0))
+
+
+def _batch_log10(nodes, lb, ub):
+    eligible = lb > 0
+    safe = np.where(eligible, lb, 1.0)
+    return eligible, np.log10(safe), np.log10(np.where(ub > 0, ub, 1.0))
+
+
+def _batch_signpower(nodes, lb, ub):
+    exponents = np.fromiter((node.exponent for node in nodes), dtype=np.float64, count=len(nodes))
+    lower = lb * np.abs(lb) ** (exponents - 1)
+    upper = ub * np.abs(ub) ** (exponents - 1)
+    return np.ones(len(lb), dtype=bool), lower, upper
+
+
+# batched bound rules for the unary classes over a plain variable argument; the bool flag states whether the
+# class multiplies its argument by the node coefficient (sqrt, log10 and signpower do not)
+_BATCH_RULES = {OSILSquare: (_batch_square, True), OSILSquareroot: (_batch_sqrt, False),
+                OSILExp: (_batch_exp, True), OSILAbs: (_batch_abs, True), OSILLn: (_batch_log, True),
+                OSILLog10: (_batch_log10, False), OSILSignPower: (_batch_signpower, False)}
+
+
+def bulk_compute_bounds(roots, variables):
+    """
+    bound all unary non-linearities over plain variable arguments in a few vectorized passes
+
+    Walks the given trees once, groups the square/sqrt/exp/abs/ln/log10/signpower nodes whose argument is a
+    variable index by class and computes each group's bounds with a handful of numpy calls instead of one
+    scalar call chain per node; cosine and sine nodes go through OSILTrigBatch. Results are written back into
+    the nodes and tagged with the current bounds version, so the memoized per-node compute_bounds calls
+    afterwards are cache hits. Nodes whose argument interval is unbounded (or where the scalar path would
+    keep a previously stored bound) are bounded through their own compute_bounds instead, so the outcome is
+    identical to the per-node path throughout.
+
+    :param roots: iterable of root expression nodes
+    :param variables: list of OSILVariable objects or an OSILVariableStore the variable indices refer to
+    :return: the number of nodes bounded through the vectorized passes
+    """
+    if type(variables) is not OSILVariableStore:
+        variables = OSILVariableStore(variables)
+    else:
+        variables.refresh()
+    groups = {}
+    trig_nodes = []
+    seen = set()
+    stack = [root for root in roots if not isinstance(root, (int, float))]
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            # shared sub-expressions appear under several roots, bound them once
+            continue
+        seen.add(id(node))
+        node_class = type(node)
+        if (node_class is OSILCosine or node_class is OSILSine) and node.expression_kind == KIND_VAR:
+            trig_nodes.append(node)
+        elif node_class is OSILSignPower:
+            groups.setdefault(node_class, []).append(node)
+        elif node_class in _BATCH_RULES and node.expression_kind == KIND_VAR:
+            groups.setdefault(node_class, []).append(node)
+        stack.extend(child for child in _expression_children(node) if not isinstance(child, (int, float)))
+
+    batched = 0
+    if trig_nodes:
+        OSILTrigBatch(trig_nodes).compute_bounds(variables)
+        batched += len(trig_nodes)
+    version = bounds_version()
+    for node_class, nodes in groups.items():
+        rule, applies_coefficient = _BATCH_RULES[node_class]
+        n_nodes = len(nodes)
+        if node_class is OSILSignPower:
+            vidx = np.fromiter((node.base for node in nodes), dtype=np.int32, count=n_nodes)
+        else:
+            vidx = np.fromiter((node.expression for node in nodes), dtype=np.int32, count=n_nodes)
+        lb = variables.lb[vidx]
+        ub = variables.ub[vidx]
+        if applies_coefficient:
+            coefs = np.fromiter((node.coefficient for node in nodes), dtype=np.float64, count=n_nodes)
+            scaled_lb = coefs * lb
+            scaled_ub = coefs * ub
+            lb = np.minimum(scaled_lb, scaled_ub)
+            ub = np.maximum(scaled_lb, scaled_ub)
+        # compute on all entries and discard the ineligible ones afterwards; overflow or an infinite argument
+        # simply disqualifies the entry from the batch
+        with np.errstate(invalid='ignore', over='ignore', divide='ignore'):
+            eligible, lower, upper = rule(nodes, lb, ub)
+            eligible = eligible & np.isfinite(lb) & np.isfinite(ub) & np.isfinite(lower) & np.isfinite(upper)
+        for k in range(n_nodes):
+            node = nodes[k]
+            if eligible[k]:
+                node.arg_lb = float(lb[k])
+                node.arg_ub = float(ub[k])
+                node.lower_bound = float(lower[k])
+                node.upper_bound = float(upper[k])
+                node._cached_version = version
+                batched += 1
+            else:
+                # the scalar path handles unbounded arguments and the keep-previous-bound branches
+                node.compute_bounds(variables)
+    return batched
@@ -1,13 +1,130 @@
+import functools
+import math
+import weakref
+
 import numpy as np
 import pyomo.environ as pyo
-from osil_parser.osil_var import OSILVariable
+from osil_parser.osil_var import (OSILVariable, OSILVariableStore, KIND_CONST, KIND_VAR, KIND_EXPR,
+                                  bounds_version)
+
+
+# trig constants hoisted to module scope; math.cos/math.sin/math.ceil on plain floats avoid the numpy
+# ufunc dispatch overhead per scalar call
+_PI = math.pi
+_TWO_PI = 2 * math.pi
+_HALF_PI = math.pi / 2
+_THREE_HALF_PI = 3 * math.pi / 2
+# scalar infinity bound; resolving a module constant is cheaper than the np.inf attribute lookup inside the
+# hot compute_bounds bodies (np.inf stays in use where arrays are built)
+_INF = math.inf
+
+# constructor argument validation is gated behind this flag; it follows __debug__, so running under -O builds
+# large expression trees without the per-node isinstance checks, and it can be flipped off explicitly as well
+_DEBUG = __debug__
+
+# pyomo intrinsic functions bound once at import; the evaluation combiners call them per node and a module
+# constant skips the pyo attribute lookup on every call
+_pyo_cos = pyo.cos
+_pyo_sin = pyo.sin
+_pyo_sqrt = pyo.sqrt
+_pyo_exp = pyo.exp
+_pyo_log = pyo.log
+_pyo_log10 = pyo.log10
+
+
+# hash-consing pool for structurally equal leaf nodes; weak values let unused nodes be collected normally
+_INTERN = weakref.WeakValueDictionary()
+
+
+def clear_intern_pool():
+    """start a fresh hash-consing pool; called per parse so leaves are only shared within one instance and
+    never carry memoized bounds from another parser's variable list"""
+    _INTERN.clear()
+
+
+def intern_node(node_class, *args):
+    """
+    return a shared node instance for structurally equal constructor arguments (hash-consing); repeated
+    subexpressions then share one object and the memoized bound computation runs once instead of per copy
+
+    only meant for nodes whose constructor arguments are all plain numbers (variable indices, coefficients,
+    levels), i.e. the leaf-argument nodes the parser builds; such nodes are never restructured by the
+    reformulation pass, so sharing them is safe
+    """
+    key = (node_class.__name__,) + args
+    node = _INTERN.get(key)
+    if node is None:
+        node = node_class(*args)
+        _INTERN[key] = node
+    return node
+
+
+def _child_kind(child):
+    """resolve the kind tag of a child slot once at construction time: an int is a variable index, a float a
+    plain constant, anything else a nested expression node; storing the tag avoids an isinstance branch per
+    compute_bounds/eval call"""
+    if isinstance(child, (int,)):
+        return KIND_VAR
+    if isinstance(child, (float,)):
+        return KIND_CONST
+    return KIND_EXPR
+
+
+def _multiply_interval(lb, ub, coefficient):
+    """multiply an already float-encoded interval (None as +- infinity) by a coefficient and re-order the
+    endpoints; the None branches of bounds_convert_and_multiply are skipped"""
+    if coefficient >= 0:
+        return coefficient * lb, coefficient * ub
+    return coefficient * ub, coefficient * lb
+
+
+def _power_interval(lb_base, ub_base, lb_exponent, ub_exponent):
+    """
+    case analysis for the bounds of base**exponent on four plain floats (None encoded as +- infinity);
+    standalone so it works on unboxed scalars and could be JIT-compiled as-is
+
+    :return: tuple of lower and upper bound, or (None, None) if no bounds can be derived
+    """
+    # for constant and integral exponent, we apply a case distinction
+    if lb_exponent == ub_exponent == int(ub_exponent):
+        # if exponent is even, lower bound is either zero (if feasible) or regarding upper/lower bound
+        if int(ub_exponent) % 2 == 0:
+            if lb_base <= 0.0 <= ub_base:
+                lower = 0
+            else:
+                lower = min(lb_base ** ub_exponent, ub_base ** ub_exponent)
+            return lower, max(lb_base ** ub_exponent, ub_base ** ub_exponent)
+        # if exponent is odd, function is monotonously increasing
+        return lb_base ** ub_exponent, ub_base ** ub_exponent
+
+    # if base can be negative, we apply no bounds, otherwise lb is minimum of smallest base < 1 and largest
+    # exponent and largest base with smallest exponent; ub vice versa
+    if lb_base < 0 and lb_exponent != ub_exponent:
+        print(f"possible negative base for power constraint detected")
+        return None, None
+    return (min(lb_base ** ub_exponent, ub_base ** lb_exponent),
+            max(lb_base ** lb_exponent, ub_base ** ub_exponent))
+
+
+def _memoize_bounds(compute_bounds):
+    """cache the bounds a node computed until any variable bound changes (tracked by the global bounds
+    version from osil_var); shared sub-expressions are then resolved once per version instead of per parent"""
+    @functools.wraps(compute_bounds)
+    def cached_compute_bounds(self, variables):
+        version = bounds_version()
+        if getattr(self, '_cached_version', 0) == version:
+            return self.lower_bound, self.upper_bound
+        result = compute_bounds(self, variables)
+        self._cached_version = version
+        return result
+    return cached_compute_bounds
 
 """
 Storage of different expressions apart from variables and objectives
 Contained here are
-- OSILSummand (tuple of variable index (if), coefficient, level in expression tree, bounds)
+- OSILLinearTerm (tuple of variable index (if), coefficient, level in expression tree, bounds; aliased as
+  OSILSummand and OSILFactor for the sum and product contexts)
 - OSILSum (list of objects to sum, level, bound)
-- OSILFactor (tuple of variable index, coefficient (one of these two =None), level in expression tree, bounds)
 - OSILProduct (list of objects to multiply, level, bounds)
 - OSILSquare (expression, level, bounds)
 - OSILPower (expression, coefficient, level, bounds)
@@ -23,46 +140,81 @@ Contained here are
 """
 
 
-class OSILSummand(object):
+class OSILExpr(object):
+    """shared base of the general non-linear expression node classes; constructor checks test against this
+    single class instead of a thirteen-class tuple"""
+    __slots__ = ()
+
+
+class OSILLinearTerm(object):
+    KIND = KIND_VAR
+    __slots__ = ('variable_index', 'coefficient', '_level', 'lower_bound', 'upper_bound', '_cached_version',
+                 '__weakref__')
+
     def __init__(self, variable_index, coefficient, level):
-        """initialize summand object (variable index if available, coefficient, level in expression tree, bounds)"""
+        """initialize linear term object (variable index if available, coefficient, level in expression tree,
+        bounds); used as summand inside sums and as factor inside products"""
         # index None is equivalent to constant
-        assert (isinstance(variable_index, (int,)) and variable_index >= 0) or isinstance(variable_index, type(None))
+        if _DEBUG:
+            assert (isinstance(variable_index, (int,)) and variable_index >= 0) or isinstance(variable_index, type(None))
         self.variable_index = variable_index
-        assert isinstance(coefficient, (int, float))
+        if _DEBUG:
+            assert isinstance(coefficient, (int, float))
         self.coefficient = coefficient
-        assert isinstance(level, (int,)) and level >= 0
+        if _DEBUG:
+            assert isinstance(level, (int,)) and level >= 0
         self._level = level
 
         self.lower_bound = None
         self.upper_bound = None
 
+    @_memoize_bounds
     def compute_bounds(self, variables):
-        """compute the lower and upper bound of the summand object, given a list of OSILVariables"""
+        """compute the lower and upper bound of the linear term, given a list of OSILVariables"""
         if self.variable_index is None:
             self.lower_bound = self.upper_bound = self.coefficient
         else:
             var = variables[self.variable_index]
             assert isinstance(var, (OSILVariable,)), f"Variables must be list of OSILVariable objects"
             if var.lb is None:
-                lb = -np.inf
+                lb = -_INF
             else:
                 lb = self.coefficient * var.lb
             if var.ub is None:
-                ub = np.inf
+                ub = _INF
             else:
                 ub = self.coefficient * var.ub
 
             self.lower_bound = min(lb, ub)
             self.upper_bound = max(lb, ub)
 
-            self.lower_bound = None if np.isinf(-self.lower_bound) else self.lower_bound
-            self.upper_bound = None if np.isinf(self.upper_bound) else self.upper_bound
+            self.lower_bound = None if math.isinf(self.lower_bound) else self.lower_bound
+            self.upper_bound = None if math.isinf(self.upper_bound) else self.upper_bound
 
         return self.lower_bound, self.upper_bound
 
+    @classmethod
+    def make(cls, variable_index, coefficient, level):
+        """return a shared term instance for structurally equal arguments (hash-consing); only immutable
+        use is allowed on the result, callers that mutate a term must construct their own instance"""
+        key = ('Term', variable_index, coefficient, level)
+        term = _INTERN.get(key)
+        if term is None:
+            term = cls(variable_index, coefficient, level)
+            _INTERN[key] = term
+        return term
+
+    @classmethod
+    def from_aux_variable(cls, variable_index, lower_bound, upper_bound):
+        """build a term of coefficient 1.0 for a just-created auxiliary variable, taking over its bounds
+        directly instead of re-deriving them via compute_bounds"""
+        term = cls(variable_index, 1.0, 1)
+        term.lower_bound = lower_bound
+        term.upper_bound = upper_bound
+        return term
+
     def update_coefficient(self, coefficient):
-        """update coefficient of summand"""
+        """update coefficient of the term"""
         assert isinstance(coefficient, (int, float))
         self.coefficient = coefficient
 
@@ -78,36 +230,107 @@ class OSILSummand(object):
             return self.coefficient * variables[self.variable_index]
 
 
-class OSILSum(object):
+# the sum and product contexts used to carry two structurally identical classes; they are kept as aliases of
+# the merged class so existing construction sites and isinstance checks keep working
+OSILSummand = OSILLinearTerm
+OSILFactor = OSILLinearTerm
+
+
+class OSILSum(OSILExpr):
+    KIND = KIND_EXPR
+    __slots__ = ('sum_entities', '_level', 'lower_bound', 'upper_bound', '_linear_terms', 'packed',
+                 '_cached_version')
+
     def __init__(self, sum_entities, level):
         """initialize sum object as list of summand objects + other nonlinear expressions & level in expression tree"""
-        assert isinstance(sum_entities, (list, )) and len(sum_entities) > 0
+        if _DEBUG:
+            assert isinstance(sum_entities, (list, )) and len(sum_entities) > 0
         self.sum_entities = sum_entities
         # TODO: assertion for entity types
-        assert isinstance(level, (int,)) and level >= 0
+        if _DEBUG:
+            assert isinstance(level, (int,)) and level >= 0
         self._level = level
 
         self.lower_bound = None
         self.upper_bound = None
 
-        self.arg_lbs = []
-        self.arg_ubs = []
-
+        # lazily compiled (coefficients, variable indices) arrays for a purely linear sum; None means stale,
+        # an empty tuple means the entities are heterogeneous and the generic path has to be taken
+        self._linear_terms = None
+        # a packed sum has dropped its summand objects and lives on the arrays alone (see pack)
+        self.packed = False
+
+    def _compile_linear_terms(self):
+        """collect the coefficient and variable index arrays if every entity is a variable-carrying summand"""
+        if all(type(entity) is OSILSummand and entity.variable_index is not None for entity in self.sum_entities):
+            n_entities = len(self.sum_entities)
+            coefs = np.fromiter((entity.coefficient for entity in self.sum_entities),
+                                dtype=np.float64, count=n_entities)
+            vidx = np.fromiter((entity.variable_index for entity in self.sum_entities),
+                               dtype=np.int32, count=n_entities)
+            self._linear_terms = (coefs, vidx)
+        else:
+            self._linear_terms = ()
+
+    def pack(self):
+        """
+        compact a purely linear sum into its coefficient/variable-index arrays and drop the summand objects;
+        afterwards the sum only supports compute_bounds and eval (the reformulation pass treats it as opaque),
+        so callers must not restructure it anymore
+
+        :return: True if the sum was packed, False if its entities are heterogeneous
+        """
+        if self._linear_terms is None:
+            self._compile_linear_terms()
+        if self._linear_terms:
+            self.sum_entities = []
+            self.packed = True
+        return self.packed
+
+    @_memoize_bounds
     def compute_bounds(self, variables):
         """computing the bounds for the sum object with a list of OSILSummands and other non linearities"""
-        self.arg_lbs = []
-        self.arg_ubs = []
-        for summand in self.sum_entities:
-            # compute bounds of sum entity and store
-            lb, ub = summand.compute_bounds(variables)
-            self.arg_lbs.append(lb)
-            self.arg_ubs.append(ub)
+        if self._linear_terms is None:
+            self._compile_linear_terms()
+        if self._linear_terms:
+            # purely linear sum: evaluate all summand bounds in one vectorized pass over the coefficient and
+            # variable index arrays instead of one compute_bounds call per entity (the per-entity bound fields
+            # are not filled in here; they are only read for entities of reformulated, i.e. non-linear, sums)
+            coefs, vidx = self._linear_terms
+            if type(variables) is OSILVariableStore:
+                # gather the bounds straight from the contiguous store arrays
+                variables.refresh()
+                var_lb = variables.lb[vidx]
+                var_ub = variables.ub[vidx]
+            else:
+                n_terms = len(coefs)
+                var_lb = np.fromiter((variables[i].lb_inf for i in vidx), dtype=np.float64, count=n_terms)
+                var_ub = np.fromiter((variables[i].ub_inf for i in vidx), dtype=np.float64, count=n_terms)
+            lbs = np.where(np.isinf(-var_lb), -np.inf, coefs * var_lb)
+            ubs = np.where(np.isinf(var_ub), np.inf, coefs * var_ub)
+            lb_total = np.minimum(lbs, ubs).sum()
+            ub_total = np.maximum(lbs, ubs).sum()
+            if np.isfinite(lb_total):
+                self.lower_bound = float(lb_total)
+            if np.isfinite(ub_total):
+                self.upper_bound = float(ub_total)
+            return self.lower_bound, self.upper_bound
 
-        # if None in a list, keep bound None, otherwise compute bound as sum
-        if None not in self.arg_lbs:
-            self.lower_bound = sum(self.arg_lbs)
-        if None not in self.arg_ubs:
-            self.upper_bound = sum(self.arg_ubs)
+        # every entity stores its own bounds, so no parallel bookkeeping lists are kept here
+        for summand in self.sum_entities:
+            summand.compute_bounds(variables)
+
+        # reduce the child bounds in one vectorized pass, mapping None (= unbounded) to nan;
+        # if any entry is nan the respective bound stays untouched
+        n_entities = len(self.sum_entities)
+        lbs = np.fromiter((np.nan if entity.lower_bound is None else entity.lower_bound
+                           for entity in self.sum_entities), dtype=np.float64, count=n_entities)
+        if not np.isnan(lbs).any():
+            self.lower_bound = float(lbs.sum())
+        ubs = np.fromiter((np.nan if entity.upper_bound is None else entity.upper_bound
+                           for entity in self.sum_entities), dtype=np.float64, count=n_entities)
+        if not np.isnan(ubs).any():
+            self.upper_bound = float(ubs.sum())
 
         return self.lower_bound, self.upper_bound
 
@@ -116,11 +339,14 @@ class OSILSum(object):
         # TODO: add other possible entities like nonlinear expressions
         assert isinstance(entity, (OSILSummand, OSILProduct))
         self.sum_entities.append(entity)
+        self._linear_terms = None
 
     def remove_sum_entity(self, index):
         """removal of summation entity"""
         assert isinstance(index, (int,))
-        self.sum_entities = self.sum_entities[:index] + self.sum_entities[(index + 1):]
+        # in-place deletion; rebuilding the list would copy all remaining references
+        del self.sum_entities[index]
+        self._linear_terms = None
 
     def get_level(self):
         """return level in expression tree"""
@@ -128,113 +354,59 @@ class OSILSum(object):
 
     def eval(self, variables):
         """return sum of summation entities in evaluated form """
-        summing = 0
-        for entity in self.sum_entities:
-            summing += entity.eval(variables)
-        return summing
-
-
-class OSILFactor(object):
-    def __init__(self, variable_index, coefficient, level):
-        """initialize factor object (variable index if available, coefficient, level in expression tree, bounds)"""
-        assert (isinstance(variable_index, (int,)) and variable_index >= 0) or variable_index is None
-        self.variable_index = variable_index
-        assert isinstance(coefficient, (int, float))
-        self.coefficient = coefficient
-        # avoid variable index None and coefficient None
-        assert not (self.variable_index is None and self.coefficient is None)
-        assert isinstance(level, (int,)) and level >= 0
-        self._level = level
-
-        self.lower_bound = None
-        self.upper_bound = None
-
-    def compute_bounds(self, variables):
-        """compute the lower and upper bound of the factor object, given a list of OSILVariables"""
-        if self.variable_index is None:
-            self.lower_bound = self.upper_bound = self.coefficient
-        else:
-            var = variables[self.variable_index]
-            assert isinstance(var, (OSILVariable,)), f"Variables must be list of OSILVariable objects"
-            if var.lb is None:
-                lb = -np.inf
-            else:
-                lb = self.coefficient * var.lb
-            if var.ub is None:
-                ub = np.inf
-            else:
-                ub = self.coefficient * var.ub
-            self.lower_bound = min(lb, ub)
-            self.upper_bound = max(lb, ub)
-
-            self.lower_bound = None if np.isinf(-self.lower_bound) else self.lower_bound
-            self.upper_bound = None if np.isinf(self.upper_bound) else self.upper_bound
+        return eval_expression(self, variables)
 
-        return self.lower_bound, self.upper_bound
-
-    def get_level(self):
-        """return level in expression tree"""
-        return self._level
-
-    def eval(self, variables):
-        """return variable or coefficient"""
-        if self.variable_index is None:
-            return self.coefficient
-        else:
-            return self.coefficient * variables[self.variable_index]
 
+class OSILProduct(OSILExpr):
+    KIND = KIND_EXPR
+    __slots__ = ('factors', '_level', 'lower_bound', 'upper_bound', '_cached_version')
 
-class OSILProduct(object):
     def __init__(self, factors, level):
         """initialize product object as list of factor objects or other nonlinear expressions, level in expr. tree, and
         bounds"""
-        assert isinstance(factors, (list,)) and len(factors) > 0
+        if _DEBUG:
+            assert isinstance(factors, (list,)) and len(factors) > 0
         self.factors = factors
         # TODO: assertion for entity types
-        assert isinstance(level, (int,)) and level >= 0
+        if _DEBUG:
+            assert isinstance(level, (int,)) and level >= 0
         self._level = level
 
         self.lower_bound = None
         self.upper_bound = None
 
-        self.arg_lbs = []
-        self.arg_ubs = []
-
+    @_memoize_bounds
     def compute_bounds(self, variables):
         """computing the bounds given a list of OSILVariables"""
-        current_lb, current_ub = 1, 1
-        # iterate over factors, compute bounds of factor, adjust current lower and upper bound accordingly
+        # first pass: fold all constant factors (lb == ub) into one scalar and collect the remaining intervals
+        constant = 1.0
+        interval_bounds = []
         for factor in self.factors:
             lb, ub = factor.compute_bounds(variables)
-            # store lb and ub
-            self.arg_lbs.append(lb)
-            self.arg_ubs.append(ub)
-            # if a bound is None, compute with +- inf
-            lb = -np.inf if lb is None else lb
-            ub = np.inf if ub is None else ub
-            if current_lb <= 0:
-                temp_lb = current_lb * ub
-            else:
-                temp_lb = current_lb * lb
-
-            if current_ub <= 0:
-                temp_ub = current_ub * lb
+            if lb is not None and lb == ub:
+                constant *= lb
+                # a zero factor pins the product to zero regardless of the other factors; exit without
+                # bounding the remaining factors (they are bounded on demand wherever they are shared)
+                if constant == 0:
+                    self.lower_bound = self.upper_bound = 0
+                    return self.lower_bound, self.upper_bound
             else:
-                temp_ub = current_ub * ub
+                interval_bounds.append((lb, ub))
 
-            current_lb = min(temp_lb, temp_ub)
-            current_ub = max(temp_lb, temp_ub)
-
-            # temp_lb = min(current_lb * lb, current_lb * ub)
-            # temp_ub = max(current_ub * ub, current_ub * lb)
-            # current_lb = min(temp_lb, temp_ub)
-            # current_ub = max(temp_lb, temp_ub)
-            #current_lb = min(current_lb * lb, current_lb * ub, current_ub * lb, current_ub * ub)
-            #current_ub = max(current_lb * lb, current_lb * ub, current_ub * lb, current_ub * ub)
-
-        if current_lb > -np.inf:
+        current_lb = current_ub = constant
+        # iterate over the non-constant factors and adjust current lower and upper bound accordingly
+        for lb, ub in interval_bounds:
+            # if a bound is None, compute with +- inf
+            lb = -_INF if lb is None else lb
+            ub = _INF if ub is None else ub
+            # branchless four-corner interval product; correct for all sign combinations of the running bounds
+            corners = (current_lb * lb, current_lb * ub, current_ub * lb, current_ub * ub)
+            current_lb = min(corners)
+            current_ub = max(corners)
+
+        if current_lb > -_INF:
             self.lower_bound = current_lb
-        if current_ub < np.inf:
+        if current_ub < _INF:
             self.upper_bound = current_ub
 
         return self.lower_bound, self.upper_bound
@@ -248,7 +420,8 @@ class OSILProduct(object):
     def remove_factor(self, index):
         """removal of product entity"""
         assert isinstance(index, (int,))
-        self.factors = self.factors[:index] + self.factors[(index + 1):]
+        # in-place deletion; rebuilding the list would copy all remaining references
+        del self.factors[index]
 
     def get_level(self):
         """return level in expression tree"""
@@ -256,26 +429,30 @@ class OSILProduct(object):
 
     def eval(self, variables):
         """return product of factor entities in evaluated form """
-        product = 1
-        for entity in self.factors:
-            product *= entity.eval(variables)
-        return product
+        return eval_expression(self, variables)
 
 
-class OSILSquare(object):
+class OSILSquare(OSILExpr):
+    KIND = KIND_EXPR
+    __slots__ = ('expression', 'expression_kind', '_level', 'coefficient', 'lower_bound', 'upper_bound', 'arg_lb',
+                 'arg_ub', '_cached_version', '__weakref__')
+
     def __init__(self, expression, level, coefficient=1.0):
         """initialize square object (variable index, level in expression tree, variable coefficient, bounds)"""
-        if isinstance(expression, (int,)):
-            assert expression >= 0, f"Invalid variable index {expression}!"
-        else:
-            assert isinstance(expression, (OSILSum, OSILProduct, OSILSquare, OSILPower, OSILCosine, OSILSine,
-                                           OSILNegate, OSILDivide, OSILSquareroot, OSILExp, OSILAbs, OSILLn, OSILLog10))
+        if _DEBUG:
+            if isinstance(expression, (int,)):
+                assert expression >= 0, f"Invalid variable index {expression}!"
+            else:
+                assert isinstance(expression, OSILExpr)
         self.expression = expression
+        self.expression_kind = _child_kind(expression)
 
-        assert isinstance(level, (int,)) and level >= 0
+        if _DEBUG:
+            assert isinstance(level, (int,)) and level >= 0
         self._level = level
 
-        assert isinstance(coefficient, (float,))
+        if _DEBUG:
+            assert isinstance(coefficient, (float,))
         self.coefficient = coefficient
 
         self.lower_bound = None
@@ -284,19 +461,19 @@ class OSILSquare(object):
         self.arg_lb = None
         self.arg_ub = None
 
+    @_memoize_bounds
     def compute_bounds(self, variables):
         """computing the bounds given a list of OSILVariables"""
         # compute the bounds of the argument
-        if isinstance(self.expression, (int,)):
+        if self.expression_kind == KIND_VAR:
             assert self.expression < len(variables), f"Variable index must occur in given list of OSILVariables"
             var = variables[self.expression]
-            current_lb = var.lb
-            current_ub = var.ub
+            # the variable bounds are pre-encoded as floats, so no None conversion is needed
+            lb, ub = _multiply_interval(var.lb_inf, var.ub_inf, self.coefficient)
         else:
             current_lb, current_ub = self.expression.compute_bounds(variables)
-
-        # set None as +- infinity for computations and multiply with coefficient
-        lb, ub = bounds_convert_and_multiply(current_lb, current_ub, self.coefficient)
+            # set None as +- infinity for computations and multiply with coefficient
+            lb, ub = bounds_convert_and_multiply(current_lb, current_ub, self.coefficient)
 
         # store argument bounds
         self.arg_lb = lb
@@ -307,9 +484,9 @@ class OSILSquare(object):
             self.lower_bound = 0
         else:
             lb = min(lb ** 2, ub ** 2)
-            self.lower_bound = None if np.isinf(-lb) else lb
+            self.lower_bound = None if math.isinf(lb) else lb
         ub = max(lb ** 2, ub ** 2)
-        self.upper_bound = None if np.isinf(ub) else ub
+        self.upper_bound = None if math.isinf(ub) else ub
 
         return self.lower_bound, self.upper_bound
 
@@ -319,106 +496,80 @@ class OSILSquare(object):
 
     def eval(self, variables):
         """return variable squared"""
-        # (maybe) TODO: adjust to variables[self.variable_index]*variables[self.variable_index]
-        if isinstance(self.expression, (int,)):
-            return (self.coefficient * variables[self.expression])**2
-        else:
-            return (self.coefficient * self.expression.eval(variables))**2
+        return eval_expression(self, variables)
+
 
+class OSILPower(OSILExpr):
+    KIND = KIND_EXPR
+    __slots__ = ('expression', 'expression_kind', 'exponent', 'exponent_kind', 'base_coefficient',
+                 'exponent_coefficient', '_level', 'lower_bound', 'upper_bound', '_cached_version')
 
-class OSILPower(object):
     def __init__(self, expression, exponent, base_coefficient, exponent_coefficient, level):
         """initialize power object (expression, coefficient, level in expression tree, bounds)"""
         # Check that expression is variable index (int), number (float) or known nl expression
-        if isinstance(expression, (int, float)):
-            # expression is variable index or base number
-            assert expression >= 0, f"Variable index or base number has to be greater or equal than 0"
-        else:
-            assert isinstance(expression, (OSILSum, OSILProduct, OSILSquare, OSILPower, OSILCosine, OSILSine,
-                                           OSILNegate, OSILDivide, OSILSquareroot, OSILExp, OSILAbs, OSILLn, OSILLog10))
+        if _DEBUG:
+            if isinstance(expression, (int, float)):
+                # expression is variable index or base number
+                assert expression >= 0, f"Variable index or base number has to be greater or equal than 0"
+            else:
+                assert isinstance(expression, OSILExpr)
         self.expression = expression
+        self.expression_kind = _child_kind(expression)
 
         # Check that exponent is variable index (int), number (float) or known nl expression
-        if isinstance(exponent, (int,)):
-            # expression is variable index
-            assert exponent >= 0, f"Variable index has to be greater or equal than 0"
-        elif isinstance(exponent, (float,)):
-            assert exponent != 0, f"Exponent must be different from zero"
-        else:
-            assert isinstance(exponent, (OSILSum, OSILProduct, OSILSquare, OSILPower, OSILCosine, OSILSine, OSILNegate,
-                                         OSILDivide, OSILSquareroot, OSILExp, OSILAbs, OSILLn, OSILLog10))
+        if _DEBUG:
+            if isinstance(exponent, (int,)):
+                # expression is variable index
+                assert exponent >= 0, f"Variable index has to be greater or equal than 0"
+            elif isinstance(exponent, (float,)):
+                assert exponent != 0, f"Exponent must be different from zero"
+            else:
+                assert isinstance(exponent, OSILExpr)
         self.exponent = exponent
+        self.exponent_kind = _child_kind(exponent)
 
-        assert isinstance(base_coefficient, (int, float))
+        if _DEBUG:
+            assert isinstance(base_coefficient, (int, float))
         self.base_coefficient = base_coefficient
-        assert isinstance(exponent_coefficient, (int, float))
+        if _DEBUG:
+            assert isinstance(exponent_coefficient, (int, float))
         self.exponent_coefficient = exponent_coefficient
 
-        assert isinstance(level, (int,)) and level >= 0
+        if _DEBUG:
+            assert isinstance(level, (int,)) and level >= 0
         self._level = level
 
         self.lower_bound = None
         self.upper_bound = None
 
-        self.base_lb = None
-        self.base_ub = None
-        self.exp_lb = None
-        self.exp_ub = None
-
+    @_memoize_bounds
     def compute_bounds(self, variables):
         """computing the bounds given a list of OSILVariables"""
         # compute the lower and upper bounds of base and exponent (times coefficient)
         bounds = []
-        for argument, coefficient in zip([self.expression, self.exponent],
-                                         [self.base_coefficient, self.exponent_coefficient]):
-            if isinstance(argument, (int,)):
+        for argument, kind, coefficient in zip([self.expression, self.exponent],
+                                               [self.expression_kind, self.exponent_kind],
+                                               [self.base_coefficient, self.exponent_coefficient]):
+            if kind == KIND_VAR:
                 assert self.expression < len(variables), f"Variable index must occur in given list of OSILVariables"
                 var = variables[argument]
-                curr_lb = var.lb
-                curr_ub = var.ub
-            elif isinstance(argument, (float,)):
-                curr_lb = curr_ub = argument
+                # the variable bounds are pre-encoded as floats, so no None conversion is needed
+                lb, ub = _multiply_interval(var.lb_inf, var.ub_inf, coefficient)
+            elif kind == KIND_CONST:
+                lb = ub = coefficient * argument
             else:
                 curr_lb, curr_ub = argument.compute_bounds(variables)
-
-            # set None as +- infinity for computations and multiply with coefficient
-            lb, ub = bounds_convert_and_multiply(curr_lb, curr_ub, coefficient)
+                # set None as +- infinity for computations and multiply with coefficient
+                lb, ub = bounds_convert_and_multiply(curr_lb, curr_ub, coefficient)
             bounds += [lb, ub]
 
         lb_base, ub_base, lb_exponent, ub_exponent = bounds
-        # store bounds
-        self.base_lb = lb_base
-        self.base_ub = ub_base
-        self.exp_lb = lb_exponent
-        self.exp_ub = ub_exponent
-
-        # for constant and integral exponent, we apply a case distinction
-        if lb_exponent == ub_exponent == int(ub_exponent):
-            # if exponent is even, lower bound is either zero (if feasible) or regarding upper/lower bound
-            if int(ub_exponent) % 2 == 0:
-                if lb_base <= 0.0 <= ub_base:
-                    self.lower_bound = 0
-                else:
-                    self.lower_bound = min(lb_base ** ub_exponent, ub_base ** ub_exponent)
-                self.upper_bound = max(lb_base ** ub_exponent, ub_base ** ub_exponent)
-            # if exponent is odd, function is monotonously increasing
-            else:
-                self.lower_bound = lb_base ** ub_exponent
-                self.upper_bound = ub_base ** ub_exponent
-
-        # if base can be negative, we apply no bounds, otherwise lb is minimum of smallest base < 1 and largest exponent
-        # and largest base with smallest exponent; ub vice versa
-        elif lb_base < 0 and lb_exponent != ub_exponent:
-            print(f"possible negative base for power constraint detected")
+        lower, upper = _power_interval(lb_base, ub_base, lb_exponent, ub_exponent)
+        if lower is None:
+            # negative base with a varying exponent, keep the bounds as they are
             return self.lower_bound, self.upper_bound
-        else:
-            self.lower_bound = min(lb_base**ub_exponent, ub_base**lb_exponent)
-            self.upper_bound = max(lb_base**lb_exponent, ub_base**ub_exponent)
-
-        if np.isinf(-self.lower_bound):
-            self.lower_bound = None
-        if np.isinf(self.upper_bound):
-            self.upper_bound = None
+        self.lower_bound = None if math.isinf(lower) else lower
+        self.upper_bound = None if math.isinf(upper) else upper
 
         return self.lower_bound, self.upper_bound
 
@@ -433,42 +584,31 @@ class OSILPower(object):
 
     def eval(self, variables):
         """return variable or expression to the power of exponent """
-        # compute base
-        if isinstance(self.expression, (int,)):
-            base = variables[self.expression]
-        elif isinstance(self.expression, (float,)):
-            base = self.expression
-        else:
-            base = self.expression.eval(variables)
-        base *= self.base_coefficient
-
-        # compute exponent
-        if isinstance(self.exponent, (int,)):
-            exponent = variables[self.exponent]
-        elif isinstance(self.exponent, (float,)):
-            exponent = self.exponent
-        else:
-            exponent = self.exponent.eval(variables)
-        exponent *= self.exponent_coefficient
+        return eval_expression(self, variables)
 
-        return base**exponent
 
+class OSILCosine(OSILExpr):
+    KIND = KIND_EXPR
+    __slots__ = ('expression', 'expression_kind', 'coefficient', '_level', 'lower_bound', 'upper_bound', 'arg_lb',
+                 'arg_ub', '_cached_version', '__weakref__')
 
-class OSILCosine(object):
     def __init__(self, expression, level, coefficient=1.0):
         """initialize cosine object (expression, level in expression tree, bounds)"""
-        if isinstance(expression, (int,)):
-            # expression is supposed to be variable index
-            assert expression >= 0
-        else:
-            assert isinstance(expression, (OSILSum, OSILProduct, OSILSquare, OSILPower, OSILCosine, OSILSine,
-                                           OSILNegate, OSILDivide, OSILSquareroot, OSILExp, OSILAbs, OSILLn, OSILLog10))
+        if _DEBUG:
+            if isinstance(expression, (int,)):
+                # expression is supposed to be variable index
+                assert expression >= 0
+            else:
+                assert isinstance(expression, OSILExpr)
         self.expression = expression
+        self.expression_kind = _child_kind(expression)
 
-        assert isinstance(coefficient, (float,))
+        if _DEBUG:
+            assert isinstance(coefficient, (float,))
         self.coefficient = coefficient
 
-        assert isinstance(level, (int,)) and level >= 0
+        if _DEBUG:
+            assert isinstance(level, (int,)) and level >= 0
         self._level = level
 
         self.lower_bound = -1
@@ -477,40 +617,40 @@ class OSILCosine(object):
         self.arg_lb = None
         self.arg_ub = None
 
+    @_memoize_bounds
     def compute_bounds(self, variables):
         """computing the bounds given a list of OSILVariables"""
-        if isinstance(self.expression, (int,)):
-            # extract lower and upper bound from variables
+        if self.expression_kind == KIND_VAR:
+            # extract lower and upper bound from variables (pre-encoded as floats, no None conversion needed)
             assert self.expression < len(variables), f"Variable index must occur in given list of OSILVariables"
             var = variables[self.expression]
-            curr_lb = var.lb
-            curr_ub = var.ub
+            lb, ub = _multiply_interval(var.lb_inf, var.ub_inf, self.coefficient)
         else:
             curr_lb, curr_ub = self.expression.compute_bounds(variables)
-        lb, ub = bounds_convert_and_multiply(curr_lb, curr_ub, self.coefficient)
+            lb, ub = bounds_convert_and_multiply(curr_lb, curr_ub, self.coefficient)
         # store argument bounds
         self.arg_lb = lb
         self.arg_ub = ub
 
+        # an unbounded argument always covers both extrema (math.ceil would overflow on infinity)
+        if math.isinf(lb) or math.isinf(ub):
+            self.lower_bound = -1
+            self.upper_bound = 1
+            return self.lower_bound, self.upper_bound
+
         # TODO: check calculations below
         # if -pi + multiple of 2 * pi is between lb and ub, lb is -1, else lb is minimum of cos(lb) and cos(ub)
         # -pi + k * (2pi) in [lb, ub] <-> k * (2pi) in [lb + pi, ub + pi] <-> k in [(lb + pi)/(2pi), (ub + pi)/(2pi)]
-        temp_lb = (lb + np.pi) / (2*np.pi)
-        temp_ub = (ub + np.pi) / (2*np.pi)
-        next_int = np.ceil(temp_lb)
-        if next_int <= temp_ub:
+        if math.ceil((lb + _PI) / _TWO_PI) <= (ub + _PI) / _TWO_PI:
             self.lower_bound = -1
         else:
-            self.lower_bound = min(np.cos(lb), np.cos(ub))
+            self.lower_bound = min(math.cos(lb), math.cos(ub))
         # if a multiple of 2 * pi is between lb and ub, ub is 1, else ub is maximum of cos(lb) and cos(ub)
         # k * (2pi) in [lb, ub] <-> k in [lb / (2pi), ub / (2pi)]
-        temp_lb = lb / (2*np.pi)
-        temp_ub = ub / (2*np.pi)
-        next_int = np.ceil(temp_lb)
-        if next_int <= temp_ub:
+        if math.ceil(lb / _TWO_PI) <= ub / _TWO_PI:
             self.upper_bound = 1
         else:
-            self.upper_bound = max(np.cos(lb), np.cos(ub))
+            self.upper_bound = max(math.cos(lb), math.cos(ub))
 
         return self.lower_bound, self.upper_bound
 
@@ -520,29 +660,30 @@ class OSILCosine(object):
 
     def eval(self, variables):
         """return pyo cosine of the variable"""
-        if isinstance(self.expression, (int,)):
-            argument = variables[self.expression]
-        else:
-            argument = self.expression.eval(variables)
-        argument *= self.coefficient
+        return eval_expression(self, variables)
 
-        return pyo.cos(argument)
 
+class OSILSine(OSILExpr):
+    KIND = KIND_EXPR
+    __slots__ = ('expression', 'expression_kind', 'coefficient', '_level', 'lower_bound', 'upper_bound', 'arg_lb',
+                 'arg_ub', '_cached_version', '__weakref__')
 
-class OSILSine(object):
     def __init__(self, expression, level, coefficient=1.0):
         """initialize sine object (expression, level in expression tree, bounds)"""
-        if isinstance(expression, (int,)):
-            assert expression >= 0
-        else:
-            assert isinstance(expression, (OSILSum, OSILProduct, OSILSquare, OSILPower, OSILCosine, OSILSine,
-                                           OSILNegate, OSILDivide, OSILSquareroot, OSILExp, OSILAbs, OSILLn, OSILLog10))
+        if _DEBUG:
+            if isinstance(expression, (int,)):
+                assert expression >= 0
+            else:
+                assert isinstance(expression, OSILExpr)
         self.expression = expression
+        self.expression_kind = _child_kind(expression)
 
-        assert isinstance(coefficient, (float,))
+        if _DEBUG:
+            assert isinstance(coefficient, (float,))
         self.coefficient = coefficient
 
-        assert isinstance(level, (int,)) and level >= 0
+        if _DEBUG:
+            assert isinstance(level, (int,)) and level >= 0
         self._level = level
 
         self.lower_bound = -1
@@ -551,43 +692,43 @@ class OSILSine(object):
         self.arg_lb = None
         self.arg_ub = None
 
+    @_memoize_bounds
     def compute_bounds(self, variables):
         """computing the bounds given a list of OSILVariables"""
-        if isinstance(self.expression, (int,)):
-            # extract lower and upper bound from variables
+        if self.expression_kind == KIND_VAR:
+            # extract lower and upper bound from variables (pre-encoded as floats, no None conversion needed)
             assert self.expression < len(variables), f"Variable index must occur in given list of OSILVariables"
             var = variables[self.expression]
-            curr_lb = var.lb
-            curr_ub = var.ub
+            lb, ub = _multiply_interval(var.lb_inf, var.ub_inf, self.coefficient)
         else:
             curr_lb, curr_ub = self.expression.compute_bounds(variables)
-        lb, ub = bounds_convert_and_multiply(curr_lb, curr_ub, self.coefficient)
+            lb, ub = bounds_convert_and_multiply(curr_lb, curr_ub, self.coefficient)
 
         # store argument bounds
         self.arg_lb = lb
         self.arg_ub = ub
 
+        # an unbounded argument always covers both extrema (math.ceil would overflow on infinity)
+        if math.isinf(lb) or math.isinf(ub):
+            self.lower_bound = -1
+            self.upper_bound = 1
+            return self.lower_bound, self.upper_bound
+
         # TODO: check calculations below
         # if -1/2 pi + multiple of 2 * pi is between lb and ub, lb is -1, else lb is minimum of sin(lb) and sin(ub)
         # -pi/2 + k * (2pi) in [lb, ub] <-> k * (2pi) in [lb + pi/2, ub + pi/2] <->
         # k in [(lb + pi/2)/(2pi), (ub + pi/2)/(2pi)]
-        temp_lb = (lb + np.pi/2) / (2 * np.pi)
-        temp_ub = (ub + np.pi/2) / (2 * np.pi)
-        next_int = np.ceil(temp_lb)
-        if next_int <= temp_ub:
+        if math.ceil((lb + _HALF_PI) / _TWO_PI) <= (ub + _HALF_PI) / _TWO_PI:
             self.lower_bound = -1
         else:
-            self.lower_bound = min(np.sin(lb), np.sin(ub))
+            self.lower_bound = min(math.sin(lb), math.sin(ub))
         # if -3/2 pi + multiple of 2 * pi is between lb and ub, ub is 1, else ub is maximum of sin(lb) and sin(ub)
         # -3pi/2 + k * (2pi) in [lb, ub] <-> k * (2pi) in [lb + 3pi/2, ub + 3pi/2] <->
         # k in [(lb + 3pi/2)/(2pi), (ub + 3pi/2)/(2pi)]
-        temp_lb = (lb + 3 * np.pi / 2) / (2 * np.pi)
-        temp_ub = (ub + 3 * np.pi / 2) / (2 * np.pi)
-        next_int = np.ceil(temp_lb)
-        if next_int <= temp_ub:
+        if math.ceil((lb + _THREE_HALF_PI) / _TWO_PI) <= (ub + _THREE_HALF_PI) / _TWO_PI:
             self.upper_bound = 1
         else:
-            self.upper_bound = max(np.sin(lb), np.sin(ub))
+            self.upper_bound = max(math.sin(lb), math.sin(ub))
 
         return self.lower_bound, self.upper_bound
 
@@ -597,22 +738,22 @@ class OSILSine(object):
 
     def eval(self, variables):
         """return pyo sine of the variable"""
-        if isinstance(self.expression, (int,)):
-            argument = variables[self.expression]
-        else:
-            argument = self.expression.eval(variables)
-        argument *= self.coefficient
+        return eval_expression(self, variables)
 
-        return pyo.sin(argument)
 
+class OSILNegate(OSILExpr):
+    KIND = KIND_EXPR
+    __slots__ = ('expression', 'expression_kind', '_level', 'lower_bound', 'upper_bound', 'arg_lb', 'arg_ub',
+                 '_cached_version', '__weakref__')
 
-class OSILNegate(object):
     def __init__(self, expression, level):
         """initialize negate object (= multiply by -1) with (expression and level in expression tree, bounds)"""
-        assert isinstance(expression, (int, OSILSum, OSILProduct, OSILSquare, OSILPower, OSILCosine, OSILSine,
-                                       OSILNegate, OSILDivide, OSILSquareroot, OSILExp, OSILAbs, OSILLn, OSILLog10))
+        if _DEBUG:
+            assert isinstance(expression, (int, OSILExpr))
         self.expression = expression
-        assert isinstance(level, (int,)) and level >= 0
+        self.expression_kind = _child_kind(expression)
+        if _DEBUG:
+            assert isinstance(level, (int,)) and level >= 0
         self._level = level
 
         self.lower_bound = None
@@ -621,26 +762,26 @@ class OSILNegate(object):
         self.arg_lb = None
         self.arg_ub = None
 
+    @_memoize_bounds
     def compute_bounds(self, variables):
         """computing the bounds given a list of OSILVariables"""
         # compute the bounds of the argument
-        if isinstance(self.expression, (int,)):
+        if self.expression_kind == KIND_VAR:
             assert self.expression < len(variables), f"Variable index must occur in given list of OSILVariables"
             var = variables[self.expression]
-            current_lb = var.lb
-            current_ub = var.ub
+            # multiply with coefficient -1 as negate would; variable bounds are pre-encoded as floats
+            lb, ub = _multiply_interval(var.lb_inf, var.ub_inf, -1.0)
         else:
             current_lb, current_ub = self.expression.compute_bounds(variables)
-
-        # set None as +- infinity for computations and multiply with coefficient -1 as negate would
-        lb, ub = bounds_convert_and_multiply(current_lb, current_ub, -1.0)
+            # set None as +- infinity for computations and multiply with coefficient -1 as negate would
+            lb, ub = bounds_convert_and_multiply(current_lb, current_ub, -1.0)
 
         # store argument bounds
         self.arg_lb = lb
         self.arg_ub = ub
 
-        self.lower_bound = None if np.isinf(-lb) else lb
-        self.upper_bound = None if np.isinf(ub) else ub
+        self.lower_bound = None if math.isinf(lb) else lb
+        self.upper_bound = None if math.isinf(ub) else ub
 
         return self.lower_bound, self.upper_bound
 
@@ -650,80 +791,78 @@ class OSILNegate(object):
 
     def eval(self, variables):
         """either return negative of variable or negative of eval of expression"""
-        if isinstance(self.expression, (int,)):
-            return -1 * variables[self.expression]
-        else:
-            return -1 * self.expression.eval(variables)
+        return eval_expression(self, variables)
 
 
-class OSILDivide(object):
+class OSILDivide(OSILExpr):
+    KIND = KIND_EXPR
+    __slots__ = ('numerator', 'numerator_kind', 'numerator_constant', 'numerator_coefficient', 'denominator',
+                 'denominator_kind', 'denominator_coefficient', '_level', 'lower_bound', 'upper_bound',
+                 '_cached_version')
+
     def __init__(self, numerator, denominator, level, numerator_is_constant=False, numerator_coeff=1.0,
                  denominator_coeff=1.0):
         """initialize divide object with (numerator, denominator, and level in expression tree, bounds)"""
-        if numerator_is_constant:
-            assert isinstance(numerator, (float,))
-        else:
-            assert isinstance(numerator, (int, OSILSum, OSILProduct, OSILSquare, OSILPower, OSILCosine, OSILSine,
-                                          OSILNegate, OSILDivide, OSILSquareroot, OSILExp, OSILAbs, OSILLn, OSILLog10))
+        if _DEBUG:
+            if numerator_is_constant:
+                assert isinstance(numerator, (float,))
+            else:
+                assert isinstance(numerator, (int, OSILExpr))
         self.numerator = numerator
+        self.numerator_kind = _child_kind(numerator)
         self.numerator_constant = numerator_is_constant
-        assert isinstance(numerator_coeff, (float,))
+        if _DEBUG:
+            assert isinstance(numerator_coeff, (float,))
         self.numerator_coefficient = numerator_coeff
 
-        assert isinstance(denominator, (int, OSILSum, OSILProduct, OSILSquare, OSILPower, OSILCosine, OSILSine,
-                                        OSILNegate, OSILDivide, OSILSquareroot, OSILExp, OSILAbs, OSILLn, OSILLog10))
+        if _DEBUG:
+            assert isinstance(denominator, (int, OSILExpr))
         self.denominator = denominator
-        assert isinstance(denominator_coeff, (float,))
+        self.denominator_kind = _child_kind(denominator)
+        if _DEBUG:
+            assert isinstance(denominator_coeff, (float,))
+            # a zero denominator coefficient would fail on every eval; reject it once at construction
+            assert denominator_coeff != 0, f"Denominator coefficient must be different from zero"
         self.denominator_coefficient = denominator_coeff
 
-        assert isinstance(level, (int,)) and level >= 0
+        if _DEBUG:
+            assert isinstance(level, (int,)) and level >= 0
         self._level = level
 
         self.lower_bound = None
         self.upper_bound = None
 
-        self.num_lb = None
-        self.num_ub = None
-        self.den_lb = None
-        self.den_ub = None
-
+    @_memoize_bounds
     def compute_bounds(self, variables):
         """computing the bounds given a list of OSILVariables"""
         # compute the lower and upper bounds of base and exponent (times coefficient)
         bounds = []
-        for argument, coefficient in zip([self.numerator, self.denominator],
-                                         [self.numerator_coefficient, self.denominator_coefficient]):
-            if isinstance(argument, (int,)):
+        for argument, kind, coefficient in zip([self.numerator, self.denominator],
+                                               [self.numerator_kind, self.denominator_kind],
+                                               [self.numerator_coefficient, self.denominator_coefficient]):
+            if kind == KIND_VAR:
                 assert argument < len(variables), f"Variable index must occur in given list of OSILVariables"
                 var = variables[argument]
-                curr_lb = var.lb
-                curr_ub = var.ub
-            elif isinstance(argument, (float,)):
-                curr_lb = curr_ub = argument
+                # the variable bounds are pre-encoded as floats, so no None conversion is needed
+                lb, ub = _multiply_interval(var.lb_inf, var.ub_inf, coefficient)
+            elif kind == KIND_CONST:
+                lb = ub = coefficient * argument
             else:
                 curr_lb, curr_ub = argument.compute_bounds(variables)
-
-            # set None as +- infinity for computations and multiply with coefficient
-            lb, ub = bounds_convert_and_multiply(curr_lb, curr_ub, coefficient)
+                # set None as +- infinity for computations and multiply with coefficient
+                lb, ub = bounds_convert_and_multiply(curr_lb, curr_ub, coefficient)
             bounds += [lb, ub]
 
         # if denominator contains zero in bounds, return None bounds
         lb_num, ub_num, lb_den, ub_den = bounds
-
-        # store argument bounds
-        self.num_lb = lb_num
-        self.num_ub = ub_num
-        self.den_lb = lb_den
-        self.den_ub = ub_den
-
         if lb_den <= 0 <= ub_den:
             return self.lower_bound, self.upper_bound
         possible_bounds = [lb_num/lb_den, lb_num/ub_den, ub_num/lb_den, ub_num/ub_den]
         self.lower_bound = min(possible_bounds)
         self.upper_bound = max(possible_bounds)
-        if np.isinf(-self.lower_bound):
+        if math.isinf(self.lower_bound):
             self.lower_bound = None
-        if np.isinf(self.upper_bound):
+        if math.isinf(self.upper_bound):
             self.upper_bound = None
 
         return self.lower_bound, self.upper_bound
@@ -734,32 +873,26 @@ class OSILDivide(object):
 
     def eval(self, variables):
         """return division of numerator/denominator for evals/variables"""
-        if self.numerator_constant:
-            numerator = self.numerator
-        elif isinstance(self.numerator, (int,)):
-            numerator = variables[self.numerator]
-        else:
-            numerator = self.numerator.eval(variables)
-        numerator *= self.numerator_coefficient
-        if isinstance(self.denominator, (int,)):
-            denominator = variables[self.denominator]
-        else:
-            denominator = self.denominator.eval(variables)
-        denominator *= self.denominator_coefficient
-        return numerator/denominator
+        return eval_expression(self, variables)
 
 
-class OSILSquareroot(object):
+class OSILSquareroot(OSILExpr):
+    KIND = KIND_EXPR
+    __slots__ = ('expression', 'expression_kind', '_level', 'lower_bound', 'upper_bound', 'arg_lb', 'arg_ub',
+                 '_cached_version', '__weakref__')
+
     def __init__(self, expression, level):
         """initialize square root object (variable index, level in expression tree, bounds)"""
-        if isinstance(expression, (int,)):
-            assert expression >= 0, f"Invalid variable index {expression}!"
-        else:
-            assert isinstance(expression, (OSILSum, OSILProduct, OSILSquare, OSILPower, OSILCosine, OSILSine,
-                                           OSILNegate, OSILDivide, OSILSquareroot, OSILExp, OSILAbs, OSILLn, OSILLog10))
+        if _DEBUG:
+            if isinstance(expression, (int,)):
+                assert expression >= 0, f"Invalid variable index {expression}!"
+            else:
+                assert isinstance(expression, OSILExpr)
         self.expression = expression
+        self.expression_kind = _child_kind(expression)
 
-        assert isinstance(level, (int,)) and level >= 0
+        if _DEBUG:
+            assert isinstance(level, (int,)) and level >= 0
         self._level = level
 
         self.lower_bound = 0
@@ -768,27 +901,27 @@ class OSILSquareroot(object):
         self.arg_lb = None
         self.arg_ub = None
 
+    @_memoize_bounds
     def compute_bounds(self, variables):
         """computing the bounds given a list of OSILVariables"""
         # compute the bounds of the argument
-        if isinstance(self.expression, (int,)):
+        if self.expression_kind == KIND_VAR:
             assert self.expression < len(variables), f"Variable index must occur in given list of OSILVariables"
             var = variables[self.expression]
-            current_lb = var.lb
-            current_ub = var.ub
+            # the variable bounds are pre-encoded as floats, so no None conversion is needed
+            lb, ub = var.lb_inf, var.ub_inf
         else:
             current_lb, current_ub = self.expression.compute_bounds(variables)
-
-        # set None as +- infinity for computations
-        lb, ub = bounds_convert_and_multiply(current_lb, current_ub, 1.0)
+            # set None as +- infinity for computations
+            lb, ub = bounds_convert_and_multiply(current_lb, current_ub, 1.0)
 
         self.arg_lb = lb
         self.arg_ub = ub
 
         if lb > 0:
-            self.lower_bound = np.sqrt(lb)
-        if not np.isinf(ub):
-            self.upper_bound = np.sqrt(ub)
+            self.lower_bound = math.sqrt(lb)
+        if not math.isinf(ub):
+            self.upper_bound = math.sqrt(ub)
 
         return self.lower_bound, self.upper_bound
 
@@ -798,26 +931,30 @@ class OSILSquareroot(object):
 
     def eval(self, variables):
         """return variable squared"""
-        if isinstance(self.expression, (int,)):
-            return pyo.sqrt(variables[self.expression])
-        else:
-            return pyo.sqrt(self.expression.eval(variables))
+        return eval_expression(self, variables)
+
 
+class OSILExp(OSILExpr):
+    KIND = KIND_EXPR
+    __slots__ = ('expression', 'expression_kind', 'coefficient', '_level', 'lower_bound', 'upper_bound', 'arg_lb',
+                 'arg_ub', '_cached_version', '__weakref__')
 
-class OSILExp(object):
     def __init__(self, expression, level, coefficient=1.0):
         """initialize exp function object (variable index, level in expression tree, bounds)"""
-        if isinstance(expression, (int,)):
-            assert expression >= 0, f"Invalid variable index {expression}!"
-        else:
-            assert isinstance(expression, (OSILSum, OSILProduct, OSILSquare, OSILPower, OSILCosine, OSILSine,
-                                           OSILNegate, OSILDivide, OSILSquareroot, OSILExp, OSILAbs, OSILLn, OSILLog10))
+        if _DEBUG:
+            if isinstance(expression, (int,)):
+                assert expression >= 0, f"Invalid variable index {expression}!"
+            else:
+                assert isinstance(expression, OSILExpr)
         self.expression = expression
+        self.expression_kind = _child_kind(expression)
 
-        assert isinstance(coefficient, (float,))
+        if _DEBUG:
+            assert isinstance(coefficient, (float,))
         self.coefficient = coefficient
 
-        assert isinstance(level, (int,)) and level >= 0
+        if _DEBUG:
+            assert isinstance(level, (int,)) and level >= 0
         self._level = level
 
         self.lower_bound = 0
@@ -826,30 +963,30 @@ class OSILExp(object):
         self.arg_lb = None
         self.arg_ub = None
 
+    @_memoize_bounds
     def compute_bounds(self, variables):
         """computing the bounds given a list of OSILVariables"""
         # compute the bounds of the argument
-        if isinstance(self.expression, (int,)):
+        if self.expression_kind == KIND_VAR:
             assert self.expression < len(variables), f"Variable index must occur in given list of OSILVariables"
             var = variables[self.expression]
-            current_lb = var.lb
-            current_ub = var.ub
+            # the variable bounds are pre-encoded as floats, so no None conversion is needed
+            lb, ub = _multiply_interval(var.lb_inf, var.ub_inf, self.coefficient)
         else:
             current_lb, current_ub = self.expression.compute_bounds(variables)
-
-        # set None as +- infinity for computations and multiply with coefficient
-        lb, ub = bounds_convert_and_multiply(current_lb, current_ub, self.coefficient)
+            # set None as +- infinity for computations and multiply with coefficient
+            lb, ub = bounds_convert_and_multiply(current_lb, current_ub, self.coefficient)
 
         # store argument bounds
         self.arg_lb = lb
         self.arg_ub = ub
 
         # if neither lb nor ub is -inf, set lower bound to exp(min(lb, ub))
-        if not np.isinf(-lb) and not np.isinf(-ub):
-            self.lower_bound = np.exp(min(lb, ub))
+        if not math.isinf(lb) and not math.isinf(ub):
+            self.lower_bound = math.exp(min(lb, ub))
         # if neither lb nor ub is inf, set upper bound to exp(max(lb, ub))
-        if not np.isinf(lb) and not np.isinf(ub):
-            self.upper_bound = np.exp(max(lb, ub))
+        if not math.isinf(lb) and not math.isinf(ub):
+            self.upper_bound = math.exp(max(lb, ub))
 
         return self.lower_bound, self.upper_bound
 
@@ -859,26 +996,30 @@ class OSILExp(object):
 
     def eval(self, variables):
         """return exp function of variable or nl """
-        if isinstance(self.expression, (int,)):
-            return pyo.exp(self.coefficient * variables[self.expression])
-        else:
-            return pyo.exp(self.coefficient * self.expression.eval(variables))
+        return eval_expression(self, variables)
 
 
-class OSILAbs(object):
+class OSILAbs(OSILExpr):
+    KIND = KIND_EXPR
+    __slots__ = ('expression', 'expression_kind', '_level', 'coefficient', 'lower_bound', 'upper_bound', 'arg_lb',
+                 'arg_ub', '_cached_version', '__weakref__')
+
     def __init__(self, expression, level, coefficient=1.0):
         """initialize absolute value object (variable index, level in expression tree, coefficient of var, bounds)"""
-        if isinstance(expression, (int,)):
-            assert expression >= 0, f"Invalid variable index {expression}!"
-        else:
-            assert isinstance(expression, (OSILSum, OSILProduct, OSILSquare, OSILPower, OSILCosine, OSILSine,
-                                           OSILNegate, OSILDivide, OSILSquareroot, OSILExp, OSILAbs, OSILLn, OSILLog10))
+        if _DEBUG:
+            if isinstance(expression, (int,)):
+                assert expression >= 0, f"Invalid variable index {expression}!"
+            else:
+                assert isinstance(expression, OSILExpr)
         self.expression = expression
+        self.expression_kind = _child_kind(expression)
 
-        assert isinstance(level, (int,)) and level >= 0
+        if _DEBUG:
+            assert isinstance(level, (int,)) and level >= 0
         self._level = level
 
-        assert isinstance(coefficient, (float,))
+        if _DEBUG:
+            assert isinstance(coefficient, (float,))
         self.coefficient = coefficient
 
         self.lower_bound = 0
@@ -887,19 +1028,19 @@ class OSILAbs(object):
         self.arg_lb = None
         self.arg_ub = None
 
+    @_memoize_bounds
     def compute_bounds(self, variables):
         """computing the bounds given a list of OSILVariables"""
         # compute the bounds of the argument
-        if isinstance(self.expression, (int,)):
+        if self.expression_kind == KIND_VAR:
             assert self.expression < len(variables), f"Variable index must occur in given list of OSILVariables"
             var = variables[self.expression]
-            current_lb = var.lb
-            current_ub = var.ub
+            # the variable bounds are pre-encoded as floats, so no None conversion is needed
+            lb, ub = _multiply_interval(var.lb_inf, var.ub_inf, self.coefficient)
         else:
             current_lb, current_ub = self.expression.compute_bounds(variables)
-
-        # set None as +- infinity for computations and multiply with coefficient
-        lb, ub = bounds_convert_and_multiply(current_lb, current_ub, self.coefficient)
+            # set None as +- infinity for computations and multiply with coefficient
+            lb, ub = bounds_convert_and_multiply(current_lb, current_ub, self.coefficient)
 
         # store argument bounds
         self.arg_lb = lb
@@ -907,9 +1048,9 @@ class OSILAbs(object):
 
         # if 0 is not contained in the argument bounds, lb is computed as minimum of absolute values
         if not (lb <= 0 <= ub):
-            self.lower_bound = min(np.abs(lb), np.abs(ub))
-        self.upper_bound = max(np.abs(lb), np.abs(ub))
-        if np.isinf(self.upper_bound):
+            self.lower_bound = min(abs(lb), abs(ub))
+        self.upper_bound = max(abs(lb), abs(ub))
+        if math.isinf(self.upper_bound):
             self.upper_bound = None
 
         return self.lower_bound, self.upper_bound
@@ -920,26 +1061,30 @@ class OSILAbs(object):
 
     def eval(self, variables):
         """return absolute value of variable or expression"""
-        if isinstance(self.expression, (int,)):
-            return abs(self.coefficient * variables[self.expression])
-        else:
-            return abs(self.expression.eval(variables))
+        return eval_expression(self, variables)
 
 
-class OSILLn(object):
+class OSILLn(OSILExpr):
+    KIND = KIND_EXPR
+    __slots__ = ('expression', 'expression_kind', '_level', 'coefficient', 'lower_bound', 'upper_bound', 'arg_lb',
+                 'arg_ub', '_cached_version', '__weakref__')
+
     def __init__(self, expression, level, coefficient=1.0):
         """initialize ln function object (variable index, level in expression tree, bounds)"""
-        if isinstance(expression, (int,)):
-            assert expression >= 0, f"Invalid variable index {expression}!"
-        else:
-            assert isinstance(expression, (OSILSum, OSILProduct, OSILSquare, OSILPower, OSILCosine, OSILSine,
-                                           OSILNegate, OSILDivide, OSILSquareroot, OSILExp, OSILAbs, OSILLn, OSILLog10))
+        if _DEBUG:
+            if isinstance(expression, (int,)):
+                assert expression >= 0, f"Invalid variable index {expression}!"
+            else:
+                assert isinstance(expression, OSILExpr)
         self.expression = expression
+        self.expression_kind = _child_kind(expression)
 
-        assert isinstance(level, (int,)) and level >= 0
+        if _DEBUG:
+            assert isinstance(level, (int,)) and level >= 0
         self._level = level
 
-        assert isinstance(coefficient, (float,))
+        if _DEBUG:
+            assert isinstance(coefficient, (float,))
         self.coefficient = coefficient
 
         self.lower_bound = None
@@ -948,19 +1093,19 @@ class OSILLn(object):
         self.arg_lb = None
         self.arg_ub = None
 
+    @_memoize_bounds
     def compute_bounds(self, variables):
         """computing the bounds given a list of OSILVariables"""
         # compute the bounds of the argument
-        if isinstance(self.expression, (int,)):
+        if self.expression_kind == KIND_VAR:
             assert self.expression < len(variables), f"Variable index must occur in given list of OSILVariables"
             var = variables[self.expression]
-            current_lb = var.lb
-            current_ub = var.ub
+            # the variable bounds are pre-encoded as floats, so no None conversion is needed
+            lb, ub = _multiply_interval(var.lb_inf, var.ub_inf, self.coefficient)
         else:
             current_lb, current_ub = self.expression.compute_bounds(variables)
-
-        # set None as +- infinity for computations and multiply with coefficient
-        lb, ub = bounds_convert_and_multiply(current_lb, current_ub, self.coefficient)
+            # set None as +- infinity for computations and multiply with coefficient
+            lb, ub = bounds_convert_and_multiply(current_lb, current_ub, self.coefficient)
 
         # store argument bounds
         self.arg_lb = lb
@@ -968,9 +1113,9 @@ class OSILLn(object):
 
         # if lb > 0, compute lower bound as log(lb)
         if lb > 0:
-            self.lower_bound = np.log(lb)
-        if ub < np.inf:
-            self.upper_bound = np.log(ub)
+            self.lower_bound = math.log(lb)
+        if ub < _INF:
+            self.upper_bound = math.log(ub)
 
         return self.lower_bound, self.upper_bound
 
@@ -980,23 +1125,26 @@ class OSILLn(object):
 
     def eval(self, variables):
         """return ln function of variable or expression"""
-        if isinstance(self.expression, (int,)):
-            return pyo.log(self.coefficient * variables[self.expression])
-        else:
-            return pyo.log(self.coefficient * self.expression.eval(variables))
+        return eval_expression(self, variables)
+
 
+class OSILLog10(OSILExpr):
+    KIND = KIND_EXPR
+    __slots__ = ('expression', 'expression_kind', '_level', 'lower_bound', 'upper_bound', 'arg_lb', 'arg_ub',
+                 '_cached_version', '__weakref__')
 
-class OSILLog10(object):
     def __init__(self, expression, level):
         """initialize log10 function object (variable index, level in expression tree)"""
-        if isinstance(expression, (int,)):
-            assert expression >= 0, f"Invalid variable index {expression}!"
-        else:
-            assert isinstance(expression, (OSILSum, OSILProduct, OSILSquare, OSILPower, OSILCosine, OSILSine,
-                                           OSILNegate, OSILDivide, OSILSquareroot, OSILExp, OSILAbs, OSILLn, OSILLog10))
+        if _DEBUG:
+            if isinstance(expression, (int,)):
+                assert expression >= 0, f"Invalid variable index {expression}!"
+            else:
+                assert isinstance(expression, OSILExpr)
         self.expression = expression
+        self.expression_kind = _child_kind(expression)
 
-        assert isinstance(level, (int,)) and level >= 0
+        if _DEBUG:
+            assert isinstance(level, (int,)) and level >= 0
         self._level = level
 
         self.lower_bound = None
@@ -1005,19 +1153,19 @@ class OSILLog10(object):
         self.arg_lb = None
         self.arg_ub = None
 
+    @_memoize_bounds
     def compute_bounds(self, variables):
         """computing the bounds given a list of OSILVariables"""
         # compute the bounds of the argument
-        if isinstance(self.expression, (int,)):
+        if self.expression_kind == KIND_VAR:
             assert self.expression < len(variables), f"Variable index must occur in given list of OSILVariables"
             var = variables[self.expression]
-            current_lb = var.lb
-            current_ub = var.ub
+            # the variable bounds are pre-encoded as floats, so no None conversion is needed
+            lb, ub = var.lb_inf, var.ub_inf
         else:
             current_lb, current_ub = self.expression.compute_bounds(variables)
-
-        # set None as +- infinity for computations and multiply with coefficient
-        lb, ub = bounds_convert_and_multiply(current_lb, current_ub, 1.0)
+            # set None as +- infinity for computations
+            lb, ub = bounds_convert_and_multiply(current_lb, current_ub, 1.0)
 
         # store argument bounds
         self.arg_lb = lb
@@ -1025,9 +1173,9 @@ class OSILLog10(object):
 
         # if lb > 0, compute lower bound as log(lb)
         if lb > 0:
-            self.lower_bound = np.log10(lb)
-        if ub < np.inf:
-            self.upper_bound = np.log10(ub)
+            self.lower_bound = math.log10(lb)
+        if ub < _INF:
+            self.upper_bound = math.log10(ub)
 
         return self.lower_bound, self.upper_bound
 
@@ -1037,30 +1185,37 @@ class OSILLog10(object):
 
     def eval(self, variables):
         """return log10 function of variable or expression"""
-        if isinstance(self.expression, (int,)):
-            return pyo.log10(variables[self.expression])
-        else:
-            return pyo.log10(self.expression.eval(variables))
+        return eval_expression(self, variables)
 
 
 class OSILSignPower(object):
+    KIND = KIND_EXPR
+    __slots__ = ('base', 'exponent', '_level', 'lower_bound', 'upper_bound', 'arg_lb', 'arg_ub', '_exp_m1',
+                 '_cached_version', '__weakref__')
+
     def __init__(self, base, exponent, level):
         """initialize power object (base, exponent, base coefficient, level in expression tree, bounds)"""
         # Check that expression is variable index (int) or number (float) TODO: or known nl expression
-        assert isinstance(base, (int,))
-        # expression is variable index or base number
-        assert base >= 0, f"Variable index has to be greater or equal than 0"
+        if _DEBUG:
+            assert isinstance(base, (int,))
+            # expression is variable index or base number
+            assert base >= 0, f"Variable index has to be greater or equal than 0"
 
         self.base = base
 
         # Check that exponent is number bigger than 1 TODO:variable index (int), number (float) or known nl expression
-        assert isinstance(exponent, (float,))
-        # exponent is number
-        assert exponent > 1, f"Exponent must be greater than one"
+        if _DEBUG:
+            assert isinstance(exponent, (float,))
+            # exponent is number
+            assert exponent > 1, f"Exponent must be greater than one"
 
         self.exponent = exponent
+        # pre-subtracted exponent for the x * |x|**(exp - 1) form; the common exponent 2 takes a plain
+        # multiplication instead of a libm pow call
+        self._exp_m1 = exponent - 1
 
-        assert isinstance(level, (int,)) and level >= 0
+        if _DEBUG:
+            assert isinstance(level, (int,)) and level >= 0
         self._level = level
 
         self.lower_bound = None
@@ -1069,26 +1224,25 @@ class OSILSignPower(object):
         self.arg_lb = None
         self.arg_ub = None
 
+    @_memoize_bounds
     def compute_bounds(self, variables):
         """computing the bounds given a list of OSILVariables"""
         # compute the bounds of the argument
         assert self.base < len(variables), f"Variable index must occur in given list of OSILVariables"
         var = variables[self.base]
-        current_lb = var.lb
-        current_ub = var.ub
-
-        # set None as +- infinity for computations and multiply with coefficient
-        lb, ub = bounds_convert_and_multiply(current_lb, current_ub, 1.0)
+        # the variable bounds are pre-encoded as floats, so no None conversion is needed
+        lb, ub = var.lb_inf, var.ub_inf
 
         # store the argument bounds
         self.arg_lb = lb
         self.arg_ub = ub
 
+        exp_m1 = self._exp_m1
         # if lb > -infinity, lower bound is lb * abs(lb)**(exp - 1)
-        if lb > -np.inf:
-            self.lower_bound = lb * np.abs(lb)**(self.exponent - 1)
-        if ub < np.inf:
-            self.upper_bound = ub * np.abs(ub)**(self.exponent - 1)
+        if lb > -_INF:
+            self.lower_bound = lb * abs(lb) if exp_m1 == 1.0 else lb * abs(lb) ** exp_m1
+        if ub < _INF:
+            self.upper_bound = ub * abs(ub) if exp_m1 == 1.0 else ub * abs(ub) ** exp_m1
 
         return self.lower_bound, self.upper_bound
 
@@ -1098,17 +1252,201 @@ class OSILSignPower(object):
 
     def eval(self, variables):
         """return variable * abs(variable)^(exponent - 1) in order to account for signpower """
-        # compute expression and return
-        return variables[self.base] * abs(variables[self.base])**(self.exponent - 1)
+        # compute expression and return; exponent 2 skips the pow call entirely
+        value = variables[self.base]
+        if self._exp_m1 == 1.0:
+            return value * abs(value)
+        return value * abs(value) ** self._exp_m1
+
+    def eval_batch(self, var_values):
+        """
+        evaluate the signpower on many samples at once via the identity x * |x|**(e-1) == copysign(|x|**e, x)
+
+        :param var_values: 2d numpy array of variable values, one sample per row
+        :return: numpy array with the signpower value of each sample
+        """
+        values = var_values[..., self.base]
+        return np.copysign(np.abs(values) ** self.exponent, values)
+
+
+# kept as tuples for callers that want to enumerate the node classes; the constructors check against the
+# shared OSILExpr base instead
+EXPRESSION_CLASSES = (OSILSum, OSILProduct, OSILSquare, OSILPower, OSILCosine, OSILSine, OSILNegate,
+                      OSILDivide, OSILSquareroot, OSILExp, OSILAbs, OSILLn, OSILLog10)
+INT_OR_EXPRESSION_CLASSES = (int,) + EXPRESSION_CLASSES
+
+
+def _operand(child, kind, values, variables):
+    """resolve one operand of a node during the iterative evaluation: a variable index maps to its pyomo
+    variable, a constant to itself, and an expression child to the value popped from the value stack"""
+    if kind == KIND_VAR:
+        return variables[child]
+    if kind == KIND_CONST:
+        return child
+    return values.pop()
+
+
+def _expression_children(node):
+    """return the expression children of a node that have to be evaluated before the node itself"""
+    node_class = type(node)
+    if node_class is OSILSum:
+        return node.sum_entities
+    if node_class is OSILProduct:
+        return node.factors
+    if node_class is OSILPower:
+        children = []
+        if node.expression_kind == KIND_EXPR:
+            children.append(node.expression)
+        if node.exponent_kind == KIND_EXPR:
+            children.append(node.exponent)
+        return children
+    if node_class is OSILDivide:
+        children = []
+        if node.numerator_kind == KIND_EXPR:
+            children.append(node.numerator)
+        if node.denominator_kind == KIND_EXPR:
+            children.append(node.denominator)
+        return children
+    if node_class is OSILLinearTerm or node_class is OSILSignPower:
+        return ()
+    # remaining classes are the unary non-linearities with a single argument expression
+    return (node.expression,) if node.expression_kind == KIND_EXPR else ()
+
+
+def _combine_sum(node, values, variables):
+    if node.packed:
+        # packed sums carry no summand objects, evaluate straight from the arrays
+        coefs, vidx = node._linear_terms
+        summing = 0
+        for k in range(len(coefs)):
+            summing += coefs[k] * variables[vidx[k]]
+        return summing
+    n_entities = len(node.sum_entities)
+    entity_values = values[-n_entities:]
+    del values[-n_entities:]
+    summing = 0
+    for value in entity_values:
+        summing += value
+    return summing
+
+
+def _combine_product(node, values, variables):
+    n_factors = len(node.factors)
+    factor_values = values[-n_factors:]
+    del values[-n_factors:]
+    product = 1
+    for value in factor_values:
+        product *= value
+    return product
+
+
+def _combine_square(node, values, variables):
+    return (node.coefficient * _operand(node.expression, node.expression_kind, values, variables)) ** 2
+
+
+def _combine_power(node, values, variables):
+    # the exponent child was evaluated last, so it is resolved (popped) first
+    exponent = _operand(node.exponent, node.exponent_kind, values, variables) * node.exponent_coefficient
+    base = _operand(node.expression, node.expression_kind, values, variables) * node.base_coefficient
+    return base ** exponent
+
+
+def _combine_cos(node, values, variables):
+    return _pyo_cos(node.coefficient * _operand(node.expression, node.expression_kind, values, variables))
+
+
+def _combine_sin(node, values, variables):
+    return _pyo_sin(node.coefficient * _operand(node.expression, node.expression_kind, values, variables))
+
+
+def _combine_negate(node, values, variables):
+    return -1 * _operand(node.expression, node.expression_kind, values, variables)
+
+
+def _combine_divide(node, values, variables):
+    # the denominator child was evaluated last, so it is resolved (popped) first
+    denominator = _operand(node.denominator, node.denominator_kind, values, variables) * node.denominator_coefficient
+    numerator = _operand(node.numerator, node.numerator_kind, values, variables) * node.numerator_coefficient
+    return numerator / denominator
+
+
+def _combine_sqrt(node, values, variables):
+    return _pyo_sqrt(_operand(node.expression, node.expression_kind, values, variables))
+
+
+def _combine_exp(node, values, variables):
+    return _pyo_exp(node.coefficient * _operand(node.expression, node.expression_kind, values, variables))
+
+
+def _combine_abs(node, values, variables):
+    # the coefficient only applies to a plain variable argument, as in the original recursive evaluation
+    if node.expression_kind == KIND_VAR:
+        return abs(node.coefficient * variables[node.expression])
+    return abs(values.pop())
+
+
+def _combine_ln(node, values, variables):
+    return _pyo_log(node.coefficient * _operand(node.expression, node.expression_kind, values, variables))
+
+
+def _combine_log10(node, values, variables):
+    return _pyo_log10(_operand(node.expression, node.expression_kind, values, variables))
+
+
+def _combine_leaf(node, values, variables):
+    # summands, factors and signpowers evaluate themselves without recursion
+    return node.eval(variables)
+
+
+# per-class combination of evaluated children into the node value; mirrors the former recursive eval bodies
+_EVAL_COMBINERS = {OSILLinearTerm: _combine_leaf, OSILSignPower: _combine_leaf,
+                   OSILSum: _combine_sum, OSILProduct: _combine_product, OSILSquare: _combine_square,
+                   OSILPower: _combine_power, OSILCosine: _combine_cos, OSILSine: _combine_sin,
+                   OSILNegate: _combine_negate, OSILDivide: _combine_divide, OSILSquareroot: _combine_sqrt,
+                   OSILExp: _combine_exp, OSILAbs: _combine_abs, OSILLn: _combine_ln, OSILLog10: _combine_log10}
+
+
+def eval_expression(root, variables):
+    """
+    evaluate an expression tree with an explicit postorder stack instead of recursion; deeply nested
+    expressions neither hit the interpreter recursion limit nor pay one python frame per node
+
+    :param root: the root expression node to evaluate
+    :param variables: list of pyomo variables (or plain numbers) the variable indices refer to
+    :return: the evaluated (pyomo) expression
+    """
+    combiners = _EVAL_COMBINERS
+    stack = [(root, False)]
+    values = []
+    # per-call memo of already evaluated nodes; shared (hash-consed) subexpressions appearing several times
+    # in one tree are built once and their value is reused
+    memo = {}
+    while stack:
+        node, visited = stack.pop()
+        if visited:
+            value = combiners[type(node)](node, values, variables)
+            memo[id(node)] = value
+            values.append(value)
+        else:
+            if id(node) in memo:
+                values.append(memo[id(node)])
+                continue
+            stack.append((node, True))
+            # push the children in reverse so they are evaluated (and their values stacked) left to right
+            children = _expression_children(node)
+            for child_index in range(len(children) - 1, -1, -1):
+                stack.append((children[child_index], False))
+    return values.pop()
 
 
 def bounds_convert_and_multiply(curr_lb, curr_ub, coefficient):
     """ recalculating None to +- infinity, multiplying with coefficient and adjust lb/ub accordingly """
     # set None as +- infinity for computations and multiply with coefficient
-    curr_lb = -np.inf if curr_lb is None else curr_lb
-    curr_ub = np.inf if curr_ub is None else curr_ub
-
-    lb = min(coefficient * curr_lb, coefficient * curr_ub)
-    ub = max(coefficient * curr_lb, coefficient * curr_ub)
-
-    return lb, ub
+    curr_lb = -_INF if curr_lb is None else curr_lb
+    curr_ub = _INF if curr_ub is None else curr_ub
+
+    # the coefficient sign decides which endpoint becomes the lower one; a single sign test replaces the
+    # min/max calls over both products
+    if coefficient >= 0:
+        return coefficient * curr_lb, coefficient * curr_ub
+    return coefficient * curr_ub, coefficient * curr_lb
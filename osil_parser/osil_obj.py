@@ -1,25 +1,51 @@
+import numpy as np
+
+# constructor argument validation is gated behind this flag, mirroring osil_expressions; running under -O
+# skips the per-coefficient isinstance checks
+_DEBUG = __debug__
+
+
 class OSILObjective(object):
+    __slots__ = ('name', 'direction', 'n_coeffs', 'coeffs', 'constant', '_idx', '_coef')
+
     def __init__(self, name, direction, n_coeffs, coeffs, constant):
-        assert isinstance(name, (str,))
+        if _DEBUG:
+            assert isinstance(name, (str,))
         self.name = name
 
-        assert direction in ["min", "max"]
+        if _DEBUG:
+            assert direction in ["min", "max"]
         self.direction = direction
 
-        assert isinstance(n_coeffs, (int, ))
-        assert n_coeffs >= 0
+        if _DEBUG:
+            assert isinstance(n_coeffs, (int, ))
+            assert n_coeffs >= 0
         self.n_coeffs = n_coeffs
 
-        assert isinstance(coeffs, (dict, ))
-        for k, v in coeffs.items():
-            # check keys for variable indices (int) and values for floats (coefficients)
-            assert isinstance(k, (int,))
-            assert isinstance(v, (float,))
+        if _DEBUG:
+            assert isinstance(coeffs, (dict, ))
+            for k, v in coeffs.items():
+                # check keys for variable indices (int) and values for floats (coefficients)
+                assert isinstance(k, (int,))
+                assert isinstance(v, (float,))
         self.coeffs = coeffs
 
-        assert isinstance(constant, (int, float))
+        if _DEBUG:
+            assert isinstance(constant, (int, float))
         self.constant = constant
 
+        # lazily built parallel arrays of the coefficient dict for the numeric evaluation path; None means
+        # stale, they are rebuilt on demand and invalidated by update_coeff
+        self._idx = None
+        self._coef = None
+
+    def _compile_coeff_arrays(self):
+        """build the variable-index and coefficient arrays from the coefficient dict; the indices are kept
+        sorted (CSR-style) so the gather walks the value vector forward and updates can binary-search"""
+        self._idx = np.fromiter(sorted(self.coeffs.keys()), dtype=np.int32, count=len(self.coeffs))
+        self._coef = np.fromiter((self.coeffs[int(index)] for index in self._idx),
+                                 dtype=np.float64, count=len(self.coeffs))
+
     def update_name(self, name):
         assert isinstance(name, (str,))
         self.name = name
@@ -37,8 +63,12 @@ class OSILObjective(object):
         assert isinstance(variable_index, (int,))
         assert isinstance(coefficient, (float,))
 
-        if variable_index in self.coeffs.keys():
+        if variable_index in self.coeffs:
             self.coeffs[variable_index] = coefficient
+            if self._idx is not None:
+                # the compiled arrays are sorted by index, so the entry is patched in place instead of
+                # rebuilding both arrays
+                self._coef[np.searchsorted(self._idx, variable_index)] = coefficient
         else:
             print(f"WARNING; variable index {variable_index} not in objective coefficients")
 
@@ -47,9 +77,18 @@ class OSILObjective(object):
         self.constant = constant
 
     def eval(self, variables):
+        # numeric variable vectors take the vectorized sparse dot product instead of the python loop
+        if isinstance(variables, np.ndarray):
+            return self.eval_numeric(variables)
         # construct and evaluate the linear objective
         obj = 0
         for variable_index, coefficient in self.coeffs.items():
             obj += coefficient * variables[variable_index]
         return obj
 
+    def eval_numeric(self, var_values):
+        """evaluate the linear objective on a numeric variable vector as one gather and dot product; like
+        eval, the constant offset is not included"""
+        if self._idx is None:
+            self._compile_coeff_arrays()
+        return float(self._coef @ var_values[self._idx])
@@ -1,9 +1,24 @@
-import xml.etree.ElementTree as ET
+import copy
+import sys
+from collections import defaultdict
 
-from osil_parser.osil_var import OSILVariable
+import numpy as np
+
+try:
+    # lxml's C-backed parser tokenizes large osil files considerably faster than the stdlib tree builder
+    # and exposes the same element interface; the stdlib module is the drop-in fallback
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+from osil_parser.osil_var import OSILVariable, OSILVariableStore
 from osil_parser.osil_obj import OSILObjective
 from osil_parser.osil_expressions import *
 
+# per-element schema validation is gated behind this flag, mirroring osil_expressions; running under -O
+# skips the attribute-set checks on the hot parsing loops
+_DEBUG = __debug__
+
 
 class OSILParser(object):
     """
@@ -15,8 +30,30 @@ class OSILParser(object):
     osil_file_path -- path to the osil file to parse (string)
     """
 
+    # precomputed Clark-notation tags; the hot parsing paths compare element tags against these directly,
+    # saving a string replace (and the allocation it implies) per element
+    _PREFIX = "{os.optimizationservices.org}"
+    _TAG_EL = _PREFIX + "el"
+    _TAG_VARIABLE = _PREFIX + "variable"
+    _TAG_NUMBER = _PREFIX + "number"
+    _TAG_START = _PREFIX + "start"
+    _TAG_VALUE = _PREFIX + "value"
+    _TAG_OBJ = _PREFIX + "obj"
+    _TAG_INSTANCE_HEADER = _PREFIX + "instanceHeader"
+    _TAG_INSTANCE_DATA = _PREFIX + "instanceData"
+
+    # instance data section tags, mapped back to their plain names for the single dispatch pass
+    _SECTION_TAGS = {
+        _PREFIX + "variables": "variables",
+        _PREFIX + "objectives": "objectives",
+        _PREFIX + "constraints": "constraints",
+        _PREFIX + "linearConstraintCoefficients": "linearConstraintCoefficients",
+        _PREFIX + "quadraticCoefficients": "quadraticCoefficients",
+        _PREFIX + "nonlinearExpressions": "nonlinearExpressions",
+    }
+
     def __init__(self, osil_file_path):
-        self.prefix = "{os.optimizationservices.org}"
+        self.prefix = self._PREFIX
 
         tree = ET.parse(osil_file_path)
         self.root = tree.getroot()
@@ -26,10 +63,23 @@ class OSILParser(object):
         self.objective = []
         self.variables = []
         self.constraint_infos = []
-        self.lin_coeffs = {}
-        self.quad_coeffs = {}
+        # per-constraint term lists are created lazily; constraints without linear/quadratic terms never
+        # allocate an empty list
+        self.lin_coeffs = defaultdict(list)
+        self.quad_coeffs = defaultdict(list)
         self.nl_constraints = {}
         self._parsed = False
+        # lazily built structure-of-arrays view on the variable list, shared by vectorized consumers
+        self._variable_store = None
+        # raw CSR arrays of the linear coefficient section (colIdx layout only); None until parsed
+        self.lin_indptr = None
+        self.lin_indices = None
+        self.lin_values = None
+        # parallel arrays of the quadratic term section; None until parsed
+        self.quad_cidx = None
+        self.quad_idx1 = None
+        self.quad_idx2 = None
+        self.quad_coef = None
 
         # initialize counting variables for statistical reasons
         self.n_cos = 0
@@ -38,18 +88,73 @@ class OSILParser(object):
         self.n_exp = 0
         self.n_logln = 0
 
+    def clone(self):
+        """
+        return a shallow structural copy of the parser for reformulation passes
+
+        Only the containers mutated by such passes (variables, constraint infos, coefficient containers and the
+        non-linear constraints dictionary) are copied; the contained objects themselves are shared and have to be
+        copied by the pass before mutation
+        """
+        parser = copy.copy(self)
+        parser.variables = list(self.variables)
+        parser.constraint_infos = list(self.constraint_infos)
+        parser.lin_coeffs = defaultdict(list, ((constraint_index, list(coeffs))
+                                               for constraint_index, coeffs in self.lin_coeffs.items()))
+        parser.quad_coeffs = defaultdict(list, ((constraint_index, list(coeffs))
+                                                for constraint_index, coeffs in self.quad_coeffs.items()))
+        parser.nl_constraints = dict(self.nl_constraints)
+        # the store is bound to this parser's variable list; the clone builds its own on demand
+        parser._variable_store = None
+        return parser
+
+    def variable_store(self):
+        """
+        return a structure-of-arrays view (OSILVariableStore) on the variable list
+
+        The store keeps the lower and upper bounds in contiguous numpy arrays and refreshes them lazily
+        against the global bounds version, so passing it to compute_bounds instead of the plain list avoids
+        rebuilding the arrays on every call.
+
+        :return: the cached OSILVariableStore for this parser's variables
+        """
+        if self._variable_store is None or self._variable_store.variables is not self.variables:
+            self._variable_store = OSILVariableStore(self.variables)
+        return self._variable_store
+
+    def constraint_bound_arrays(self):
+        """
+        return the constraint lower and upper bounds as two contiguous numpy arrays
+
+        None bounds are encoded as -/+ infinity, matching the variable store convention. The arrays are
+        rebuilt on every call since constraint infos are replaced in place by the reformulation passes.
+
+        :return: tuple of (lower bounds, upper bounds) as float arrays over the constraint indices
+        """
+        n_constraints = len(self.constraint_infos)
+        lb = np.fromiter((-np.inf if info[1] is None else info[1] for info in self.constraint_infos),
+                         dtype=np.float64, count=n_constraints)
+        ub = np.fromiter((np.inf if info[2] is None else info[2] for info in self.constraint_infos),
+                         dtype=np.float64, count=n_constraints)
+        return lb, ub
+
     def parse(self):
         """main method for parsing the initialized string"""
-        # TODO: Replace for-loop by self.root.find(..) if it is clear that other objects do not occur
+        # leaf nodes are hash-consed per instance; drop any pool left over from a previous parse
+        clear_intern_pool()
         for child in self.root:
-            stripped_tag = self._strip(child.tag)
-            if stripped_tag == "instanceHeader":
+            tag = child.tag
+            if tag == self._TAG_INSTANCE_HEADER:
                 self._parse_header(child)
-            elif stripped_tag == "instanceData":
+            elif tag == self._TAG_INSTANCE_DATA:
                 self._parse_data(child)
             else:
-                print(f"Error encountered; Tag {stripped_tag} on level 1 unknown")
-                exit()
+                # unknown top-level tags are fatal, but raising keeps the condition catchable for callers
+                # instead of killing the interpreter via exit()
+                raise ValueError(f"Tag {self._strip(tag)} on level 1 unknown")
+        # everything is extracted into python objects now, release the xml tree so its memory does not stay
+        # around for the lifetime of the parser
+        self.root = None
         self._parsed = True
 
     def _parse_header(self, instance_header):
@@ -65,67 +170,69 @@ class OSILParser(object):
 
     def _parse_data(self, instance_data):
         """parse variables, objectives, constraints and save"""
+        # collect the known section nodes in one pass over the children instead of one linear find() scan
+        # (and one prefixed-tag concatenation) per section
+        sections = {}
+        for child in instance_data:
+            section = self._SECTION_TAGS.get(child.tag)
+            if section is None:
+                print(f"Warning; Instance Data Child Tag {self._strip(child.tag)} unknown")
+            else:
+                sections[section] = child
+
         # parse variables first
-        variable_node = instance_data.find(self.prefix + "variables")
+        variable_node = sections.get("variables")
         assert variable_node is not None
         self._parse_variables(variable_node)
 
         # parse the objective function
-        objective_node = instance_data.find(self.prefix + "objectives")
+        objective_node = sections.get("objectives")
         if objective_node is None:
             print(f"Warning; no objective found in instance {self.name}")
         else:
             self._parse_objective(objective_node)
 
         # parse the constraints names and bounds
-        constraints_node = instance_data.find(self.prefix + "constraints")
+        constraints_node = sections.get("constraints")
         if constraints_node is not None:
             self._parse_constraints_node(constraints_node)
 
-        # initialize the linear, quadratic and nl terms dictionary with empty lists
-        self._init_term_dicts()
-
-        # parse the linear constraints
-        linear_coefficients_node = instance_data.find(self.prefix + "linearConstraintCoefficients")
+        # parse the linear constraints; the coefficient sections carry by far the most elements, so each one
+        # is cleared as soon as its values are extracted instead of keeping the subtree alive with the DOM
+        linear_coefficients_node = sections.get("linearConstraintCoefficients")
         if linear_coefficients_node is not None:
             self._parse_linear_coefficients(linear_coefficients_node)
+            linear_coefficients_node.clear()
 
         # parse the quadratic constraints
-        quadratic_coefficients_node = instance_data.find(self.prefix + "quadraticCoefficients")
+        quadratic_coefficients_node = sections.get("quadraticCoefficients")
         if quadratic_coefficients_node is not None:
             self._parse_quadratic_coefficients(quadratic_coefficients_node)
+            quadratic_coefficients_node.clear()
 
         # parse the nonlinear expression constraints
-        nonlinear_expressions_node = instance_data.find(self.prefix + "nonlinearExpressions")
+        nonlinear_expressions_node = sections.get("nonlinearExpressions")
         if nonlinear_expressions_node is not None:
             self._parse_nonlinear_expressions(nonlinear_expressions_node)
-
-        # check for unchecked tags
-        for child in instance_data:
-            stripped_tag = self._strip(child.tag)
-            if stripped_tag in ["variables", "objectives", "nonlinearExpressions", "quadraticCoefficients",
-                                "linearConstraintCoefficients", "constraints"]:
-                continue
-            else:
-                print(f"Warning; Instance Data Child Tag {stripped_tag} unknown")
+            nonlinear_expressions_node.clear()
         return 0
 
     def _parse_variables(self, node):
         """Parse and save the variables"""
         n_vars = int(node.attrib["numberOfVariables"])
-        for var in node:
-            # assert when new attributes appear!
-            assert set(var.attrib.keys()) - {"name", "lb", "ub", "type"} == set()
-            name = var.attrib["name"]
-            lb = var.attrib.get("lb")
-            # assign default lower bound of 0
-            lb = float(lb) if lb is not None else 0
-            ub = var.attrib.get("ub")
-            ub = float(ub) if ub is not None else ub
-            # extract type and store
-            var_type = var.attrib.get("type")
-            assert var_type in [None, "I", "B", "C"]
-            self.variables.append(OSILVariable(name, lb, ub, var_type))
+        if _DEBUG:
+            for var in node:
+                # assert when new attributes appear!
+                assert set(var.attrib.keys()) - {"name", "lb", "ub", "type"} == set()
+                assert var.attrib.get("type") in [None, "I", "B", "C"]
+        # decode all attribute dicts in one comprehension pass; lower bounds default to 0, upper bounds
+        # and types stay None when absent
+        self.variables.extend(
+            OSILVariable(attrib["name"],
+                         float(attrib.get("lb", 0)),
+                         float(attrib["ub"]) if "ub" in attrib else None,
+                         attrib.get("type"))
+            for attrib in (var.attrib for var in node))
         assert len(self.variables) == n_vars
         return 0
 
@@ -134,21 +241,16 @@ class OSILParser(object):
         # TODO: check for several objectives
         for obj in node:
             # save meta data for objective
-            assert self._strip(obj.tag) == "obj"
+            assert obj.tag == self._TAG_OBJ
             name = obj.attrib["name"]
             direction = obj.attrib["maxOrMin"]
             n_coeffs = int(obj.attrib["numberOfObjCoef"])
-            # create a dictionary variable index <-> linear coefficient in objective
-            coef_dict = {}
-            for coef_node in obj:
-                var_index = int(coef_node.attrib["idx"])
-                # check variable index is not yet in dict
-                assert var_index not in coef_dict.keys()
-                coef_dict[var_index] = float(coef_node.text)
-            assert len(coef_dict.keys()) == n_coeffs
-
-            constant = obj.attrib.get("constant")
-            constant = 0 if constant is None else float(constant)
+            # create a dictionary variable index <-> linear coefficient in objective; the length check
+            # against the declared count also covers duplicate indices, which would collapse entries
+            coef_dict = {int(coef_node.attrib["idx"]): float(coef_node.text) for coef_node in obj}
+            assert len(coef_dict) == n_coeffs
+
+            constant = float(obj.attrib.get("constant", 0))
             self.objective.append(OSILObjective(name, direction, n_coeffs, coef_dict, constant))
         assert len(self.objective) == 1, f"Unknown handling of several objectives"
         return 0
@@ -158,20 +260,16 @@ class OSILParser(object):
         # store number of constraints for assertion
         n_constraints = int(node.attrib["numberOfConstraints"])
 
-        # init constraint list
-        constraints = list()
-
-        # iterate over children and extract name, lb, ub
-        for child in node:
-            name = child.attrib["name"]
-            lb = child.attrib.get("lb")
-            lb = lb if lb is None else float(lb)
-            ub = child.attrib.get("ub")
-            ub = ub if ub is None else float(ub)
-            constraints.append((name, lb, ub))
-
+        if _DEBUG:
             # ensure no keys in attributes are untracked
-            assert set(child.attrib.keys()) - {"name", "lb", "ub"} == set()
+            for child in node:
+                assert set(child.attrib.keys()) - {"name", "lb", "ub"} == set()
+
+        # build all (name, lb, ub) tuples in one comprehension pass; missing bounds stay None
+        constraints = [(attrib["name"],
+                        float(attrib["lb"]) if "lb" in attrib else None,
+                        float(attrib["ub"]) if "ub" in attrib else None)
+                       for attrib in (child.attrib for child in node)]
 
         # assert if necessary
         assert n_constraints == len(constraints), f"error when parsing constraint meta info"
@@ -179,89 +277,137 @@ class OSILParser(object):
         self.constraint_infos = constraints
         return 0
 
-    def _init_term_dicts(self):
-        """ for each constraint index, initialize a linear, quadratic and nl empty list """
-        self.quad_coeffs[-1] = []
-        for constraint_index in range(len(self.constraint_infos)):
-            self.lin_coeffs[constraint_index] = []
-            self.quad_coeffs[constraint_index] = []
-
     def _parse_linear_coefficients(self, node):
         """ construct a dictionary with constraint indices as keys and list of tuples of (var index, coefficient)"""
         # store the number of nonzeros for assertion
         n_lin_terms = int(node.attrib["numberOfValues"])
-        assert self._strip(node[0].tag) == "start"
-        assert self._strip(node[2].tag) == "value"
+        assert node[0].tag == self._TAG_START
+        assert node[2].tag == self._TAG_VALUE
         # parse start and value child via default method
-        start_indices = self._parse_el_elements(node[0])
-        values = self._parse_el_elements(node[2])
+        start_indices = self._parse_el_elements(node[0], as_array=True)
+        values = self._parse_el_elements(node[2], as_array=True)
 
         # init counter for linear expressions
         count_lin_expr = 0
         if node[1].tag == self.prefix + 'colIdx':
             # parse column indices
-            column_indices = self._parse_el_elements(node[1])
+            column_indices = self._parse_el_elements(node[1], as_array=True)
             assert len(column_indices) == len(values), f"number of indices must equal number of values in linear coefs"
+            # the section already is CSR over the constraint rows; keep the three arrays verbatim so
+            # vectorized consumers can use them without re-assembling the per-row tuple lists. note they
+            # capture the parsed instance and are not updated by later reformulation passes
+            self.lin_indptr = start_indices
+            self.lin_indices = column_indices
+            self.lin_values = values
+            # pair every nonzero once, then cut the per-row lists out of the flat pair list; this does one
+            # slice per row instead of two list slices plus a zip each
+            pairs = list(zip(column_indices.tolist(), values.tolist()))
             # start values (from above) give start and end index in the column indices list for the current row
-            for row_index, (curr_row_from, curr_row_to) in enumerate(zip(start_indices[:-1], start_indices[1:])):
-                for index in range(curr_row_from, curr_row_to):
-                    self.lin_coeffs[row_index].append((column_indices[index], values[index]))
-                    count_lin_expr += 1
+            start_list = start_indices.tolist()
+            assert start_list[0] == 0 and start_list[-1] == len(pairs), f"inconsistent start offsets in linear coefs"
+            for row_index, (curr_row_from, curr_row_to) in enumerate(zip(start_list[:-1], start_list[1:])):
+                self.lin_coeffs[row_index] = pairs[curr_row_from:curr_row_to]
+            count_lin_expr += len(pairs)
         else:
             assert node[1].tag == self.prefix + "rowIdx", f"neither column nor row indices found in linear constraints"
             # parse row indices
-            row_indices = self._parse_el_elements(node[1])
+            row_indices = self._parse_el_elements(node[1], as_array=True)
             assert len(row_indices) == len(values), f"number of indices must equal number of values in linear coefs"
-            # start values (from above) give start and end index in the row indices list for the current column
-            for column_index, (curr_col_from, curr_col_to) in enumerate(zip(start_indices[:-1], start_indices[1:])):
-                for index in range(curr_col_from, curr_col_from):
-                    row_index = row_indices[index]
-                    self.lin_coeffs[row_index].append((column_index, values[index]))
-                    count_lin_expr += 1
+            # the section is CSC here: the start offsets delimit the nonzeros of each column, so each
+            # nonzero's column index follows from repeating the column over its offset span. the previous
+            # nested loop iterated an empty range and dropped every rowIdx coefficient
+            column_of_nonzero = np.repeat(np.arange(len(start_indices) - 1, dtype=np.int64),
+                                          np.diff(start_indices))
+            # the stable sort by row keeps ascending column order within each row, matching the colIdx layout
+            order = np.argsort(row_indices, kind="stable")
+            for row_index, column_index, value in zip(row_indices[order].tolist(),
+                                                      column_of_nonzero[order].tolist(),
+                                                      values[order].tolist()):
+                self.lin_coeffs[row_index].append((column_index, value))
+            count_lin_expr += len(row_indices)
 
         assert n_lin_terms == count_lin_expr, f"Error in extracting linear expressions"
         return 0
 
-    def _parse_el_elements(self, node):
-        """parsing all el child notes and computing (if necessary) the respective values"""
-        assert self._strip(node.tag) in ["start", "value", "rowIdx", "colIdx"]
-        values = []
+    def _parse_el_elements(self, node, as_array=False):
+        """parsing all el child notes and computing (if necessary) the respective values
+
+        :param node: the start/value/rowIdx/colIdx section node holding the el children
+        :param as_array: if True, return a numpy array instead of a python list
+        :return: the expanded values, as list (default) or contiguous array
+        """
+        tag = self._strip(node.tag)
+        assert tag in ["start", "value", "rowIdx", "colIdx"]
+        is_value = tag == "value"
+        # collect the run-length encoded triples first; the expansion runs vectorized afterwards instead of
+        # appending start_value + incr * m element by element
+        if _DEBUG:
+            # the per-element tag and attribute-set checks allocate sets and dominate large sections, so
+            # they run in a separate validation pass that vanishes under -O
+            for el in node:
+                assert el.tag == self._TAG_EL
+                assert set(el.attrib.keys()) - {"mult", "incr"} == set()
+        starts, mults, incrs = [], [], []
         for el in node:
-            assert self._strip(el.tag) == "el"
-            assert set(el.attrib.keys()) - {"mult", "incr"} == set()
-            mult = el.attrib.get("mult")
-            mult = 1 if mult is None else int(mult)
-            incr = el.attrib.get("incr")
-            incr = 0 if incr is None else int(incr)
-            start_value = float(el.text) if self._strip(node.tag) == "value" else int(el.text)
-            for m in range(mult):
-                values.append(start_value + incr * m)
-        return values
+            attrib = el.attrib
+            mults.append(int(attrib.get("mult", 1)))
+            incrs.append(int(attrib.get("incr", 0)))
+            starts.append(float(el.text) if is_value else int(el.text))
+
+        mults = np.asarray(mults, dtype=np.int64)
+        total = int(mults.sum())
+        dtype = np.float64 if is_value else np.int64
+        if total == len(mults):
+            # no element carries a multiplicity, the collected starts already are the values
+            return np.asarray(starts, dtype=dtype) if as_array else starts
+        # expand every run at once: each slot gets its run's start plus its position in the run times incr
+        positions = np.arange(total, dtype=np.int64) - np.repeat(np.cumsum(mults) - mults, mults)
+        values = np.repeat(np.asarray(starts, dtype=dtype), mults) \
+            + np.repeat(np.asarray(incrs, dtype=dtype), mults) * positions
+        return values if as_array else values.tolist()
 
     def _parse_quadratic_coefficients(self, node):
         """construct a dictionary with constraint indices as keys and list of tuples of
         (var index, var index, coefficient)"""
         # store the number of quadratic terms for assertion
         n_quad_terms = int(node.attrib["numberOfQuadraticTerms"])
+        if _DEBUG:
+            # hoisted schema checks: a coefficient must always be given and no unexpected keys may appear
+            for qterm_node in node:
+                assert "coef" in qterm_node.attrib.keys()
+                assert qterm_node.attrib.keys() - {"idx", "idxOne", "idxTwo", "coef"} == set(), \
+                    f"more than the expected keys in quad term parsing"
+        # the decoded terms are additionally kept as four parallel arrays for vectorized consumers
+        # (e.g. sparse hessian assembly); like the linear CSR arrays they capture the parsed instance
+        # and are not updated by later reformulation passes
+        constraint_idx = np.empty(n_quad_terms, dtype=np.int32)
+        first_idx = np.empty(n_quad_terms, dtype=np.int32)
+        second_idx = np.empty(n_quad_terms, dtype=np.int32)
+        coefs = np.empty(n_quad_terms, dtype=np.float64)
+
         # iterate over quadratic terms and count
         i = 0
         for qterm_node in node:
             # extract necessary info
-            constraint_index = int(qterm_node.attrib["idx"])
-            variable_index1 = int(qterm_node.attrib["idxOne"])
-            variable_index2 = int(qterm_node.attrib["idxTwo"])
-            # check if there is always a coefficient given
-            assert "coef" in qterm_node.attrib.keys()
-            coefficient = float(qterm_node.attrib["coef"])
-
-            assert qterm_node.attrib.keys() - {"idx", "idxOne", "idxTwo", "coef"} == set(), \
-                f"more than the expected keys in quad term parsing"
+            attrib = qterm_node.attrib
+            constraint_index = int(attrib["idx"])
+            variable_index1 = int(attrib["idxOne"])
+            variable_index2 = int(attrib["idxTwo"])
+            coefficient = float(attrib["coef"])
+            constraint_idx[i] = constraint_index
+            first_idx[i] = variable_index1
+            second_idx[i] = variable_index2
+            coefs[i] = coefficient
             # append to list for current constraint index
             self.quad_coeffs[constraint_index].append((variable_index1, variable_index2, coefficient))
 
             i += 1
 
         assert n_quad_terms == i
+        self.quad_cidx = constraint_idx
+        self.quad_idx1 = first_idx
+        self.quad_idx2 = second_idx
+        self.quad_coef = coefs
 
         return 0
 
@@ -284,293 +430,293 @@ class OSILParser(object):
         return 0
 
     def _parse_single_nl(self, nl, kind, level):
-        """Parse the current nonlinear expression on its level, return a respective object and its bounds"""
-        # assertion for current implementation
-        assert kind in ["sum", "product", "square", "power", "cos", "sin", "negate", "divide", "sqrt", "exp", "abs",
-                        "ln", "log10", "signpower"], \
-            f"Invalid kind of nonlinear constraint: {kind}"
+        """Parse the current nonlinear expression on its level, return a respective object and its bounds
 
+        The tree is walked with an explicit stack in post order: a frame descends into its nested
+        (non variable/number) children first and its handler combines the collected results afterwards,
+        so deeply nested instances neither pay a python frame per node nor hit the recursion limit.
+        """
+        handler = self._NL_HANDLERS.get(kind)
+        # assertion for current implementation
+        assert handler is not None, f"Invalid kind of nonlinear constraint: {kind}"
         # assertion if general non-linearity has coefficient
         assert nl.attrib.get("coef") is None, f"coefficient for non-linearity is not implemented yet"
 
-        # check for kind of nonlinear constraint
-        if kind == "sum":
-            # save the entities 'variable', 'constant/number', 'nonlinear constraint' in sum object
-            sum_entities = []
-            for expr in nl:
-                stripped_tag = self._strip(expr.tag)
-                if stripped_tag == "variable":
-                    # variable entities are constructed by name (=idx) and coefficient
-                    idx = int(expr.attrib["idx"])
-                    coefficient = expr.attrib.get("coef")
-                    coefficient = 1.0 if coefficient is None else float(coefficient)
-                    sum_entities.append(OSILSummand(idx, coefficient, level + 1))
-                    # assert if more attributes are included
-                    assert set(expr.attrib.keys()) - {"idx", "coef"} == set(), "Unknown attribute when handling sums"
-                elif stripped_tag == "number":
-                    assert len(expr.attrib.keys()) == 1, f"More/less than 1 argument in number"
-                    # number/constant entities are constructed by their value
-                    value = float(expr.attrib["value"])
-                    sum_entities.append(OSILSummand(None, value, level + 1))
-                else:
-                    # other entities are nonlinear constraints to be solved as such
-                    # TODO: check for linear/quadratic constraints
-                    sum_entities.append(self._parse_single_nl(expr, stripped_tag, level + 1))
-            return OSILSum(sum_entities, level)
-        elif kind == "product":
-            # save the entities 'variable', 'constant/number', 'nonlinear constraint' in product object
-            factors = []
-            for expr in nl:
-                stripped_tag = self._strip(expr.tag)
-                if stripped_tag == "variable":
-                    # variable entities can be constructed by name only, when coefficients in product are saved extra
-                    idx = int(expr.attrib["idx"])
-                    coefficient = expr.attrib.get("coef")
-                    coefficient = float(coefficient) if coefficient is not None else 1
-                    factors.append(OSILFactor(idx, coefficient, level + 1))
-                    # assert if more attributes are included
-                    assert set(expr.attrib.keys()) - {"idx", "coef"} == set(), "Unknown attribute when handling product"
-                elif stripped_tag == "number":
-                    # number/constant entities are constructed by their value (which is supposed to be unique)
-                    value = float(expr.attrib["value"])
-                    assert len(expr.attrib.keys()) == 1
-                    factors.append(OSILFactor(None, value, level + 1))
-                else:
-                    # other entities are nonlinear constraints to be solved as such
-                    # TODO: check for linear/quadratic constraints
-                    factors.append(self._parse_single_nl(expr, stripped_tag, level + 1))
-            return OSILProduct(factors, level)
-        elif kind == "square":
-            # return a square object with the variable tag or a general nl
-            assert len(nl) == 1, f"More/less objects than allowed in square creation: {len(nl)} != 1"
-            node = nl[0]
-            # check kind of node
-            stripped_tag = self._strip(node.tag)
-            assert stripped_tag != "number", f"Number tag not allowed in square nl"
-
-            if stripped_tag == "variable":
-                coefficient = node.attrib.get("coef")
-                coefficient = 1.0 if coefficient is None else float(coefficient)
-                # assert if more attributes are included
-                assert set(node.attrib.keys()) - {"idx", "coef"} == set(), "Unknown attribute when handling in sqrt"
-                return OSILSquare(int(node.attrib["idx"]), level, coefficient)
-            else:
-                return OSILSquare(self._parse_single_nl(node, stripped_tag, level + 1), level)
-
-        elif kind == "power":
-            # return a power object with the variable tag and the coefficient or assert otherwise
-            assert len(nl) == 2, f"More/less objects than allowed in power creation: {len(nl)}"
-
-            # extract relevant information for base (nl[0]) and power (nl[1])
-            coefficients = [base_coefficient, power_coefficient] = [1.0, 1.0]
-            elements = [base, power] = [None, None]
-            for i, expr in enumerate(nl):
-                stripped_tag = self._strip(expr.tag)
-                if stripped_tag == "variable":
-                    # handle variable coefficients
-                    coefficient = expr.get("coef")
-                    coefficients[i] = 1.0 if coefficient is None else float(coefficient)
-
-                    elements[i] = int(expr.attrib["idx"])
-                    # assert if more attributes are included
-                    assert set(expr.attrib.keys()) - {"idx", "coef"} == set(), \
-                        "Unknown attribute when handling variable in power"
-                elif stripped_tag == "number":
-                    elements[i] = float(expr.attrib["value"])
-                    # assert if more attributes are included
-                    assert len(expr.attrib.keys()) == 1, "More attributes than needed in power creation"
-                else:
-                    elements[i] = self._parse_single_nl(expr, stripped_tag, level + 1)
-            return OSILPower(elements[0], elements[1], coefficients[0], coefficients[1], level)
-
-        elif kind == "cos":
-            # return a cosine object with variable tag or a general nl
-            assert len(nl) == 1, f'More/less objects than allowed in cosine creation: {len(nl)} != 1'
-            assert self._strip(nl[0].tag) != "number", f"so far, cosine does not support number as argument"
-            node = nl[0]
-            stripped_tag = self._strip(node.tag)
-
-            self.n_cos += 1
-            if stripped_tag == "variable":
-                coefficient = nl[0].get("coef")
-                coefficient = 1.0 if coefficient is None else float(coefficient)
-                # assert if unhandled attribute is available
-                assert set(nl[0].attrib.keys()) - {"idx", "coef"} == set(), f"unknown attribute in argument of cos"
-
-                return OSILCosine(int(node.attrib["idx"]), level, coefficient)
-            else:
-                return OSILCosine(self._parse_single_nl(node, stripped_tag, level + 1), level)
-
-        elif kind == "sin":
-            # return sine object with variable tag or a general nl
-            assert len(nl) == 1, f'More/less objects than allowed in sine creation: {len(nl)} != 1'
-            assert self._strip(nl[0].tag) != "number", f"so far, sine does not support number as argument"
-            node = nl[0]
-            stripped_tag = self._strip(node.tag)
-
-            self.n_sin += 1
-            if stripped_tag == "variable":
-                coefficient = nl[0].get("coef")
-                coefficient = 1.0 if coefficient is None else float(coefficient)
-                # assert if unhandled attribute is available
-                assert set(nl[0].attrib.keys()) - {"idx", "coef"} == set(), f"unknown attribute in argument of sin"
-
-                return OSILSine(int(node.attrib["idx"]), level, coefficient)
-            else:
-                return OSILSine(self._parse_single_nl(node, stripped_tag, level + 1), level)
-
-        elif kind == "negate":
-            # return negated object with general nonlinear expression or variable
-            assert len(nl) == 1, f'More/less objects than allowed in negate creation: {len(nl)} != 1'
-            stripped_tag = self._strip(nl[0].tag)
-            if stripped_tag == "variable":
-                idx = int(nl[0].attrib("idx"))
+        # frames hold the xml node, its handler and level, the parsed child results and the child iterator
+        stack = [(nl, handler, level, [], iter(nl))]
+        while True:
+            node, node_handler, node_level, results, children = stack[-1]
+            descended = False
+            for child in children:
+                tag = child.tag
+                if tag == self._TAG_VARIABLE or tag == self._TAG_NUMBER:
+                    # leaf tags are decoded by the handler itself
+                    continue
+                child_handler = self._NL_HANDLERS_BY_TAG.get(tag)
+                # assertion for current implementation
+                assert child_handler is not None, f"Invalid kind of nonlinear constraint: {self._strip(tag)}"
+                # assertion if general non-linearity has coefficient
+                assert child.attrib.get("coef") is None, f"coefficient for non-linearity is not implemented yet"
+                stack.append((child, child_handler, node_level + 1, [], iter(child)))
+                descended = True
+                break
+            if descended:
+                continue
+            # all nested children are parsed, combine them into this node
+            parsed = node_handler(self, node, node_level, results)
+            stack.pop()
+            if not stack:
+                return parsed
+            stack[-1][3].append(parsed)
+
+    def _parse_unary_nl(self, nl, level, parsed_children, node_class, kind, with_coefficient, counter=None):
+        """parse a unary non-linearity (cos, sqrt, exp, ...) over a variable or a nested expression
+
+        :param nl: the xml node of the non-linearity
+        :param level: the nesting level of the node
+        :param parsed_children: the already parsed nested child expressions, in document order
+        :param node_class: the expression class to construct
+        :param kind: the kind string, used in assertion messages
+        :param with_coefficient: whether the variable form accepts a 'coef' attribute
+        :param counter: name of the per-kind counter attribute to bump, or None
+        :return: the constructed expression object
+        """
+        assert len(nl) == 1, f"More/less objects than allowed in {kind} creation: {len(nl)} != 1"
+        node = nl[0]
+        # check kind of node
+        tag = node.tag
+        assert tag != self._TAG_NUMBER, f"Number tag not allowed in {kind} nl"
+
+        if counter is not None:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+        if tag != self._TAG_VARIABLE:
+            return node_class(parsed_children[0], level)
+
+        # the attribute dict is looked up once; every further read goes through the local
+        attrib = node.attrib
+        if with_coefficient:
+            coefficient = float(attrib.get("coef", 1.0))
+            # assert if more attributes are included
+            assert set(attrib.keys()) - {"idx", "coef"} == set(), f"Unknown attribute when handling {kind}"
+            return intern_node(node_class, int(attrib["idx"]), level, coefficient)
+
+        # assert if more attributes are included
+        assert set(attrib.keys()) - {"idx"} == set(), f"Unknown attribute when handling {kind}"
+        return intern_node(node_class, int(attrib["idx"]), level)
+
+    def _nl_sum(self, nl, level, parsed_children):
+        # save the entities 'variable', 'constant/number', 'nonlinear constraint' in sum object
+        sum_entities = []
+        parsed = iter(parsed_children)
+        for expr in nl:
+            tag = expr.tag
+            attrib = expr.attrib
+            if tag == self._TAG_VARIABLE:
+                # variable entities are constructed by name (=idx) and coefficient
+                idx = int(attrib["idx"])
+                coefficient = float(attrib.get("coef", 1.0))
+                sum_entities.append(OSILSummand.make(idx, coefficient, level + 1))
                 # assert if more attributes are included
-                assert set(nl[0].attrib.keys()) - {"idx"} == set(), "Unknown attribute when handling negation"
-                return OSILNegate(idx, level)
+                assert set(attrib.keys()) - {"idx", "coef"} == set(), "Unknown attribute when handling sums"
+            elif tag == self._TAG_NUMBER:
+                assert len(attrib.keys()) == 1, f"More/less than 1 argument in number"
+                # number/constant entities are constructed by their value
+                value = float(attrib["value"])
+                sum_entities.append(OSILSummand.make(None, value, level + 1))
             else:
-                # other entities are nonlinear constraints to be solved as such
+                # other entities are nonlinear constraints, already parsed bottom-up
                 # TODO: check for linear/quadratic constraints
-                return OSILNegate(self._parse_single_nl(nl[0], stripped_tag, level + 1), level)
-
-        elif kind == "divide":
-            # return divide (or fraction) object with general nonlinear expressions and/or variables
-            assert len(nl) == 2, f'More/less objects than allowed in divide creation: {len(nl)} != 2'
-            numerator_strip_tag = self._strip(nl[0].tag)
-            denominator_strip_tag = self._strip(nl[1].tag)
-
-            numerator_is_constant = numerator_strip_tag == "number"
-            numerator_coefficient = 1.0
-            denominator_coefficient = 1.0
-            if numerator_strip_tag == "number":
-                assert len(nl[0].attrib.keys()) == 1
-                numerator = float(nl[0].attrib["value"])
-            elif numerator_strip_tag == "variable":
-                # only save the variable index as numerator if variable
-                numerator = int(nl[0].attrib["idx"])
-                numerator_coefficient = nl[0].get("coef")
-                numerator_coefficient = 1.0 if numerator_coefficient is None else float(numerator_coefficient)
-                # assert if unhandled attribute is available
-                assert set(nl[0].attrib.keys()) - {"idx", "coef"} == set(), f"unknown attribute in numerator of divide"
-            else:
-                numerator = self._parse_single_nl(nl[0], numerator_strip_tag, level + 1)
-            if denominator_strip_tag == "variable":
-                # only save the variable index as numerator if variable
-                denominator = int(nl[1].attrib["idx"])
-                denominator_coefficient = nl[1].attrib.get("coef")
-                denominator_coefficient = 1.0 if denominator_coefficient is None else float(denominator_coefficient)
-                # assert if unhandled attribute is available
-                assert set(nl[1].attrib.keys()) - {"idx", "coef"} == set(), f"unknown attribute in denominator of divide"
-            else:
-                denominator = self._parse_single_nl(nl[1], denominator_strip_tag, level + 1)
-
-            return OSILDivide(numerator, denominator, level, numerator_is_constant, numerator_coefficient,
-                              denominator_coefficient)
-
-        elif kind == "sqrt":
-            # return a square root object with the variable tag or a general nl
-            assert len(nl) == 1, f"More/less objects than allowed in square root creation: {len(nl)} != 1"
-            node = nl[0]
-            # check kind of node
-            stripped_tag = self._strip(node.tag)
-            assert stripped_tag != "number", f"Number tag not allowed in square root nl"
-
-            self.n_sqrt += 1
-            if stripped_tag == "variable":
+                sum_entities.append(next(parsed))
+        return OSILSum(sum_entities, level)
+
+    def _nl_product(self, nl, level, parsed_children):
+        # save the entities 'variable', 'constant/number', 'nonlinear constraint' in product object
+        factors = []
+        parsed = iter(parsed_children)
+        for expr in nl:
+            tag = expr.tag
+            attrib = expr.attrib
+            if tag == self._TAG_VARIABLE:
+                # variable entities can be constructed by name only, when coefficients in product are saved extra
+                idx = int(attrib["idx"])
+                coefficient = float(attrib.get("coef", 1.0))
+                factors.append(OSILFactor.make(idx, coefficient, level + 1))
                 # assert if more attributes are included
-                assert set(node.attrib.keys()) - {"idx"} == set(), "Unknown attribute when handling squareroot"
-                return OSILSquareroot(int(node.attrib["idx"]), level)
-            else:
-                return OSILSquareroot(self._parse_single_nl(node, stripped_tag, level + 1), level)
-
-        elif kind == "exp":
-            # return an exponential function object with the variable tag or a general nl
-            assert len(nl) == 1, f"More/less objects than allowed in exp creation: {len(nl)} != 1"
-            node = nl[0]
-            # check kind of node
-            stripped_tag = self._strip(node.tag)
-            assert stripped_tag != "number", f"Number tag not allowed in exp nl"
-
-            self.n_exp += 1
-            # depending on tag, create exp object with variable and coef or with nl
-            if stripped_tag == "variable":
-                coefficient = nl[0].get("coef")
-                coefficient = 1.0 if coefficient is None else float(coefficient)
-                # assert if unhandled attribute is available
-                assert set(nl[0].attrib.keys()) - {"idx", "coef"} == set(), f"unknown attribute in argument of exp"
-
-                return OSILExp(int(node.attrib["idx"]), level, coefficient)
+                assert set(attrib.keys()) - {"idx", "coef"} == set(), "Unknown attribute when handling product"
+            elif tag == self._TAG_NUMBER:
+                # number/constant entities are constructed by their value (which is supposed to be unique)
+                value = float(attrib["value"])
+                assert len(attrib.keys()) == 1
+                factors.append(OSILFactor.make(None, value, level + 1))
             else:
-                return OSILExp(self._parse_single_nl(node, stripped_tag, level + 1), level)
-
-        elif kind == "abs":
-            # return an absolute value object with the variable tag or a general nl
-            assert len(nl) == 1, f"More/less objects than allowed in abs creation: {len(nl)} != 1"
-            node = nl[0]
-            # check kind of node
-            stripped_tag = self._strip(node.tag)
-            assert stripped_tag != "number", f"Number tag not allowed in abs nl"
-
-            if stripped_tag == "variable":
-                coefficient = node.attrib.get("coef")
-                coefficient = 1.0 if coefficient is None else float(coefficient)
-                # assert if more attributes are included
-                assert set(node.attrib.keys()) - {"idx", "coef"} == set(), "Unknown attribute when handling abs"
-                return OSILAbs(int(node.attrib["idx"]), level, coefficient)
-            else:
-                return OSILAbs(self._parse_single_nl(node, stripped_tag, level + 1), level)
-
-        elif kind == "ln":
-            # return a ln function object with the variable tag or a general nl
-            assert len(nl) == 1, f"More/less objects than allowed in ln creation: {len(nl)} != 1"
-            node = nl[0]
-            # check kind of node
-            stripped_tag = self._strip(node.tag)
-            assert stripped_tag != "number", f"Number tag not allowed in ln nl"
-
-            self.n_logln += 1
-            if stripped_tag == "variable":
-                coefficient = node.attrib.get("coef")
-                coefficient = 1.0 if coefficient is None else float(coefficient)
+                # other entities are nonlinear constraints, already parsed bottom-up
+                # TODO: check for linear/quadratic constraints
+                factors.append(next(parsed))
+        return OSILProduct(factors, level)
+
+    def _nl_square(self, nl, level, parsed_children):
+        # return a square object with the variable tag or a general nl
+        return self._parse_unary_nl(nl, level, parsed_children, OSILSquare, "square", True)
+
+    def _nl_power(self, nl, level, parsed_children):
+        # return a power object with the variable tag and the coefficient or assert otherwise
+        assert len(nl) == 2, f"More/less objects than allowed in power creation: {len(nl)}"
+
+        # extract relevant information for base (nl[0]) and power (nl[1])
+        coefficients = [base_coefficient, power_coefficient] = [1.0, 1.0]
+        elements = [base, power] = [None, None]
+        parsed = iter(parsed_children)
+        for i, expr in enumerate(nl):
+            tag = expr.tag
+            attrib = expr.attrib
+            if tag == self._TAG_VARIABLE:
+                # handle variable coefficients
+                coefficients[i] = float(attrib.get("coef", 1.0))
+
+                elements[i] = int(attrib["idx"])
                 # assert if more attributes are included
-                assert set(node.attrib.keys()) - {"idx", "coef"} == set(), "Unknown attribute when handling ln"
-                return OSILLn(int(node.attrib["idx"]), level, coefficient)
-            else:
-                return OSILLn(self._parse_single_nl(node, stripped_tag, level + 1), level)
-
-        elif kind == "log10":
-            # return a log10 function object with the variable tag or a general nl
-            assert len(nl) == 1, f"More/less objects than allowed in log10 creation: {len(nl)} != 1"
-            node = nl[0]
-            # check kind of node
-            stripped_tag = self._strip(node.tag)
-            assert stripped_tag != "number", f"Number tag not allowed in log10 nl"
-
-            self.n_logln += 1
-            if stripped_tag == "variable":
+                assert set(attrib.keys()) - {"idx", "coef"} == set(), \
+                    "Unknown attribute when handling variable in power"
+            elif tag == self._TAG_NUMBER:
+                elements[i] = float(attrib["value"])
                 # assert if more attributes are included
-                assert set(node.attrib.keys()) - {"idx"} == set(), "Unknown attribute when handling log10"
-                return OSILLog10(int(node.attrib["idx"]), level)
+                assert len(attrib.keys()) == 1, "More attributes than needed in power creation"
             else:
-                return OSILLog10(self._parse_single_nl(node, stripped_tag, level + 1), level)
-
-        elif kind == "signpower":
-            # return a sigpower object, i.e., sign(x) * |x|**c
-            assert len(nl) == 2, f"More/less objects than allowed in power creation: {len(nl)}"
-
-            # check that first nl is variable, second one is constant
-            assert self._strip(nl[0].tag) == "variable", f"no other than variable allowed for base in signpower creation"
-            assert self._strip(nl[1].tag) == "number", f"no other than number allowed for exponent in signpower creation"
-            # extract relevant information for base (nl[0]) and power (nl[1])
-            base = int(nl[0].attrib["idx"])
-            # assert if more attributes are included
-            assert set(nl[0].attrib.keys()) - {"idx"} == set(), "Unknown attribute when handling variable in signpower"
-
-            power = float(nl[1].attrib["value"])
-            # assert if more attributes are included
-            assert len(nl[1].attrib.keys()) == 1, "More attributes than needed in signpower creation"
-            return OSILSignPower(base, power, level)
+                elements[i] = next(parsed)
+        return OSILPower(elements[0], elements[1], coefficients[0], coefficients[1], level)
+
+    def _nl_cos(self, nl, level, parsed_children):
+        # return a cosine object with variable tag or a general nl
+        return self._parse_unary_nl(nl, level, parsed_children, OSILCosine, "cos", True, "n_cos")
+
+    def _nl_sin(self, nl, level, parsed_children):
+        # return sine object with variable tag or a general nl
+        return self._parse_unary_nl(nl, level, parsed_children, OSILSine, "sin", True, "n_sin")
+
+    def _nl_negate(self, nl, level, parsed_children):
+        # return negated object with general nonlinear expression or variable
+        return self._parse_unary_nl(nl, level, parsed_children, OSILNegate, "negate", False)
+
+    def _nl_divide(self, nl, level, parsed_children):
+        # return divide (or fraction) object with general nonlinear expressions and/or variables
+        assert len(nl) == 2, f'More/less objects than allowed in divide creation: {len(nl)} != 2'
+        numerator_tag = nl[0].tag
+        denominator_tag = nl[1].tag
+
+        numerator_is_constant = numerator_tag == self._TAG_NUMBER
+        numerator_coefficient = 1.0
+        denominator_coefficient = 1.0
+        parsed = iter(parsed_children)
+        if numerator_tag == self._TAG_NUMBER:
+            assert len(nl[0].attrib.keys()) == 1
+            numerator = float(nl[0].attrib["value"])
+        elif numerator_tag == self._TAG_VARIABLE:
+            # only save the variable index as numerator if variable
+            numerator = int(nl[0].attrib["idx"])
+            numerator_coefficient = float(nl[0].attrib.get("coef", 1.0))
+            # assert if unhandled attribute is available
+            assert set(nl[0].attrib.keys()) - {"idx", "coef"} == set(), f"unknown attribute in numerator of divide"
+        else:
+            numerator = next(parsed)
+        if denominator_tag == self._TAG_VARIABLE:
+            # only save the variable index as numerator if variable
+            denominator = int(nl[1].attrib["idx"])
+            denominator_coefficient = float(nl[1].attrib.get("coef", 1.0))
+            # assert if unhandled attribute is available
+            assert set(nl[1].attrib.keys()) - {"idx", "coef"} == set(), f"unknown attribute in denominator of divide"
+        elif denominator_tag == self._TAG_NUMBER:
+            assert len(nl[1].attrib.keys()) == 1
+            denominator = float(nl[1].attrib["value"])
+        else:
+            denominator = next(parsed)
+
+        if isinstance(denominator, (float,)):
+            # the denominator is a plain number; divide at parse time instead of building a node
+            assert denominator != 0, f"Denominator must be different from zero"
+            if numerator_is_constant:
+                # both sides are numbers: the folded fraction is kept as a variable-free linear term, as
+                # the reformulation pass does for folded constants
+                return OSILLinearTerm.make(None, (numerator_coefficient * numerator) / denominator, level)
+            if numerator_tag == self._TAG_VARIABLE:
+                # variable over a number collapses to a linear term with the number in the coefficient
+                return OSILLinearTerm.make(numerator, numerator_coefficient / denominator, level)
+            # expression over a number: absorb the number as a constant factor of a product
+            return OSILProduct([OSILFactor.make(None, 1.0 / denominator, level + 1), numerator], level)
+
+        return OSILDivide(numerator, denominator, level, numerator_is_constant, numerator_coefficient,
+                          denominator_coefficient)
+
+    def _nl_sqrt(self, nl, level, parsed_children):
+        # return a square root object with the variable tag or a general nl
+        return self._parse_unary_nl(nl, level, parsed_children, OSILSquareroot, "sqrt", False, "n_sqrt")
+
+    def _nl_exp(self, nl, level, parsed_children):
+        # return an exponential function object with the variable tag or a general nl
+        return self._parse_unary_nl(nl, level, parsed_children, OSILExp, "exp", True, "n_exp")
+
+    def _nl_abs(self, nl, level, parsed_children):
+        # return an absolute value object with the variable tag or a general nl
+        return self._parse_unary_nl(nl, level, parsed_children, OSILAbs, "abs", True)
+
+    def _nl_ln(self, nl, level, parsed_children):
+        # return a ln function object with the variable tag or a general nl
+        return self._parse_unary_nl(nl, level, parsed_children, OSILLn, "ln", True, "n_logln")
+
+    def _nl_log10(self, nl, level, parsed_children):
+        # return a log10 function object with the variable tag or a general nl
+        return self._parse_unary_nl(nl, level, parsed_children, OSILLog10, "log10", False, "n_logln")
+
+    def _nl_signpower(self, nl, level, parsed_children):
+        # return a sigpower object, i.e., sign(x) * |x|**c
+        assert len(nl) == 2, f"More/less objects than allowed in power creation: {len(nl)}"
+
+        # check that first nl is variable, second one is constant
+        assert nl[0].tag == self._TAG_VARIABLE, f"no other than variable allowed for base in signpower creation"
+        assert nl[1].tag == self._TAG_NUMBER, f"no other than number allowed for exponent in signpower creation"
+        # extract relevant information for base (nl[0]) and power (nl[1])
+        base = int(nl[0].attrib["idx"])
+        # assert if more attributes are included
+        assert set(nl[0].attrib.keys()) - {"idx"} == set(), "Unknown attribute when handling variable in signpower"
+
+        power = float(nl[1].attrib["value"])
+        # assert if more attributes are included
+        assert len(nl[1].attrib.keys()) == 1, "More attributes than needed in signpower creation"
+        return intern_node(OSILSignPower, base, power, level)
+
+    # one handler per supported kind; looked up once per node instead of walking an elif chain
+    _NL_HANDLERS = {
+        "sum": _nl_sum,
+        "product": _nl_product,
+        "square": _nl_square,
+        "power": _nl_power,
+        "cos": _nl_cos,
+        "sin": _nl_sin,
+        "negate": _nl_negate,
+        "divide": _nl_divide,
+        "sqrt": _nl_sqrt,
+        "exp": _nl_exp,
+        "abs": _nl_abs,
+        "ln": _nl_ln,
+        "log10": _nl_log10,
+        "signpower": _nl_signpower,
+    }
 
     def _strip(self, tag_name):
         """replace the default string"""
-        return tag_name.replace(self.prefix, "")
+        # the tag vocabulary is tiny, so the stripped (and interned) form of every tag is memoized; repeat
+        # calls cost one dict lookup instead of a string replace and a fresh allocation
+        stripped = self._STRIP_CACHE.get(tag_name)
+        if stripped is None:
+            stripped = sys.intern(tag_name.replace(self.prefix, ""))
+            self._STRIP_CACHE[tag_name] = stripped
+        return stripped
+
+    # shared memo for _strip; keys are the raw element tags, values their interned stripped names
+    _STRIP_CACHE = {}
+
+
+# the tree walker dispatches nested nodes on the full Clark-notation tag, saving the strip plus second
+# lookup per node; built here since the class body cannot reference its own attributes in a comprehension
+OSILParser._NL_HANDLERS_BY_TAG = {OSILParser._PREFIX + kind: handler
+                                  for kind, handler in OSILParser._NL_HANDLERS.items()}
@@ -1,33 +1,116 @@
+import numpy as np
+
 variable_types = ["C", "I", "B"]
 
+# constructor/updater argument validation is gated behind this flag, mirroring osil_expressions; the shared
+# tuple avoids rebuilding (int, float, NoneType) on every check
+_DEBUG = __debug__
+_NUMERIC_OR_NONE = (int, float, type(None))
+
+# integer kind tags for cheap leaf tests; plain numbers count as KIND_CONST, variables and variable-carrying
+# terms as KIND_VAR, general non-linear expression nodes as KIND_EXPR (see osil_expressions)
+KIND_CONST = 0
+KIND_VAR = 1
+KIND_EXPR = 2
+
+# global version counter for variable bounds; expression nodes cache their computed bounds against it and
+# recompute only after a bound was updated somewhere
+_bounds_version = 1
+
+
+def bounds_version():
+    """return the current global variable-bounds version"""
+    return _bounds_version
+
+
+def _bump_bounds_version():
+    """invalidate all cached expression bounds after a variable bound update"""
+    global _bounds_version
+    _bounds_version += 1
+
 
 class OSILVariable(object):
+    KIND = KIND_VAR
+    __slots__ = ('name', 'lb', 'ub', 'lb_inf', 'ub_inf', 'variable_type')
+
     def __init__(self, name="", lb=None, ub=None, variable_type="C"):
-        assert isinstance(name, (str,))
+        if _DEBUG:
+            assert isinstance(name, (str,))
+            assert isinstance(lb, _NUMERIC_OR_NONE)
+            assert isinstance(ub, _NUMERIC_OR_NONE)
+            assert variable_type in variable_types or variable_type is None
         self.name = name
-        assert isinstance(lb, (int, float, type(None)))
         self.lb = lb
-        assert isinstance(ub, (int, float, type(None)))
         self.ub = ub
-        assert variable_type in variable_types or variable_type is None
+        # float twins of the bounds with None encoded as +- infinity; bound computations read these to skip
+        # the None branches on every access
+        self.lb_inf = -np.inf if lb is None else lb
+        self.ub_inf = np.inf if ub is None else ub
         self.variable_type = "C" if variable_type is None else variable_type
 
     def update_name(self, name):
-        assert isinstance(name, (str, ))
+        if _DEBUG:
+            assert isinstance(name, (str, ))
         self.name = name
 
     def update_lb(self, lb):
-        assert isinstance(lb, (int, float, type(None)))
+        if _DEBUG:
+            assert isinstance(lb, _NUMERIC_OR_NONE)
         self.lb = lb
+        self.lb_inf = -np.inf if lb is None else lb
+        _bump_bounds_version()
 
     def update_ub(self, ub):
-        assert isinstance(ub, (int, float, type(None)))
+        if _DEBUG:
+            assert isinstance(ub, _NUMERIC_OR_NONE)
         self.ub = ub
+        self.ub_inf = np.inf if ub is None else ub
+        _bump_bounds_version()
 
     def update_variable_type(self, variable_type):
-        assert variable_type in variable_types
+        if _DEBUG:
+            assert variable_type in variable_types
         self.variable_type = variable_type
 
 
+class OSILVariableStore(object):
+    """
+    structure-of-arrays view on a list of OSILVariable objects
+
+    Keeps the variable objects accessible by index like the plain list, but additionally holds the lower and
+    upper bounds in two contiguous numpy arrays (None encoded as +- infinity) for vectorized bound propagation.
+    The arrays are refreshed lazily against the global bounds version, so repeated evaluations between bound
+    updates reuse them without re-reading every variable object.
+    """
+
+    __slots__ = ('variables', 'lb', 'ub', '_version', '_n_variables')
+
+    def __init__(self, variables):
+        assert isinstance(variables, (list,))
+        self.variables = variables
+        self.lb = None
+        self.ub = None
+        self._version = 0
+        self._n_variables = -1
+        self.refresh()
+
+    def __getitem__(self, index):
+        return self.variables[index]
+
+    def __len__(self):
+        return len(self.variables)
+
+    def refresh(self):
+        """rebuild the bound arrays if a variable bound was updated or variables were added/removed"""
+        version = bounds_version()
+        n_variables = len(self.variables)
+        if version == self._version and n_variables == self._n_variables:
+            return
+        self.lb = np.fromiter((var.lb_inf for var in self.variables), dtype=np.float64, count=n_variables)
+        self.ub = np.fromiter((var.ub_inf for var in self.variables), dtype=np.float64, count=n_variables)
+        self._version = version
+        self._n_variables = n_variables
+
+
 
 
@@ -1,7 +1,40 @@
+import functools
 import os
 import json
 import numpy as np
 import pyomo.environ as pyo
+from pyomo.core.expr.numeric_expr import LinearExpression
+
+
+def _cube(x):
+    return x ** 3
+
+
+def _neg_cos(x):
+    return -np.cos(x)
+
+
+def _quartic(x):
+    return 0.25 * x ** 4
+
+
+# base functions and anti-derivatives of the supported settings; the approximation direction only flips
+# the sign, which is resolved once at construction instead of per evaluation
+_BASE_FUNCTIONS = {"sin(x1)": np.sin, "cos(x1)": np.cos, "exp(x1)": np.exp, "x^3": _cube}
+_BASE_ANTIDERIVATIVES = {"-cos(x1)": _neg_cos, "sin(x1)": np.sin, "exp(x1)": np.exp, "1/4x^4": _quartic}
+
+
+@functools.lru_cache(maxsize=32)
+def _load_settings(path, mtime):
+    """load a json settings file; the mtime argument keys the cache so edited files are re-parsed while
+    parameter sweeps over the same files skip the disk read and json parse entirely
+
+    :param path: path to the json file
+    :param mtime: modification time of the file, part of the cache key
+    :return: the parsed settings dictionary (shared across callers, must not be mutated)
+    """
+    with open(path) as settings_file:
+        return json.load(settings_file)
 
 
 class ParaboloidModel(object):
@@ -23,32 +56,21 @@ class ParaboloidModel(object):
         assert isinstance(func_settings_path, (str,)), "function settings path must be string"
         assert os.path.exists(func_settings_path), "function settings path must exist"
         assert func_settings_path.endswith(".json"), "function settings path must be json"
-        function_settings = json.load(open(func_settings_path))
+        function_settings = _load_settings(func_settings_path, os.path.getmtime(func_settings_path))
         assert isinstance(function_settings, (dict,)), "error in parsing function settings json"
 
         # check for the right keys and initialize
         assert set(function_settings.keys()) == {"name", "dim", "func", "Func", "lb", "ub", "L-constant"}
         self.dim = int(function_settings["dim"])
 
-        # (-1) ** ... flips function if approximation direction from above
-        assert function_settings["func"] in ["sin(x1)", "cos(x1)", "exp(x1)", "x^3"], "only sine, cosine, x^3 and exp function implemented to far"
-        if function_settings["func"] == "sin(x1)":
-            self.f = lambda x: (-1) ** (1 + approx_below) * np.sin(x)
-        elif function_settings["func"] == "cos(x1)":
-            self.f = lambda x: (-1) ** (1 + approx_below) * np.cos(x)
-        elif function_settings["func"] == "x^3":
-            self.f = lambda x: (-1) ** (1 + approx_below) * x ** 3
-        else:
-            self.f = lambda x: (-1) ** (1 + approx_below) * np.exp(x)
-        assert function_settings["Func"] in ["-cos(x1)", "sin(x1)", "exp(x1)", "1/4x^4"], ("only -cosine, sine, 1/4 x^3 and exp function as antiderivative implemented so far")
-        if function_settings["Func"] == "-cos(x1)":
-            self.F = lambda x: (-1) ** (1 + approx_below) * -np.cos(x)
-        elif function_settings["Func"] == "sin(x1)":
-            self.F = lambda x: (-1) ** (1 + approx_below) * np.sin(x)
-        elif function_settings["func"] == "x^3":
-            self.F = lambda x: (-1) ** (1 + approx_below) * 0.25 * x ** 4
-        else:
-            self.F = lambda x: (-1) ** (1 + approx_below) * np.exp(x)
+        # an approximation direction from above flips the function; the sign is resolved here once so the
+        # bound ufunc (or a single negating wrapper) is called directly afterwards
+        assert function_settings["func"] in _BASE_FUNCTIONS, "only sine, cosine, x^3 and exp function implemented to far"
+        base_f = _BASE_FUNCTIONS[function_settings["func"]]
+        self.f = base_f if approx_below else (lambda x, base_f=base_f: -base_f(x))
+        assert function_settings["Func"] in _BASE_ANTIDERIVATIVES, ("only -cosine, sine, 1/4 x^3 and exp function as antiderivative implemented so far")
+        base_F = _BASE_ANTIDERIVATIVES[function_settings["Func"]]
+        self.F = base_F if approx_below else (lambda x, base_F=base_F: -base_F(x))
 
         self.lb = float(function_settings["lb"])
 
@@ -62,7 +84,7 @@ class ParaboloidModel(object):
         assert isinstance(model_settings_path, (str,)), "model settings path must be string"
         assert os.path.exists(model_settings_path), "model settings path must exist"
         assert model_settings_path.endswith(".json"), "model settings path must be json"
-        model_parameters = json.load(open(model_settings_path))
+        model_parameters = _load_settings(model_settings_path, os.path.getmtime(model_settings_path))
         assert isinstance(model_parameters, (dict,)), "error in parsing model settings path json"
 
         # check for right keys and initialize
@@ -74,13 +96,31 @@ class ParaboloidModel(object):
         # initialize delta t as the max TODO: adjust for several dimensions
         max_n_delta_t = int(custom_max_n_delta_t)
         self.delta_t = (self.ub - self.lb)/max_n_delta_t
-        self.t_indices = list(range(max_n_delta_t + 1))
+        # ranges are kept lazy; pyomo iterates them directly and slices stay ranges as well
+        self.t_indices = range(max_n_delta_t + 1)
         # initialize the slope for the paraboloids TODO: make a adaptive procedure
         self.C = (self.ub - self.lb) * self.L/self.delta_t
         # initialize delta d as the max TODO: adjust for several dimensions;
         max_n_delta_d = int(custom_max_n_delta_d)
         self.delta_d = (self.ub - self.lb)/max_n_delta_d
-        self.d_indices = list(range(max_n_delta_d + 1))
+        self.d_indices = range(max_n_delta_d + 1)
+        # precompute the discretization grids and every function evaluation on them once; the constraint
+        # rules index these arrays instead of re-evaluating f and F per (paraboloid, grid point) pair
+        self.t_grid = self.lb + np.arange(max_n_delta_t + 1) * self.delta_t
+        self.f_t = self.f(self.t_grid)
+        self.d_grid = self.lb + np.arange(max_n_delta_d + 1) * self.delta_d
+        self.f_d = self.f(self.d_grid)
+        self.F_d = self.F(self.d_grid)
+        # precompute the violation-tracking integral coefficients per interval [d, d_next]; integrating the
+        # parabola analytically gives (d_next^3 - d^3)/3 on quad, (d_next^2 - d^2)/2 on lin and (d_next - d)
+        # on cons, while the function side F(d) - F(d_next) + gamma * eps * (d_next - d) is a pure constant
+        interval_lb = self.d_grid[:-1]
+        interval_ub = self.d_grid[1:]
+        self.viol_coef_quad = (interval_ub ** 3 - interval_lb ** 3) / 3
+        self.viol_coef_lin = (interval_ub ** 2 - interval_lb ** 2) / 2
+        self.viol_coef_cons = interval_ub - interval_lb
+        self.viol_constant = (self.F_d[:-1] - self.F_d[1:]
+                              + self.gamma * self.eps * (interval_ub - interval_lb))
         # set values for the big Ms;
         self.M1 = 100
         self.M2 = self.M1
@@ -91,13 +131,22 @@ class ParaboloidModel(object):
         # check that number of paraboloids is integer and store
         assert isinstance(number_paras, (int,)), "number of paraboloids must be integer"
         self.n_paras = number_paras
-        self.para_indices = list(range(self.n_paras))
+        self.para_indices = range(self.n_paras)
+
+        # caches of the parabola and parabola-derivative expressions keyed by (para_index, point); both
+        # constraint families over the t grid reuse the same sub-expressions instead of rebuilding them
+        self._parabola_cache = {}
+        self._derivative_cache = {}
 
     def setup_model(self, print_model=True, initial_variable_values=None):
         """creating the model based on the preprint"""
         # initialize the model
         m = pyo.ConcreteModel()
 
+        # the expression caches hold variables of a specific model; reset them for the new one
+        self._parabola_cache = {}
+        self._derivative_cache = {}
+
         # initialize the variables
         m = self._initialize_variables(m, initial_variable_values)
 
@@ -122,12 +171,149 @@ class ParaboloidModel(object):
 
         return quadratic_coefficients, linear_coefficients, constant_coefficients
 
+    def extend_paraboloids(self, model, extra):
+        """
+            grow an already constructed model by additional paraboloids in place; only the variables and
+            constraint rows of the new indices are built, while the containment sums and the objective,
+            which range over all paraboloids, are rebuilt in place; a persistent solver interface can then
+            push just the added components instead of re-extracting the whole model
+
+        :param model: a model previously built by setup_model of this object
+        :param extra: number of paraboloids to add (integer)
+        :return: the extended model
+        """
+        assert isinstance(extra, (int,)), "number of additional paraboloids must be integer"
+        assert extra > 0, "number of additional paraboloids must be positive"
+        new_indices = range(self.n_paras, self.n_paras + extra)
+        self.n_paras += extra
+        self.para_indices = range(self.n_paras)
+
+        for para_index in new_indices:
+            model.para_set.add(para_index)
+            # the indexed variables over para_set create their new members implicitly on first access, so
+            # only the constraint rows of the new paraboloid have to be added explicitly
+            for t_index in self.t_indices:
+                model.approx_bound[para_index, t_index] = self._lower_parabola_bound(model, para_index, t_index)
+            for d_index in self.d_indices:
+                model.upper_bound[para_index, d_index] = self._upper_parabola_bound(model, para_index, d_index)
+            for d_index in self.d_indices[:-1]:
+                model.violation_tracking[para_index, d_index] = self._violation_tracking(model, para_index, d_index)
+            # the slope bound lists only exist if _containment_slope_bounds was called on the model
+            if hasattr(model, "upper_slope_bounds"):
+                self._add_slope_bounds_for_para(model, para_index)
+
+        # rebuild the cross-paraboloid components once for the grown index set
+        for t_index in self.t_indices:
+            model.containment[t_index].set_value(self._containment_sum(model, t_index))
+        model.obj.set_value(self._minimize_violation(model))
+
+        return model
+
+    def build_matrix_model(self):
+        """
+            assemble the model directly in matrix form, bypassing the pyomo expression layer; the model is
+            linear in all variables and every coefficient is a precomputed scalar, so the constraint matrix
+            can be filled as coo triplets with vectorized numpy operations and handed to a direct solver
+            interface (e.g. gurobipy addMConstr or highspy) in one call
+
+            the flat column layout is quad[l], lin[l], cons[l], contain[l, t], viol[l, d]; the rows are the
+            (5b) approximation bounds, (5c) containment sums, (5e) upper bounds, (5f) violation tracking and
+            the symmetry breaking constraint, in this order
+
+        :return: dictionary with the coo triplets ("row", "col", "val"), the right-hand side ("rhs"), the
+                 row senses ("sense", one of ">", "<", "=" per row), the variable bounds ("lb", "ub"), a
+                 binary marker ("binary") and the objective coefficients ("obj")
+        """
+        n_paras = self.n_paras
+        n_t = len(self.t_indices)
+        n_d = len(self.d_indices)
+
+        # flat column offsets of the variable blocks
+        col_quad = np.arange(n_paras)
+        col_lin = col_quad + n_paras
+        col_cons = col_lin + n_paras
+        offset_contain = 3 * n_paras
+        offset_viol = offset_contain + n_paras * n_t
+        n_cols = offset_viol + n_paras * n_d
+
+        # (5b): parabola - M1 * contain >= f(t) - 0.9 * eps - M1, one row per (paraboloid, t)
+        approx_rows = np.arange(n_paras * n_t)
+        approx_row = np.repeat(approx_rows, 4)
+        approx_col = np.column_stack([np.repeat(col_quad, n_t), np.repeat(col_lin, n_t),
+                                      np.repeat(col_cons, n_t),
+                                      offset_contain + approx_rows]).ravel()
+        approx_val = np.column_stack([np.tile(self.t_grid ** 2, n_paras), np.tile(self.t_grid, n_paras),
+                                      np.ones(n_paras * n_t),
+                                      np.full(n_paras * n_t, -float(self.M1))]).ravel()
+        approx_rhs = np.tile(self.f_t - 0.9 * self.eps - self.M1, n_paras)
+
+        # (5c): sum_l contain[l, t] >= 1, one row per t
+        containment_row = np.repeat(np.arange(n_t), n_paras)
+        containment_col = (offset_contain + np.arange(n_t)[:, None] + (np.arange(n_paras) * n_t)).ravel()
+        containment_val = np.ones(n_paras * n_t)
+        containment_rhs = np.ones(n_t)
+
+        # (5e): parabola <= f(d) - 0.25 * eps, one row per (paraboloid, d)
+        upper_rows = np.arange(n_paras * n_d)
+        upper_row = np.repeat(upper_rows, 3)
+        upper_col = np.column_stack([np.repeat(col_quad, n_d), np.repeat(col_lin, n_d),
+                                     np.repeat(col_cons, n_d)]).ravel()
+        upper_val = np.column_stack([np.tile(self.d_grid ** 2, n_paras), np.tile(self.d_grid, n_paras),
+                                     np.ones(n_paras * n_d)]).ravel()
+        upper_rhs = np.tile(self.f_d - 0.25 * self.eps, n_paras)
+
+        # (5f): viol - integral coefficients >= integral constant, one row per (paraboloid, interval)
+        viol_rows = np.arange(n_paras * (n_d - 1))
+        viol_row = np.repeat(viol_rows, 4)
+        viol_cols_flat = (offset_viol + (np.arange(n_paras) * n_d)[:, None] + np.arange(n_d - 1)).ravel()
+        viol_col = np.column_stack([np.repeat(col_quad, n_d - 1), np.repeat(col_lin, n_d - 1),
+                                    np.repeat(col_cons, n_d - 1), viol_cols_flat]).ravel()
+        viol_val = np.column_stack([np.tile(-self.viol_coef_quad, n_paras),
+                                    np.tile(-self.viol_coef_lin, n_paras),
+                                    np.tile(-self.viol_coef_cons, n_paras),
+                                    np.ones(n_paras * (n_d - 1))]).ravel()
+        viol_rhs = np.tile(self.viol_constant, n_paras)
+
+        # symmetry breaking: contain[0, 0] == 1
+        n_rows = n_paras * n_t + n_t + n_paras * n_d + n_paras * (n_d - 1) + 1
+
+        # stack the blocks with their row offsets; senses are per block plus the final equality
+        row_offsets = np.cumsum([0, n_paras * n_t, n_t, n_paras * n_d])
+        row = np.concatenate([approx_row + row_offsets[0], containment_row + row_offsets[1],
+                              upper_row + row_offsets[2], viol_row + row_offsets[3],
+                              [n_rows - 1]])
+        col = np.concatenate([approx_col, containment_col, upper_col, viol_col, [offset_contain]])
+        val = np.concatenate([approx_val, containment_val, upper_val, viol_val, [1.0]])
+        rhs = np.concatenate([approx_rhs, containment_rhs, upper_rhs, viol_rhs, [1.0]])
+        sense = np.concatenate([np.full(n_paras * n_t + n_t, ">"), np.full(n_paras * n_d, "<"),
+                                np.full(n_paras * (n_d - 1), ">"), ["="]])
+
+        # variable bounds and types; contain is binary, viol is non-negative
+        lb = np.full(n_cols, float(self.default_bounds[0]))
+        ub = np.full(n_cols, float(self.default_bounds[1]))
+        lb[offset_contain:offset_viol] = 0.0
+        ub[offset_contain:offset_viol] = 1.0
+        lb[offset_viol:] = 0.0
+        ub[offset_viol:] = np.inf
+        binary = np.zeros(n_cols, dtype=bool)
+        binary[offset_contain:offset_viol] = True
+
+        # objective: minimize the sum of the violation variables over the used intervals
+        obj = np.zeros(n_cols)
+        obj[viol_cols_flat] = 1.0
+
+        return {"row": row, "col": col, "val": val, "rhs": rhs, "sense": sense,
+                "lb": lb, "ub": ub, "binary": binary, "obj": obj}
+
     def _initialize_variables(self, model, initial_values):
         """ initializing the variables of the model """
+        # the paraboloid indices live in a mutable ordered set so that extend_paraboloids can grow an
+        # already constructed model in place instead of rebuilding it from scratch
+        model.para_set = pyo.Set(initialize=self.para_indices, dimen=1, ordered=True)
         # initialize variables for the coefficients of the parabolas
-        model.quad = pyo.Var(self.para_indices, bounds=self.default_bounds)
-        model.lin = pyo.Var(self.para_indices, bounds=self.default_bounds)
-        model.cons = pyo.Var(self.para_indices, bounds=self.default_bounds)
+        model.quad = pyo.Var(model.para_set, bounds=self.default_bounds)
+        model.lin = pyo.Var(model.para_set, bounds=self.default_bounds)
+        model.cons = pyo.Var(model.para_set, bounds=self.default_bounds)
         # if available, initialize as much variable as possible
         if initial_values is not None:
             assert len(initial_values) == 3, f"initial variable values should contain quads, lins and cons"
@@ -139,38 +325,70 @@ class ParaboloidModel(object):
                 model.cons[i] = cons[i][0]
 
         # initialize variables to track containment of the error bounds, i.e. s^l_t
-        model.contain = pyo.Var(self.para_indices, self.t_indices, within=pyo.Binary)
+        model.contain = pyo.Var(model.para_set, self.t_indices, within=pyo.Binary)
         # initialize variables to track the violation in terms of the integral between consecutive points
-        model.viol = pyo.Var(self.para_indices, self.d_indices, within=pyo.NonNegativeReals)
+        model.viol = pyo.Var(model.para_set, self.d_indices, within=pyo.NonNegativeReals)
 
         return model
 
     def _initialize_constraints(self, model):
         """ initializing the constraints of the model """
         # (5b): model lower bound of parabolas as big M formulation; p^l(t) >= f(t) - del - M1 * (1-s^l_t)
-        model.approx_bound = pyo.Constraint(self.para_indices, self.t_indices, rule=self._lower_parabola_bound)
+        model.approx_bound = pyo.Constraint(model.para_set, self.t_indices, rule=self._lower_parabola_bound)
         # (5c): enforcing one of the containment binaries to be 1; sum_l s^l_t >= 1
         model.containment = pyo.Constraint(self.t_indices, rule=self._containment_sum)
 
         # (5e): model upper bound of parabolas; p^l(t) <= f(d) - gamma * eps
-        model.upper_bound = pyo.Constraint(self.para_indices, self.d_indices, rule=self._upper_parabola_bound)
+        model.upper_bound = pyo.Constraint(model.para_set, self.d_indices, rule=self._upper_parabola_bound)
         # (5f): track violation of integral between parabola and function; v^l_d >= integral p - (f - gamma eps)
-        model.violation_tracking = pyo.Constraint(self.para_indices, self.d_indices[:-1],
+        model.violation_tracking = pyo.Constraint(model.para_set, self.d_indices[:-1],
                                                   rule=self._violation_tracking)
 
         return model
 
+    def _parabola_expression(self, model, para_index, point):
+        """
+            build the parabola p(point) = quad * point^2 + lin * point + cons as one flat linear
+            expression in the three coefficient variables; bypasses the operator-overloading path that
+            creates and merges intermediate monomial/sum expressions per term; the expression is cached
+            per (para_index, point) and shared between all constraints evaluating the same parabola there
+        """
+        key = (para_index, float(point))
+        expression = self._parabola_cache.get(key)
+        if expression is None:
+            expression = LinearExpression(constant=0.0,
+                                          linear_coefs=[point * point, point, 1.0],
+                                          linear_vars=[model.quad[para_index], model.lin[para_index],
+                                                       model.cons[para_index]])
+            self._parabola_cache[key] = expression
+        return expression
+
+    def _derivative_expression(self, model, para_index, point):
+        """
+            build the parabola derivative d/dx p(point) = 2 * quad * point + lin as one flat linear
+            expression, cached per (para_index, point) like _parabola_expression; the upper and lower
+            slope bound of every neighbour pair share the same expression object
+        """
+        key = (para_index, float(point))
+        expression = self._derivative_cache.get(key)
+        if expression is None:
+            expression = LinearExpression(constant=0.0,
+                                          linear_coefs=[2.0 * point, 1.0],
+                                          linear_vars=[model.quad[para_index], model.lin[para_index]])
+            self._derivative_cache[key] = expression
+        return expression
+
     def _lower_parabola_bound(self, model, para_index, t_index):
         """
             modeling the lower bound of each parabola as the function to approximate, eps, and a big m formulation;
             constraint (5b)
         """
-        # initialize the discretization point t; TODO: adjust to multi-dimensional
-        t = self.lb + t_index * self.delta_t
+        # look up the precomputed discretization point t; TODO: adjust to multi-dimensional
+        t = self.t_grid[t_index]
         # initialize the parabola w.r.t. t
-        parabola = model.quad[para_index] * t ** 2 + model.lin[para_index] * t + model.cons[para_index]
-        # evaluate the function to approximate at t and compute the big M formula
-        func_eval = self.f(t)
+        parabola = self._parabola_expression(model, para_index, t)
+        # look up the function to approximate at t and compute the big M formula
+        func_eval = self.f_t[t_index]
         big_m_formula = self.M1 * (1 - model.contain[para_index, t_index])
 
         # return constraint as modelled in (5b) of draft + custom epsilon
@@ -178,7 +396,8 @@ class ParaboloidModel(object):
 
     def _containment_sum(self, model, t_index):
         """ second part of big M formulation such that one containment variable has to be nonzero; constraint (5c) """
-        return sum(model.contain[para_index, t_index] for para_index in self.para_indices) >= 1
+        # quicksum builds one flat linear expression instead of a chain of binary sums
+        return pyo.quicksum(model.contain[para_index, t_index] for para_index in model.para_set) >= 1
 
     def _containment_slope_bounds(self, model):
         """
@@ -190,40 +409,44 @@ class ParaboloidModel(object):
         model.upper_slope_bounds = pyo.ConstraintList()
         model.lower_slope_bounds = pyo.ConstraintList()
         # TODO: make multi-dimensional
-        for para_index in self.para_indices:
-            for t_index in self.t_indices:
-                # compute all possible neighbouring t' to t
-                neighbors = []
-                t = self.lb + t_index * self.delta_t
-                # TODO make multi-dimensional
-                t_prime1 = t - self.delta_t
-                if t_prime1 >= self.lb:
-                    neighbors.append(t_prime1)
-                t_prime2 = t + self.delta_t
-                if t_prime2 <= self.ub:
-                    neighbors.append(t_prime2)
-
-                # add constraints for each t', rhs = 2L + M2 * (1-s^l_t) is computed a-priori
-                rhs = 2 * self.L + self.M2 * (1 - model.contain[para_index, t_index])
-                for t_prime in neighbors:
-                    # compute the derivative of p^l at t' = 2 * quad * t' + 2 * lin
-                    p_derivative = 2 * model.quad[para_index] * t_prime + model.lin[para_index]
-                    # add upper and lower bound constraints as in description
-                    model.upper_slope_bounds.add(expr=p_derivative <= rhs)
-                    model.lower_slope_bounds.add(expr=p_derivative >= -rhs)
+        for para_index in model.para_set:
+            self._add_slope_bounds_for_para(model, para_index)
 
         return model
 
+    def _add_slope_bounds_for_para(self, model, para_index):
+        """ append the (5d) slope bound rows of a single paraboloid to the model's constraint lists """
+        for t_index in self.t_indices:
+            # compute all possible neighbouring t' to t
+            neighbors = []
+            t = self.t_grid[t_index]
+            # TODO make multi-dimensional
+            t_prime1 = t - self.delta_t
+            if t_prime1 >= self.lb:
+                neighbors.append(t_prime1)
+            t_prime2 = t + self.delta_t
+            if t_prime2 <= self.ub:
+                neighbors.append(t_prime2)
+
+            # add constraints for each t', rhs = 2L + M2 * (1-s^l_t) is computed a-priori
+            rhs = 2 * self.L + self.M2 * (1 - model.contain[para_index, t_index])
+            for t_prime in neighbors:
+                # look up the derivative of p^l at t' = 2 * quad * t' + lin
+                p_derivative = self._derivative_expression(model, para_index, t_prime)
+                # add upper and lower bound constraints as in description
+                model.upper_slope_bounds.add(expr=p_derivative <= rhs)
+                model.lower_slope_bounds.add(expr=p_derivative >= -rhs)
+
     def _upper_parabola_bound(self, model, para_index, d_index):
         """
             method to model the function to approximate itself as an upper bound to the approximation; constraint (5e)
         """
-        # initialize the discretization point d; TODO: adjust to multi-dimensional
-        d = self.lb + d_index * self.delta_d
+        # look up the precomputed discretization point d; TODO: adjust to multi-dimensional
+        d = self.d_grid[d_index]
         # initialize the parabola w.r.t. d
-        parabola = model.quad[para_index] * d ** 2 + model.lin[para_index] * d + model.cons[para_index]
-        # evaluate the function to approximate at d
-        func_eval = self.f(d)
+        parabola = self._parabola_expression(model, para_index, d)
+        # look up the function to approximate at d
+        func_eval = self.f_d[d_index]
 
         # return constraint as modelled in (5e) of draft manipulated by a fixed eps
         return parabola <= func_eval - 0.25 * self.eps #self.gamma * self.eps
@@ -233,23 +456,16 @@ class ParaboloidModel(object):
             violation variables shall track a positivity of the integral between parabola and function on an interval;
             constraint (5f)
         """
-        # initialize lower and upper bound of the integral; TODO: make multi-dimensional
-        d = self.lb + d_index * self.delta_d
-        d_next = d + self.delta_d
-        assert d_next <= self.ub + 1e9, f"right boundary of integral cannot exceed upper bound"
-
-        # compute the anti-derivative of the parabola at d and at d_next
-        cubic_d = (1 / 3 * d ** 3 * model.quad[para_index]
-                   + 1 / 2 * d ** 2 * model.lin[para_index]
-                   + d * model.cons[para_index])
-        cubic_d_next = (1 / 3 * d_next ** 3 * model.quad[para_index]
-                        + 1 / 2 * d_next ** 2 * model.lin[para_index] +
-                        d_next * model.cons[para_index])
-
-        # compute the integral with the anti-derivative of the function F by first computing boundaries
-        integral_upper_boundary = cubic_d_next - (self.F(d_next) - self.gamma * self.eps * d_next)
-        integral_lower_boundary = cubic_d - (self.F(d) - self.gamma * self.eps * d)
-        integral = integral_upper_boundary - integral_lower_boundary
+        assert self.d_grid[d_index + 1] <= self.ub + 1e9, f"right boundary of integral cannot exceed upper bound"
+
+        # the integral of the parabola minus the shifted function over [d, d_next] collapses to one flat
+        # linear expression in the coefficient variables; all scalars are precomputed in the constructor
+        integral = LinearExpression(constant=float(self.viol_constant[d_index]),
+                                    linear_coefs=[self.viol_coef_quad[d_index],
+                                                  self.viol_coef_lin[d_index],
+                                                  self.viol_coef_cons[d_index]],
+                                    linear_vars=[model.quad[para_index], model.lin[para_index],
+                                                 model.cons[para_index]])
 
         # return the violation tracking as variable >= integral
         return model.viol[para_index, d_index] >= integral
@@ -257,37 +473,37 @@ class ParaboloidModel(object):
     def _minimize_violation(self, model):
         """ objective minimizes the sum of all violation variables """
         # TODO: make multi-dimensional
-        return sum(model.viol[para_index, d_index] for para_index in self.para_indices
-                   for d_index in self.d_indices[:-1])
+        # quicksum builds one flat linear expression instead of a chain of binary sums
+        return pyo.quicksum(model.viol[para_index, d_index] for para_index in model.para_set
+                            for d_index in self.d_indices[:-1])
 
     def _extract_values_per_variable(self, index1, variables, index2=None, print_values=False, print_null=False):
         """
             extract lists of variable values given the variables and possible index lists 1 and 2
         """
         # assert the expected types
-        assert isinstance(index1, (list,)), f"index1 must be a list to extract values from it"
+        assert isinstance(index1, (list, range)), f"index1 must be list or range to extract values from it"
         # maximal number of letters per line for printing
         n_max_chars = 50
         # maximal number of digits to round to
         n_digits = 5
-        # initial list of values
-        values = []
-        # depending on the availability of one or two index sets, extract the value and print if desired
+        # pull all values in one traversal instead of one indexed-component lookup per entry
+        extracted = variables.extract_values()
         if index2 is None:
-            for element in index1:
-                variable = variables[element]
-                value = None if variable.value is None else np.round(variable.value, n_digits)
-                values.append([value])
-                if print_values:
-                    self._print_value(variable, value, n_max_chars, print_null)
+            keys = list(index1)
         else:
-            for ind1 in index1:
-                for ind2 in index2:
-                    variable = variables[ind1, ind2]
-                    value = None if variable.value is None else np.round(variable.value, n_digits)
-                    values.append(value)
-                    if print_values:
-                        self._print_value(variable, value, n_max_chars, print_null)
+            keys = [(ind1, ind2) for ind1 in index1 for ind2 in index2]
+        raw_values = [extracted.get(key) for key in keys]
+        # round everything in one vectorized shot; None values ride along as nan and are restored after
+        rounded = np.round(np.array([np.nan if value is None else value for value in raw_values],
+                                    dtype=np.float64), n_digits)
+        values = [None if raw is None else value for raw, value in zip(raw_values, rounded)]
+        if print_values:
+            for key, value in zip(keys, values):
+                self._print_value(variables[key], value, n_max_chars, print_null)
+        # the single-index form historically wraps each value in its own list
+        if index2 is None:
+            return [[value] for value in values]
         return values
 
     @staticmethod